@@ -120,6 +120,11 @@ def get_arguments() -> argparse.Namespace:
         help="Skip pip install of specific packages on startup",
     )
 
+    parser.add_argument(
+        "--lazy-platforms",
+        action="store_true",
+        help="Only import the platforms of an integration when they are used",
+    )
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Enable verbose logging to file."
     )
@@ -201,6 +206,7 @@ def main() -> int:
         debug=args.debug,
         open_ui=args.open_ui,
         safe_mode=safe_mode,
+        lazy_platforms=args.lazy_platforms,
     )
 
     fault_file_name = os.path.join(config_dir, FAULT_LOG_FILENAME)
@@ -64,6 +64,7 @@ from .components import (
 from .components.sensor import recorder as sensor_recorder  # noqa: F401
 from .const import (
     BASE_PLATFORMS,
+    EVENT_COMPONENT_LOADED,
     FORMAT_DATETIME,
     KEY_DATA_LOGGING as DATA_LOGGING,
     REQUIRED_NEXT_PYTHON_HA_RELEASE,
@@ -87,7 +88,7 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
-from .helpers.storage import get_internal_store_manager
+from .helpers.storage import Store, get_internal_store_manager
 from .helpers.system_info import async_get_system_info, is_official_image
 from .helpers.typing import ConfigType
 from .setup import (
@@ -105,6 +106,8 @@ from .util.async_ import create_eager_task
 from .util.hass_dict import HassKey
 from .util.logging import async_activate_log_queue_handler
 from .util.package import async_get_user_site, is_docker_env, is_virtual_env
+from .util.yaml import loader as yaml_loader
+from .util.yaml.cache import ParseCache
 
 with contextlib.suppress(ImportError):
     # Ensure anyio backend is imported to avoid it being imported in the event loop
@@ -132,6 +135,9 @@ STAGE_2_TIMEOUT = 300
 WRAP_UP_TIMEOUT = 300
 COOLDOWN_TIME = 60
 
+STORAGE_BOOTSTRAP_PROFILE_KEY = "core.bootstrap_profile"
+STORAGE_BOOTSTRAP_PROFILE_VERSION = 1
+YAML_PARSE_CACHE_PATH = (".storage", "core.yaml_cache")
 
 DEBUGGER_INTEGRATIONS = {"debugpy"}
 
@@ -238,6 +244,7 @@ SETUP_ORDER = (
 # If they do not exist they will not be loaded
 #
 PRELOAD_STORAGE = [
+    "core.bootstrap_profile",
     "core.logger",
     "core.network",
     "http.auth",
@@ -263,6 +270,12 @@ async def async_setup_hass(
         """Create the hass object and do basic setup."""
         hass = core.HomeAssistant(runtime_config.config_dir)
         loader.async_setup(hass)
+        loader.async_enable_manifest_index(hass)
+        yaml_loader.set_parse_cache(
+            ParseCache(hass.config.path(*YAML_PARSE_CACHE_PATH))
+        )
+        if runtime_config.lazy_platforms:
+            loader.async_enable_lazy_platforms(hass)
 
         await async_enable_logging(
             hass,
@@ -769,6 +782,162 @@ class _WatchPendingSetups:
             self._handle = None
 
 
+class _ImportPlan:
+    """Pre-import integrations along the critical path of the startup graph.
+
+    Import and setup durations are persisted at the end of each startup and
+    used on the next one to import the integrations that gate the longest
+    chain of dependents first, while earlier stages are still setting up.
+    """
+
+    def __init__(self, hass: core.HomeAssistant) -> None:
+        """Initialize the import plan."""
+        self._hass = hass
+        self._store: Store[dict[str, dict[str, float]]] = Store(
+            hass, STORAGE_BOOTSTRAP_PROFILE_VERSION, STORAGE_BOOTSTRAP_PROFILE_KEY
+        )
+        self._profile: dict[str, dict[str, float]] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._unsub_loaded: core.CALLBACK_TYPE | None = None
+        self._start = monotonic()
+        self._import_started: dict[str, float] = {}
+        self._import_times: dict[str, float] = {}
+        self._loaded: dict[str, float] = {}
+
+    async def async_load(self) -> None:
+        """Load the profile of the previous startup."""
+        if profile := await self._store.async_load():
+            self._profile = profile
+
+    def _priorities(
+        self,
+        domains_to_setup: set[str],
+        integration_cache: dict[str, loader.Integration],
+    ) -> dict[str, float]:
+        """Return the critical path length starting at each domain."""
+        import_times = self._profile.get("import", {})
+        setup_times = self._profile.get("setup", {})
+        dependents: defaultdict[str, set[str]] = defaultdict(set)
+        for domain in domains_to_setup:
+            if (integration := integration_cache.get(domain)) is None:
+                continue
+            for dep in integration.dependencies:
+                dependents[dep].add(domain)
+
+        priorities: dict[str, float] = {}
+
+        def _priority(domain: str) -> float:
+            if (priority := priorities.get(domain)) is not None:
+                return priority
+            # Guard against dependency cycles
+            priorities[domain] = 0
+            priority = import_times.get(domain, 0) + setup_times.get(domain, 0)
+            if downstream := dependents.get(domain):
+                priority += max(_priority(dependent) for dependent in downstream)
+            priorities[domain] = priority
+            return priority
+
+        for domain in domains_to_setup:
+            _priority(domain)
+        return priorities
+
+    @core.callback
+    def async_start(
+        self,
+        domains_to_setup: set[str],
+        integration_cache: dict[str, loader.Integration],
+    ) -> None:
+        """Start pre-importing integrations in critical path order."""
+        self._unsub_loaded = self._hass.bus.async_listen(
+            EVENT_COMPONENT_LOADED, self._async_component_loaded
+        )
+        if not self._profile:
+            # Without timings every priority is equal, pre-importing would
+            # only compete with the setup of the first stages.
+            return
+        priorities = self._priorities(domains_to_setup, integration_cache)
+        ordered = [
+            integration
+            for domain in sorted(
+                priorities, key=lambda domain: (-priorities[domain], domain)
+            )
+            if (integration := integration_cache.get(domain)) is not None
+            and integration.import_executor
+            and integration.pkg_path not in sys.modules
+        ]
+        if ordered:
+            self._task = self._hass.async_create_background_task(
+                self._async_import(ordered), "bootstrap import plan", eager_start=False
+            )
+
+    @core.callback
+    def _async_component_loaded(self, event: core.Event) -> None:
+        """Record when an integration finished setting up."""
+        if "." not in (domain := event.data["component"]):
+            self._loaded.setdefault(domain, monotonic() - self._start)
+
+    async def _async_import(self, integrations: list[loader.Integration]) -> None:
+        """Import integrations one by one once their requirements are installed."""
+        hass = self._hass
+        for integration in integrations:
+            domain = integration.domain
+            if integration.pkg_path in sys.modules:
+                continue
+            try:
+                # Never import before the requirements of the integration
+                # and its dependencies are processed.
+                await requirements.async_get_integration_with_requirements(hass, domain)
+                if integration.pkg_path in sys.modules:
+                    continue
+                start = monotonic()
+                self._import_started[domain] = start - self._start
+                await integration.async_get_component()
+            except Exception:  # noqa: BLE001
+                # Setup will import again and report the error
+                _LOGGER.debug("Pre-import of %s failed", domain, exc_info=True)
+                continue
+            self._import_times[domain] = monotonic() - start
+
+    @core.callback
+    def async_stop(self) -> None:
+        """Stop pre-importing, log the startup timeline and save the profile."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
+        if self._unsub_loaded:
+            self._unsub_loaded()
+            self._unsub_loaded = None
+
+        setup_times = async_get_setup_timings(self._hass)
+        if _LOGGER.isEnabledFor(logging.INFO) and self._loaded:
+            _LOGGER.info(
+                "Startup timeline (seconds since start):\n%s",
+                "\n".join(
+                    f"  {domain}: import started "
+                    f"{self._format(self._import_started.get(domain))} took "
+                    f"{self._format(self._import_times.get(domain))}, setup "
+                    f"took {self._format(setup_times.get(domain))} done "
+                    f"{self._format(loaded)}"
+                    for domain, loaded in sorted(
+                        self._loaded.items(), key=itemgetter(1)
+                    )
+                ),
+            )
+
+        profile = {
+            "import": {**self._profile.get("import", {}), **self._import_times},
+            "setup": {**self._profile.get("setup", {}), **setup_times},
+        }
+        self._hass.async_create_background_task(
+            self._store.async_save(profile), "save bootstrap profile"
+        )
+
+    @staticmethod
+    def _format(value: float | None) -> str:
+        """Format a timeline value."""
+        return "-" if value is None else f"{value:.3f}"
+
+
 async def async_setup_multi_components(
     hass: core.HomeAssistant,
     domains: set[str],
@@ -972,10 +1141,15 @@ async def _async_set_up_integrations(
     watcher = _WatchPendingSetups(hass, _setup_started(hass))
     watcher.async_start()
 
+    import_plan = _ImportPlan(hass)
+
     domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
         hass, config
     )
 
+    await import_plan.async_load()
+    import_plan.async_start(domains_to_setup, integration_cache)
+
     # Initialize recorder
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
@@ -1067,6 +1241,8 @@ async def _async_set_up_integrations(
         )
 
     watcher.async_stop()
+    import_plan.async_stop()
+    loader.async_save_manifest_index(hass)
 
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
@@ -4,11 +4,17 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime as dt
+from math import isfinite
+from typing import Any
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant
 
+# The first, min, max and last state are kept for each bucket
+POINTS_PER_BUCKET = 4
+
 
 def entities_may_have_state_changes_after(
     hass: HomeAssistant, entity_ids: Iterable, start_time: dt, no_attributes: bool
@@ -31,3 +37,60 @@ def has_recorder_run_after(hass: HomeAssistant, run_time: dt) -> bool:
     return run_time >= process_timestamp(
         get_instance(hass).recorder_runs_manager.first.start
     )
+
+
+def _flush_bucket(
+    bucket: list[tuple[float, dict[str, Any]]], result: list[dict[str, Any]]
+) -> None:
+    """Append the first, min, max and last state of a bucket in time order."""
+    if len(bucket) <= POINTS_PER_BUCKET:
+        result.extend(state for _, state in bucket)
+    else:
+        min_idx = min(range(len(bucket)), key=lambda idx: bucket[idx][0])
+        max_idx = max(range(len(bucket)), key=lambda idx: bucket[idx][0])
+        result.extend(
+            bucket[idx][1] for idx in sorted({0, min_idx, max_idx, len(bucket) - 1})
+        )
+    bucket.clear()
+
+
+def downsample_compressed_states(
+    states: list[dict[str, Any]], max_points: int
+) -> list[dict[str, Any]]:
+    """Reduce a list of compressed states to about max_points states.
+
+    The time range is split in buckets and only the first, min, max and
+    last numeric state of each bucket are kept so spikes remain visible.
+    States that are not numeric (unavailable, unknown, ...) are always
+    kept since they mark gaps in the graph, and they close the bucket
+    they fall in so the gap stays at the right place.
+    """
+    if len(states) <= max_points:
+        return states
+    buckets = max(1, max_points // POINTS_PER_BUCKET)
+    first_ts: float = states[0][COMPRESSED_STATE_LAST_UPDATED]
+    bucket_width = (states[-1][COMPRESSED_STATE_LAST_UPDATED] - first_ts) / buckets
+    if not bucket_width:
+        return states
+    result: list[dict[str, Any]] = []
+    bucket: list[tuple[float, dict[str, Any]]] = []
+    current_bucket_idx = 0
+    for state in states:
+        try:
+            value = float(state[COMPRESSED_STATE_STATE])
+        except (TypeError, ValueError):
+            value = float("nan")
+        if not isfinite(value):
+            _flush_bucket(bucket, result)
+            result.append(state)
+            continue
+        bucket_idx = min(
+            int((state[COMPRESSED_STATE_LAST_UPDATED] - first_ts) / bucket_width),
+            buckets - 1,
+        )
+        if bucket_idx != current_bucket_idx:
+            _flush_bucket(bucket, result)
+            current_bucket_idx = bucket_idx
+        bucket.append((value, state))
+    _flush_bucket(bucket, result)
+    return result
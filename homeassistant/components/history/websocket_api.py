@@ -39,7 +39,11 @@ from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
 from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
-from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
+from .helpers import (
+    downsample_compressed_states,
+    entities_may_have_state_changes_after,
+    has_recorder_run_after,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -72,25 +76,32 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None = None,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
-    return json_bytes(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
-        )
+    states = history.get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
     )
+    if max_points:
+        states = {
+            entity_id: cast(
+                list[State | dict[str, Any]],
+                downsample_compressed_states(
+                    cast(list[dict[str, Any]], state_list), max_points
+                ),
+            )
+            for entity_id, state_list in states.items()
+        }
+    return json_bytes(messages.result_message(msg_id, states))
 
 
 @websocket_api.websocket_command(
@@ -103,6 +114,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
@@ -167,6 +179,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg.get("max_points"),
         )
     )
 
@@ -276,25 +289,51 @@ async def _async_send_historical_states(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    chunk_size: int | None = None,
 ) -> dt | None:
-    """Fetch history significant_states and send them to the client."""
+    """Fetch history significant_states and send them to the client.
+
+    When chunk_size is set the entities are fetched and sent in groups of
+    chunk_size so only one group is held in memory at a time and the
+    client can start rendering before the whole range has been loaded.
+    """
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
-        hass,
-        msg_id,
-        start_time,
-        end_time,
-        entity_ids,
-        include_start_time_state,
-        significant_changes_only,
-        minimal_response,
-        no_attributes,
-        send_empty,
-    )
-    if payload:
-        connection.send_message(payload)
-    return last_time_dt if last_time_ts != 0 else None
+    # Without entity_ids the history of all entities is fetched at once
+    chunks: list[list[str] | None]
+    if chunk_size and entity_ids and len(entity_ids) > chunk_size:
+        chunks = [
+            entity_ids[idx : idx + chunk_size]
+            for idx in range(0, len(entity_ids), chunk_size)
+        ]
+    else:
+        chunks = [entity_ids]
+    last_chunk_idx = len(chunks) - 1
+    max_last_time_ts = 0.0
+    max_last_time_dt: dt | None = None
+    for chunk_idx, chunk_entity_ids in enumerate(chunks):
+        if chunk_idx and msg_id not in connection.subscriptions:
+            # Unsubscribe happened while sending the previous chunk
+            break
+        last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+            _generate_historical_response,
+            hass,
+            msg_id,
+            start_time,
+            end_time,
+            chunk_entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            # Only send an empty response if none of the chunks had states
+            send_empty and chunk_idx == last_chunk_idx and not max_last_time_ts,
+        )
+        if payload:
+            connection.send_message(payload)
+        if last_time_ts > max_last_time_ts:
+            max_last_time_ts = last_time_ts
+            max_last_time_dt = last_time_dt
+    return max_last_time_dt
 
 
 def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, Any]:
@@ -404,6 +443,7 @@ def _async_subscribe_events(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunk_size"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
@@ -443,6 +483,7 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    chunk_size: int | None = msg.get("chunk_size")
 
     if end_time and end_time <= utc_now:
         if (
@@ -469,6 +510,7 @@ async def ws_stream(
             minimal_response,
             no_attributes,
             True,
+            chunk_size,
         )
         return
 
@@ -533,6 +575,7 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         True,
+        chunk_size,
     )
 
     if msg_id not in connection.subscriptions:
@@ -577,4 +620,5 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         send_empty=not last_event_time,
+        chunk_size=chunk_size,
     )
@@ -61,6 +61,7 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_COALESCE = "coalesce"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -113,6 +114,9 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(
+                        CONF_COALESCE, default=INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA({})
+                    ): INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
                 }
             ),
         )
@@ -136,6 +140,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     conf = config[DOMAIN]
     _filter = convert_include_exclude_filter(conf)
     entity_filter = None if _filter.empty_filter else _filter.get_filter()
+    _coalesce_filter = convert_include_exclude_filter(conf[CONF_COALESCE])
+    coalesce_filter = (
+        None if _coalesce_filter.empty_filter else _coalesce_filter.get_filter()
+    )
     auto_purge = conf[CONF_AUTO_PURGE]
     auto_repack = conf[CONF_AUTO_REPACK]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
@@ -163,6 +171,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        coalesce_filter=coalesce_filter,
     )
     get_instance.cache_clear()
     instance.async_initialize()
@@ -8,7 +8,9 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
+from .const import SIGNAL_PURGE_PROGRESS
 from .util import get_instance
 
 
@@ -16,6 +18,8 @@ from .util import get_instance
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the recorder websocket API."""
     websocket_api.async_register_command(hass, ws_info)
+    websocket_api.async_register_command(hass, ws_cache_info)
+    websocket_api.async_register_command(hass, ws_subscribe_purge_progress)
 
 
 @websocket_api.websocket_command(
@@ -54,3 +58,58 @@ def ws_info(
         "thread_running": is_running,
     }
     connection.send_result(msg["id"], recorder_info)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/cache_info",
+    }
+)
+@callback
+def ws_cache_info(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the hit, miss and eviction counters of the recorder caches."""
+    if not (instance := get_instance(hass)):
+        connection.send_error(msg["id"], "not_found", "Recorder not found")
+        return
+    connection.send_result(
+        msg["id"],
+        {
+            "event_data": instance.event_data_manager.get_cache_stats(),
+            "event_types": instance.event_type_manager.get_cache_stats(),
+            "state_attributes": instance.state_attributes_manager.get_cache_stats(),
+            "states_meta": instance.states_meta_manager.get_cache_stats(),
+        },
+    )
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/subscribe_purge_progress",
+    }
+)
+@callback
+def ws_subscribe_purge_progress(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Subscribe to the progress of purging old data.
+
+    The progress of the running or last finished purge is sent right away.
+    """
+    if not (instance := get_instance(hass)):
+        connection.send_error(msg["id"], "not_found", "Recorder not found")
+        return
+
+    @callback
+    def forward_purge_progress(progress: dict[str, Any]) -> None:
+        """Forward the purge progress to websocket."""
+        connection.send_message(websocket_api.event_message(msg["id"], progress))
+
+    connection.subscriptions[msg["id"]] = async_dispatcher_connect(
+        hass, SIGNAL_PURGE_PROGRESS, forward_purge_progress
+    )
+    connection.send_result(msg["id"])
+    if (progress := instance.purge_progress) is not None:
+        forward_purge_progress(progress.as_dict())
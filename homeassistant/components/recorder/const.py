@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from enum import StrEnum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.const import (
     ATTR_ATTRIBUTION,
@@ -13,6 +13,7 @@ from homeassistant.const import (
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,  # noqa: F401
 )
 from homeassistant.helpers.json import JSON_DUMP  # noqa: F401
+from homeassistant.util.signal_type import SignalType
 
 if TYPE_CHECKING:
     from .core import Recorder  # noqa: F401
@@ -46,6 +47,13 @@ DEFAULT_MAX_BIND_VARS = 4000
 
 DB_WORKER_PREFIX = "DbWorker"
 
+# Stop a purge cycle early once this many events are waiting to be recorded
+PURGE_YIELD_BACKLOG = 100
+
+SIGNAL_PURGE_PROGRESS: SignalType[dict[str, Any]] = SignalType(
+    "recorder_purge_progress"
+)
+
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
 
 ATTR_KEEP_DAYS = "keep_days"
@@ -16,7 +16,14 @@ from typing import TYPE_CHECKING, Any, cast
 
 from propcache import cached_property
 import psutil_home_assistant as ha_psutil
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select, update
+from sqlalchemy import (
+    create_engine,
+    event as sqlalchemy_event,
+    exc,
+    insert,
+    select,
+    update,
+)
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
@@ -35,10 +42,14 @@ from homeassistant.core import (
     CALLBACK_TYPE,
     Event,
     EventStateChangedData,
+    HassJob,
+    HassJobType,
     HomeAssistant,
+    State,
     callback,
 )
 from homeassistant.helpers.event import (
+    async_call_later,
     async_track_time_change,
     async_track_time_interval,
     async_track_utc_time_change,
@@ -87,6 +98,7 @@ from .migration import (
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
 from .queries import get_migration_changes
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
@@ -149,6 +161,20 @@ DB_LOCK_QUEUE_CHECK_TIMEOUT = 10  # check every 10 seconds
 
 QUEUE_CHECK_INTERVAL = timedelta(minutes=5)
 
+# When the backlog reaches this size the commit window is lengthened
+# and attribute only state changes are coalesced into the pending state
+# of the entity until the recorder catches up
+BACKPRESSURE_BACKLOG = 2000
+# The commit window is shortened again once the backlog drops below this size
+BACKPRESSURE_RECOVERED_BACKLOG = 200
+# A commit that takes longer than this fraction of the commit window
+# lengthens the window to amortize the cost of each commit
+SLOW_COMMIT_RATIO = 0.25
+# The longest the commit window may grow to in seconds. SQLite
+# commits are the most expensive since each one ends with an fsync.
+MAX_COMMIT_WINDOW_SQLITE = 30
+MAX_COMMIT_WINDOW = 15
+
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
 
@@ -156,6 +182,19 @@ CONNECTIVITY_ERR = "Error in database connectivity during commit"
 MAX_DB_EXECUTOR_WORKERS = POOL_SIZE - 1
 
 
+def _records_state_change(dbstate: States) -> bool:
+    """Return if a pending state recorded a change of the state."""
+    return (
+        dbstate.last_changed_ts is None
+        or dbstate.last_changed_ts == dbstate.last_updated_ts
+    )
+
+
+def _is_state_change(state: State | None) -> bool:
+    """Return if a new state changed the state and not only the attributes."""
+    return state is not None and state.last_changed == state.last_updated
+
+
 class Recorder(threading.Thread):
     """A threaded recorder class."""
 
@@ -173,6 +212,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        coalesce_filter: Callable[[str], bool] | None,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -186,6 +226,8 @@ class Recorder(threading.Thread):
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
+        self.commit_window: float = commit_interval
+        self.coalesce_state_changes = False
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
         self.db_url = uri
         self.db_max_retries = db_max_retries
@@ -208,10 +250,16 @@ class Recorder(threading.Thread):
         # by is_entity_recorder and the sensor recorder.
         self.entity_filter = entity_filter
         self.exclude_event_types = exclude_event_types
+        # Entities matching the coalesce_filter only keep their first
+        # and last state of each commit window
+        self.coalesce_filter = coalesce_filter
 
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # Events rows that only reference committed ids are buffered
+        # here and written with a single executemany at commit time
+        self._pending_event_rows: list[dict[str, Any]] = []
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -226,6 +274,8 @@ class Recorder(threading.Thread):
         self._completed_first_database_setup: bool | None = None
         self.migration_in_progress = False
         self.migration_is_live = False
+        # Progress of the running or last finished purge
+        self.purge_progress: PurgeProgress | None = None
         self.use_legacy_events_index = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
@@ -234,6 +284,11 @@ class Recorder(threading.Thread):
         self._queue_watcher: CALLBACK_TYPE | None = None
         self._keep_alive_listener: CALLBACK_TYPE | None = None
         self._commit_listener: CALLBACK_TYPE | None = None
+        self._commit_job = HassJob(
+            self._async_commit_window_elapsed,
+            "Recorder commit",
+            job_type=HassJobType.Callback,
+        )
         self._periodic_listener: CALLBACK_TYPE | None = None
         self._nightly_listener: CALLBACK_TYPE | None = None
         self._dialect_name: SupportedDialect | None = None
@@ -358,6 +413,19 @@ class Recorder(threading.Thread):
         ):
             self.queue_task(COMMIT_TASK)
 
+    @callback
+    def _async_commit_window_elapsed(self, now: datetime) -> None:
+        """Queue a commit and schedule the next one."""
+        self._async_commit(now)
+        self._async_schedule_commit()
+
+    @callback
+    def _async_schedule_commit(self) -> None:
+        """Schedule the next commit at the end of the current commit window."""
+        self._commit_listener = async_call_later(
+            self.hass, self.commit_window, self._commit_job
+        )
+
     @callback
     def async_add_executor_job[_T](
         self, target: Callable[..., _T], *args: Any
@@ -645,12 +713,7 @@ class Recorder(threading.Thread):
 
         # If the commit interval is not 0, we need to commit periodically
         if self.commit_interval:
-            self._commit_listener = async_track_time_interval(
-                self.hass,
-                self._async_commit,
-                timedelta(seconds=self.commit_interval),
-                name="Recorder commit",
-            )
+            self._async_schedule_commit()
 
         # Run nightly tasks at 4:12am
         self._nightly_listener = async_track_time_change(
@@ -1037,48 +1100,75 @@ class Recorder(threading.Thread):
         """Process any event into the session except state changed."""
         session = self.event_session
         assert session is not None
-        dbevent = Events.from_event(event)
+        event_type_id: int | None = None
+        event_types: EventTypes | None = None
+        data_id: int | None = None
+        dbevent_data: EventData | None = None
 
         # Map the event_type to the EventTypes table
         event_type_manager = self.event_type_manager
         if pending_event_types := event_type_manager.get_pending(event.event_type):
-            dbevent.event_type_rel = pending_event_types
-        elif event_type_id := event_type_manager.get(event.event_type, session, True):
-            dbevent.event_type_id = event_type_id
-        else:
+            event_types = pending_event_types
+        elif not (
+            event_type_id := event_type_manager.get(event.event_type, session, True)
+        ):
             event_types = EventTypes(event_type=event.event_type)
             event_type_manager.add_pending(event_types)
             self._add_to_session(session, event_types)
-            dbevent.event_type_rel = event_types
 
-        if not event.data:
-            self._add_to_session(session, dbevent)
-            return
+        if event.data:
+            event_data_manager = self.event_data_manager
+            if not (
+                shared_data_bytes := event_data_manager.serialize_from_event(event)
+            ):
+                return
 
-        event_data_manager = self.event_data_manager
-        if not (shared_data_bytes := event_data_manager.serialize_from_event(event)):
+            # Map the event data to the EventData table
+            shared_data = shared_data_bytes.decode("utf-8")
+            # Matching attributes found in the pending commit
+            if pending_event_data := event_data_manager.get_pending(shared_data):
+                dbevent_data = pending_event_data
+            # Matching attributes id found in the cache
+            elif not (
+                (data_id := event_data_manager.get_from_cache(shared_data))
+                or (
+                    (hash_ := EventData.hash_shared_data_bytes(shared_data_bytes))
+                    and (data_id := event_data_manager.get(shared_data, hash_, session))
+                )
+            ):
+                # No matching attributes found, save them in the DB
+                dbevent_data = EventData(shared_data=shared_data, hash=hash_)
+                event_data_manager.add_pending(dbevent_data)
+                self._add_to_session(session, dbevent_data)
+
+        if event_types is None and dbevent_data is None:
+            # The event only references rows that are already committed so
+            # it does not need the unit of work to resolve its foreign keys
+            self._pending_event_rows.append(
+                Events.row_from_event(event, event_type_id, data_id)
+            )
+            self._event_session_has_pending_writes = True
             return
 
-        # Map the event data to the EventData table
-        shared_data = shared_data_bytes.decode("utf-8")
-        # Matching attributes found in the pending commit
-        if pending_event_data := event_data_manager.get_pending(shared_data):
-            dbevent.event_data_rel = pending_event_data
-        # Matching attributes id found in the cache
-        elif (data_id := event_data_manager.get_from_cache(shared_data)) or (
-            (hash_ := EventData.hash_shared_data_bytes(shared_data_bytes))
-            and (data_id := event_data_manager.get(shared_data, hash_, session))
-        ):
-            dbevent.data_id = data_id
+        # Write out the buffered rows first to keep the events in order
+        self._flush_pending_event_rows(session)
+        dbevent = Events.from_event(event)
+        if event_types is not None:
+            dbevent.event_type_rel = event_types
         else:
-            # No matching attributes found, save them in the DB
-            dbevent_data = EventData(shared_data=shared_data, hash=hash_)
-            event_data_manager.add_pending(dbevent_data)
-            self._add_to_session(session, dbevent_data)
+            dbevent.event_type_id = event_type_id
+        if dbevent_data is not None:
             dbevent.event_data_rel = dbevent_data
-
+        else:
+            dbevent.data_id = data_id
         self._add_to_session(session, dbevent)
 
+    def _flush_pending_event_rows(self, session: Session) -> None:
+        """Insert the buffered events rows with a single executemany."""
+        if self._pending_event_rows:
+            session.execute(insert(Events), self._pending_event_rows)
+            self._pending_event_rows = []
+
     def _process_state_changed_event_into_session(
         self, event: Event[EventStateChangedData]
     ) -> None:
@@ -1095,20 +1185,41 @@ class Recorder(threading.Thread):
         session = self.event_session
 
         states_manager = self.states_manager
+        if not entity_removed and (
+            pending_state := self._pending_state_to_coalesce(event)
+        ):
+            pending_state.state = dbstate.state
+            pending_state.last_updated_ts = dbstate.last_updated_ts
+            pending_state.last_changed_ts = dbstate.last_changed_ts
+            pending_state.last_reported_ts = dbstate.last_reported_ts
+            pending_state.context_id_bin = dbstate.context_id_bin
+            pending_state.context_user_id_bin = dbstate.context_user_id_bin
+            pending_state.context_parent_id_bin = dbstate.context_parent_id_bin
+            pending_state.origin_idx = dbstate.origin_idx
+            if shared_attrs_bytes := state_attributes_manager.serialize_from_event(
+                event
+            ):
+                pending_state.attributes_id = None
+                self._map_state_attributes(session, pending_state, shared_attrs_bytes)
+            return
+
         if pending_state := states_manager.pop_pending(entity_id):
             dbstate.old_state = pending_state
+            follows_pending = True
             if old_state:
                 pending_state.last_reported_ts = old_state.last_reported_timestamp
-        elif old_state_id := states_manager.pop_committed(entity_id):
-            dbstate.old_state_id = old_state_id
-            if old_state:
-                states_manager.update_pending_last_reported(
-                    old_state_id, old_state.last_reported_timestamp
-                )
+        else:
+            follows_pending = False
+            if old_state_id := states_manager.pop_committed(entity_id):
+                dbstate.old_state_id = old_state_id
+                if old_state:
+                    states_manager.update_pending_last_reported(
+                        old_state_id, old_state.last_reported_timestamp
+                    )
         if entity_removed:
             dbstate.state = None
         else:
-            states_manager.add_pending(entity_id, dbstate)
+            states_manager.add_pending(entity_id, dbstate, follows_pending)
 
         if states_meta_manager.active:
             dbstate.entity_id = None
@@ -1135,7 +1246,53 @@ class Recorder(threading.Thread):
             self._add_to_session(session, states_meta)
             dbstate.states_meta_rel = states_meta
 
-        # Map the event data to the StateAttributes table
+        self._map_state_attributes(session, dbstate, shared_attrs_bytes)
+        self._add_to_session(session, dbstate)
+
+    def _pending_state_to_coalesce(
+        self, event: Event[EventStateChangedData]
+    ) -> States | None:
+        """Return the pending state a state change can be written into."""
+        entity_id = event.data["entity_id"]
+        states_manager = self.states_manager
+        pending_state: States | None = None
+        if (
+            (coalesce_filter := self.coalesce_filter)
+            and coalesce_filter(entity_id)
+            and (follower := states_manager.get_pending_follower(entity_id))
+            and (
+                not _records_state_change(follower)
+                or _is_state_change(event.data["new_state"])
+            )
+        ):
+            # Keep the first state of the entity in the commit window and
+            # overwrite the states following it, unless an attribute only
+            # change would overwrite a state change and lose its boundary
+            pending_state = follower
+        if (
+            pending_state is None
+            and self.coalesce_state_changes
+            and (old_state := event.data["old_state"])
+            and (new_state := event.data["new_state"])
+            and old_state.state == new_state.state
+            and (pending := states_manager.get_pending(entity_id))
+            and not _records_state_change(pending)
+        ):
+            # The recorder is falling behind, overwrite the pending state
+            # since both only changed the attributes. A pending state change
+            # is kept so its boundary stays in the significant history.
+            pending_state = pending
+        # A pending state linked to StateAttributes that have not been
+        # flushed yet cannot be relinked to an existing attributes_id
+        if pending_state is None or pending_state.attributes_id is None:
+            return None
+        return pending_state
+
+    def _map_state_attributes(
+        self, session: Session, dbstate: States, shared_attrs_bytes: bytes
+    ) -> None:
+        """Map the shared attributes of a state to the StateAttributes table."""
+        state_attributes_manager = self.state_attributes_manager
         shared_attrs = shared_attrs_bytes.decode("utf-8")
         dbstate.attributes = None
         # Matching attributes found in the pending commit
@@ -1160,8 +1317,6 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
-
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
         if (
@@ -1207,6 +1362,8 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
+        commit_start = time.monotonic()
+        self._flush_pending_event_rows(session)
 
         if (
             pending_last_reported
@@ -1226,6 +1383,8 @@ class Recorder(threading.Thread):
         session.commit()
 
         self._event_session_has_pending_writes = False
+        if self.commit_interval:
+            self._adjust_commit_window(time.monotonic() - commit_start)
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1243,6 +1402,38 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             session.expire_all()
 
+    def _adjust_commit_window(self, commit_duration: float) -> None:
+        """Adjust the commit window to the load on the recorder.
+
+        When the recorder falls behind or commits are slow, the window is
+        lengthened so the cost of each commit is spread over more rows and
+        attribute only state changes are coalesced. Once the recorder has
+        caught up the window shrinks back to the configured commit interval.
+        """
+        backlog = self.backlog
+        window = self.commit_window
+        if (
+            backlog >= BACKPRESSURE_BACKLOG
+            or commit_duration > window * SLOW_COMMIT_RATIO
+        ):
+            max_window = (
+                MAX_COMMIT_WINDOW_SQLITE
+                if self.dialect_name == SupportedDialect.SQLITE
+                else MAX_COMMIT_WINDOW
+            )
+            window = max(min(window * 2, max_window), self.commit_interval)
+        elif backlog < BACKPRESSURE_RECOVERED_BACKLOG:
+            window = max(window / 2, self.commit_interval)
+        if window != self.commit_window:
+            _LOGGER.debug(
+                "Adjusting commit window to %ss, backlog: %s, commit took: %.3fs",
+                window,
+                backlog,
+                commit_duration,
+            )
+            self.commit_window = window
+        self.coalesce_state_changes = backlog >= BACKPRESSURE_BACKLOG
+
     def _handle_sqlite_corruption(self, setup_run: bool) -> None:
         """Handle the sqlite3 database being corrupt."""
         try:
@@ -1257,6 +1448,7 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self._pending_event_rows = []
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
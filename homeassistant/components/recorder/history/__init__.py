@@ -7,16 +7,20 @@ from typing import Any
 
 from sqlalchemy.orm.session import Session
 
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.recorder import get_instance
 
 from ..filters import Filters
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
+    NumericHistory,
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
+    get_numeric_states as _modern_get_numeric_states,
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
+    rows_to_numeric_history,
     state_changes_during_period as _modern_state_changes_during_period,
 )
 
@@ -24,8 +28,10 @@ from .modern import (
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "NumericHistory",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
+    "get_numeric_states",
     "get_significant_states",
     "get_significant_states_with_session",
     "state_changes_during_period",
@@ -80,6 +86,52 @@ def get_last_state_changes(
     return _target(hass, number_of_states, entity_id)
 
 
+def get_numeric_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+) -> dict[str, NumericHistory]:
+    """Return the state changes during a time period as numeric arrays."""
+    if get_instance(hass).states_meta_manager.active:
+        return _modern_get_numeric_states(
+            hass, start_time, end_time, entity_ids, include_start_time_state
+        )
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states as _legacy_get_significant_states,
+    )
+
+    # The legacy schema is only used until the migration to
+    # states_meta finishes, so the row based query is good enough
+    hist = _legacy_get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        False,
+        False,
+        True,
+        True,
+    )
+    return {
+        entity_id: rows_to_numeric_history(
+            (
+                (
+                    None,
+                    state[COMPRESSED_STATE_STATE],  # type: ignore[index]
+                    state[COMPRESSED_STATE_LAST_UPDATED],  # type: ignore[index]
+                )
+                for state in states
+            ),
+            None,
+        )
+        for entity_id, states in hist.items()
+    }
+
+
 def get_significant_states(
     hass: HomeAssistant,
     start_time: datetime,
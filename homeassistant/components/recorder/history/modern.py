@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from array import array
 from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
 from itertools import groupby
+from math import isfinite
 from operator import itemgetter
 from typing import Any, cast
 
@@ -319,6 +322,138 @@ def get_full_significant_states_with_session(
     )
 
 
+@dataclass(slots=True)
+class NumericHistory:
+    """Columnar history of a single entity.
+
+    timestamps and values are contiguous float64 buffers that can be
+    wrapped without copying (for example with numpy.frombuffer). mask
+    is 1 where the state could be parsed as a finite float and 0
+    otherwise, in which case the value is NaN.
+    """
+
+    timestamps: array[float] = field(default_factory=lambda: array("d"))
+    values: array[float] = field(default_factory=lambda: array("d"))
+    mask: bytearray = field(default_factory=bytearray)
+
+
+def get_numeric_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+) -> dict[str, NumericHistory]:
+    """Wrap get_numeric_states_with_session with an sql session."""
+    with session_scope(hass=hass, read_only=True) as session:
+        return get_numeric_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+        )
+
+
+def get_numeric_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+) -> dict[str, NumericHistory]:
+    """Return every state change during UTC period start_time - end_time as arrays.
+
+    The attributes are not joined, only the metadata_id, state,
+    last_changed and last_updated columns are selected, and the rows
+    are consumed straight from the cursor without creating State
+    objects, which keeps long ranges of many sensors cheap to load.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    instance = get_instance(hass)
+    if not (
+        entity_id_to_metadata_id := instance.states_meta_manager.get_many(
+            entity_ids, session, False
+        )
+    ) or not (metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
+        return {}
+    run_start_ts: float | None = None
+    if include_start_time_state and not (
+        run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)
+    ):
+        include_start_time_state = False
+    start_time_ts = dt_util.utc_to_timestamp(start_time)
+    end_time_ts = datetime_to_timestamp_or_none(end_time)
+    single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
+    stmt = lambda_stmt(
+        lambda: _significant_states_stmt(
+            start_time_ts,
+            end_time_ts,
+            single_metadata_id,
+            metadata_ids,
+            [],
+            False,
+            True,
+            include_start_time_state,
+            run_start_ts,
+        ),
+        track_on=[
+            bool(single_metadata_id),
+            bool(end_time_ts),
+            include_start_time_state,
+        ],
+    )
+    metadata_id_to_entity_id = {
+        metadata_id: entity_id
+        for entity_id, metadata_id in entity_id_to_metadata_id.items()
+        if metadata_id is not None
+    }
+    metadata_id_idx = _FIELD_MAP["metadata_id"]
+    rows = execute_stmt_lambda_element(
+        session, stmt, start_time, end_time, orm_rows=False
+    )
+    result: dict[str, NumericHistory] = {}
+    for metadata_id, group in groupby(rows, itemgetter(metadata_id_idx)):
+        result[metadata_id_to_entity_id[metadata_id]] = rows_to_numeric_history(
+            group, start_time_ts
+        )
+    return result
+
+
+def rows_to_numeric_history(
+    rows: Iterable[Row | tuple[Any, str | None, float | None]],
+    start_time_ts: float | None,
+) -> NumericHistory:
+    """Convert (metadata_id, state, last_updated_ts) rows into a NumericHistory.
+
+    Rows for the state at the start time carry no timestamp, they are
+    placed at start_time_ts.
+    """
+    history = NumericHistory()
+    timestamps = history.timestamps
+    values = history.values
+    mask = history.mask
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    nan = float("nan")
+    for row in rows:
+        timestamps.append(cast(float, row[last_updated_ts_idx]) or start_time_ts or 0.0)
+        try:
+            value = float(row[state_idx])  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            value = nan
+        if isfinite(value):
+            values.append(value)
+            mask.append(1)
+        else:
+            values.append(nan)
+            mask.append(0)
+    return history
+
+
 def _state_changed_during_period_stmt(
     start_time_ts: float,
     end_time_ts: float | None,
@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
+from homeassistant.helpers.dispatcher import dispatcher_send
 from homeassistant.util.collection import chunked_or_all
 
+from .const import PURGE_YIELD_BACKLOG, SIGNAL_PURGE_PROGRESS
 from .db_schema import Events, States, StatesMeta
 from .models import DatabaseEngine
 from .queries import (
@@ -37,6 +40,8 @@ from .queries import (
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_oldest_event_ts,
+    find_oldest_state_ts,
     find_short_term_statistics_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
@@ -54,6 +59,80 @@ DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
 
+@dataclass(slots=True)
+class PurgeProgress:
+    """Progress of purging the data older than purge_before.
+
+    The purge deletes the oldest rows first, so the progress is estimated
+    from how far the oldest remaining row has moved towards purge_before.
+    """
+
+    purge_before: datetime
+    started: float = field(default_factory=time.monotonic)
+    first_timestamp: float | None = None
+    oldest_timestamp: float | None = None
+    deleted_rows: dict[str, int] = field(default_factory=dict)
+    finished: bool = False
+
+    def add_deleted_rows(self, table: str, rows: int) -> None:
+        """Add deleted rows of a table."""
+        if rows:
+            self.deleted_rows[table] = self.deleted_rows.get(table, 0) + rows
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress as a dict, including rows per second and ETA."""
+        elapsed = time.monotonic() - self.started
+        progress: float | None = None
+        eta: float | None = None
+        if self.finished:
+            progress = 1.0
+            eta = 0.0
+        elif (
+            self.first_timestamp is not None
+            and self.oldest_timestamp is not None
+            and (span := self.purge_before.timestamp() - self.first_timestamp) > 0
+        ):
+            progress = min(
+                max((self.oldest_timestamp - self.first_timestamp) / span, 0.0), 1.0
+            )
+            if progress:
+                eta = round(elapsed * (1 - progress) / progress, 1)
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "deleted_rows": dict(self.deleted_rows),
+            "elapsed": round(elapsed, 3),
+            "rows_per_second": (
+                round(sum(self.deleted_rows.values()) / elapsed, 1) if elapsed else 0.0
+            ),
+            "progress": progress,
+            "eta": eta,
+            "finished": self.finished,
+        }
+
+
+def _get_purge_progress(instance: Recorder, purge_before: datetime) -> PurgeProgress:
+    """Return the progress of the purge, starting a new one if needed."""
+    progress = instance.purge_progress
+    if progress is None or progress.finished or progress.purge_before != purge_before:
+        progress = instance.purge_progress = PurgeProgress(purge_before)
+    return progress
+
+
+def _find_oldest_timestamp(session: Session) -> float | None:
+    """Return the timestamp of the oldest state or event."""
+    timestamps = [
+        timestamp
+        for stmt in (find_oldest_state_ts(), find_oldest_event_ts())
+        if (timestamp := session.execute(stmt).scalar()) is not None
+    ]
+    return min(timestamps) if timestamps else None
+
+
+def _send_purge_progress(instance: Recorder, progress: PurgeProgress) -> None:
+    """Send the progress of the purge to subscribers."""
+    dispatcher_send(instance.hass, SIGNAL_PURGE_PROGRESS, progress.as_dict())
+
+
 @retryable_database_job("purge")
 def purge_old_data(
     instance: Recorder,
@@ -71,7 +150,10 @@ def purge_old_data(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    progress = _get_purge_progress(instance, purge_before)
     with session_scope(session=instance.get_session()) as session:
+        if progress.first_timestamp is None:
+            progress.first_timestamp = _find_oldest_timestamp(session)
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
         if instance.use_legacy_events_index and _purging_legacy_format(session):
@@ -87,10 +169,10 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, states_batch_size, purge_before, progress
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, purge_before, progress
             )
 
         statistics_runs = _select_statistics_runs_to_purge(
@@ -104,10 +186,15 @@ def purge_old_data(
 
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
+            progress.add_deleted_rows(
+                "statistics_short_term", len(short_term_statistics)
+            )
 
         if has_more_to_purge or statistics_runs or short_term_statistics:
             # Return false, as we might not be done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
+            progress.oldest_timestamp = _find_oldest_timestamp(session)
+            _send_purge_progress(instance, progress)
             return False
 
         if apply_filter and _purge_filtered_data(instance, session) is False:
@@ -125,6 +212,8 @@ def purge_old_data(
         _purge_old_recorder_runs(instance, session, purge_before)
     if repack:
         repack_database(instance)
+    progress.finished = True
+    _send_purge_progress(instance, progress)
     return True
 
 
@@ -178,9 +267,12 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
+    The batch ends early when events are piling up in the recorder queue.
+
     Returns true if there are more states to purge.
     """
     database_engine = instance.database_engine
@@ -200,9 +292,16 @@ def _purge_states_and_attributes_ids(
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
+        progress.add_deleted_rows("states", len(state_ids))
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        if instance.backlog > PURGE_YIELD_BACKLOG:
+            # Let the recorder catch up with live writes before purging more
+            break
 
-    _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
+    progress.add_deleted_rows(
+        "state_attributes",
+        _purge_unused_attributes_ids(instance, session, attributes_ids_batch),
+    )
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
         has_remaining_state_ids_to_purge,
@@ -215,9 +314,12 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
+    The batch ends early when events are piling up in the recorder queue.
+
     Returns true if there are more states to purge.
     """
     has_remaining_event_ids_to_purge = True
@@ -235,9 +337,15 @@ def _purge_events_and_data_ids(
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
+        progress.add_deleted_rows("events", len(event_ids))
         data_ids_batch = data_ids_batch | data_ids
+        if instance.backlog > PURGE_YIELD_BACKLOG:
+            # Let the recorder catch up with live writes before purging more
+            break
 
-    _purge_unused_data_ids(instance, session, data_ids_batch)
+    progress.add_deleted_rows(
+        "event_data", _purge_unused_data_ids(instance, session, data_ids_batch)
+    )
     _LOGGER.debug(
         "After purging event and data_ids remaining=%s",
         has_remaining_event_ids_to_purge,
@@ -365,14 +473,18 @@ def _purge_unused_attributes_ids(
     instance: Recorder,
     session: Session,
     attributes_ids_batch: set[int],
-) -> None:
-    """Purge unused attributes ids."""
+) -> int:
+    """Purge unused attributes ids.
+
+    Returns the number of purged attributes ids.
+    """
     database_engine = instance.database_engine
     assert database_engine is not None
     if unused_attribute_ids_set := _select_unused_attributes_ids(
         instance, session, attributes_ids_batch, database_engine
     ):
         _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
+    return len(unused_attribute_ids_set)
 
 
 def _select_unused_event_data_ids(
@@ -413,13 +525,18 @@ def _select_unused_event_data_ids(
 
 def _purge_unused_data_ids(
     instance: Recorder, session: Session, data_ids_batch: set[int]
-) -> None:
+) -> int:
+    """Purge unused event data ids.
+
+    Returns the number of purged event data ids.
+    """
     database_engine = instance.database_engine
     assert database_engine is not None
     if unused_data_ids_set := _select_unused_event_data_ids(
         instance, session, data_ids_batch, database_engine
     ):
         _purge_batch_data_ids(instance, session, unused_data_ids_set)
+    return len(unused_data_ids_set)
 
 
 def _select_statistics_runs_to_purge(
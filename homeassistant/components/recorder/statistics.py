@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Sequence
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
-from itertools import chain, groupby
+from itertools import groupby
 import logging
 from operator import itemgetter
 import re
@@ -60,6 +61,8 @@ from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsDaily,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -157,6 +160,16 @@ UNIT_CLASSES = {
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
 
+# Tables with hourly statistics rolled up per local day and month
+ROLLUP_STATISTICS_TABLES: tuple[type[StatisticsBase], ...] = (
+    StatisticsDaily,
+    StatisticsMonthly,
+)
+
+# The maximum number of rollup periods compiled per hour when catching up,
+# for example after the rollup tables were added or the time zone changed
+MAX_ROLLUP_PERIODS_PER_RUN = 100
+
 
 def mean(values: list[float]) -> float | None:
     """Return the mean of the values.
@@ -388,12 +401,51 @@ def _compile_hourly_statistics_last_sum_stmt(
     )
 
 
+def _build_statistics_summary(
+    start_time_ts: float,
+    mean_stats: Iterable[Row],
+    sum_stats: Iterable[Row],
+) -> dict[int, StatisticDataTimestamp]:
+    """Combine summarized mean and last sum statistics per metadata_id."""
+    summary: dict[int, StatisticDataTimestamp] = {}
+    for stat in mean_stats:
+        metadata_id, _mean, _min, _max = stat
+        summary[metadata_id] = {
+            "start_ts": start_time_ts,
+            "mean": _mean,
+            "min": _min,
+            "max": _max,
+        }
+
+    for stat in sum_stats:
+        metadata_id, start, last_reset_ts, state, _sum, _ = stat
+        if metadata_id in summary:
+            summary[metadata_id].update(
+                {
+                    "last_reset_ts": last_reset_ts,
+                    "state": state,
+                    "sum": _sum,
+                }
+            )
+        else:
+            summary[metadata_id] = {
+                "start_ts": start_time_ts,
+                "last_reset_ts": last_reset_ts,
+                "state": state,
+                "sum": _sum,
+            }
+
+    return summary
+
+
 def _compile_hourly_statistics(session: Session, start: datetime) -> None:
     """Compile hourly statistics.
 
     This will summarize 5-minute statistics for one hour:
     - average, min max is computed by a database query
     - sum is taken from the last 5-minute entry during the hour
+
+    Daily and monthly rollups are compiled when the hour completes a period.
     """
     start_time = start.replace(minute=0)
     start_time_ts = start_time.timestamp()
@@ -401,42 +453,14 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
     end_time_ts = end_time.timestamp()
 
     # Compute last hour's average, min, max
-    summary: dict[int, StatisticDataTimestamp] = {}
     stmt = _compile_hourly_statistics_summary_mean_stmt(start_time_ts, end_time_ts)
-    stats = execute_stmt_lambda_element(session, stmt)
-
-    if stats:
-        for stat in stats:
-            metadata_id, _mean, _min, _max = stat
-            summary[metadata_id] = {
-                "start_ts": start_time_ts,
-                "mean": _mean,
-                "min": _min,
-                "max": _max,
-            }
+    mean_stats = execute_stmt_lambda_element(session, stmt)
 
     stmt = _compile_hourly_statistics_last_sum_stmt(start_time_ts, end_time_ts)
     # Get last hour's last sum
-    stats = execute_stmt_lambda_element(session, stmt)
-
-    if stats:
-        for stat in stats:
-            metadata_id, start, last_reset_ts, state, _sum, _ = stat
-            if metadata_id in summary:
-                summary[metadata_id].update(
-                    {
-                        "last_reset_ts": last_reset_ts,
-                        "state": state,
-                        "sum": _sum,
-                    }
-                )
-            else:
-                summary[metadata_id] = {
-                    "start_ts": start_time_ts,
-                    "last_reset_ts": last_reset_ts,
-                    "state": state,
-                    "sum": _sum,
-                }
+    sum_stats = execute_stmt_lambda_element(session, stmt)
+
+    summary = _build_statistics_summary(start_time_ts, mean_stats, sum_stats)
 
     # Insert compiled hourly statistics in the database
     session.add_all(
@@ -444,6 +468,158 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
         for metadata_id, summary_item in summary.items()
     )
 
+    _compile_rollup_statistics(session, end_time_ts)
+
+
+def _rollup_period_start_end(
+    table: type[StatisticsBase],
+) -> Callable[[float], tuple[float, float]]:
+    """Return a function which returns the start and end of a rollup period."""
+    if table is StatisticsDaily:
+        _, period_start_end = reduce_day_ts_factory()
+    else:
+        _, period_start_end = reduce_month_ts_factory()
+    return period_start_end
+
+
+def _rollup_statistics_summary(
+    session: Session,
+    start_time_ts: float,
+    end_time_ts: float,
+    metadata_id: int | None = None,
+) -> dict[int, StatisticDataTimestamp]:
+    """Summarize the hourly statistics of a rollup period.
+
+    The summary matches reducing the hourly statistics with _reduce_statistics.
+    """
+    mean_query = (
+        select(
+            Statistics.metadata_id,
+            func.avg(Statistics.mean),
+            func.min(Statistics.min),
+            func.max(Statistics.max),
+        )
+        .filter(Statistics.start_ts >= start_time_ts)
+        .filter(Statistics.start_ts < end_time_ts)
+        .group_by(Statistics.metadata_id)
+    )
+    sum_query = (
+        select(
+            Statistics.metadata_id,
+            Statistics.start_ts,
+            Statistics.last_reset_ts,
+            Statistics.state,
+            Statistics.sum,
+            func.row_number()
+            .over(
+                partition_by=Statistics.metadata_id,
+                order_by=Statistics.start_ts.desc(),
+            )
+            .label("rownum"),
+        )
+        .filter(Statistics.start_ts >= start_time_ts)
+        .filter(Statistics.start_ts < end_time_ts)
+    )
+    if metadata_id is not None:
+        mean_query = mean_query.filter(Statistics.metadata_id == metadata_id)
+        sum_query = sum_query.filter(Statistics.metadata_id == metadata_id)
+    subquery = sum_query.subquery()
+    return _build_statistics_summary(
+        start_time_ts,
+        session.execute(mean_query).all(),
+        session.execute(select(subquery).filter(subquery.c.rownum == 1)).all(),
+    )
+
+
+def _get_rollup_end_ts(
+    session: Session,
+    table: type[StatisticsBase],
+    period_start_end: Callable[[float], tuple[float, float]],
+) -> float | None:
+    """Return the end of the newest compiled rollup period.
+
+    Rollup periods are compiled in order for all statistics, so the rollups
+    are complete up to the returned timestamp. Returns None if no rollups
+    have been compiled, or if they were compiled in another time zone.
+    """
+    if (newest_ts := session.query(func.max(table.start_ts)).scalar()) is None:
+        return None
+    start_ts, end_ts = period_start_end(newest_ts)
+    if start_ts != newest_ts:
+        return None
+    return end_ts
+
+
+def _compile_rollup_statistics(session: Session, end_time_ts: float) -> None:
+    """Compile daily and monthly rollups for periods which ended by end_time_ts."""
+    for table in ROLLUP_STATISTICS_TABLES:
+        period_start_end = _rollup_period_start_end(table)
+        if (newest_ts := session.query(func.max(table.start_ts)).scalar()) is None:
+            next_start_ts = session.query(func.min(Statistics.start_ts)).scalar()
+        else:
+            period_start_ts, next_start_ts = period_start_end(newest_ts)
+            if period_start_ts != newest_ts:
+                # The time zone has changed, rebuild the rollups from scratch
+                _LOGGER.info("Rebuilding %s after a time zone change", table.__name__)
+                session.query(table).delete(synchronize_session=False)
+                next_start_ts = session.query(func.min(Statistics.start_ts)).scalar()
+        if next_start_ts is None:
+            continue
+
+        for _ in range(MAX_ROLLUP_PERIODS_PER_RUN):
+            period_start_ts, period_end_ts = period_start_end(next_start_ts)
+            if period_end_ts > end_time_ts:
+                break
+            if summary := _rollup_statistics_summary(
+                session, period_start_ts, period_end_ts
+            ):
+                session.add_all(
+                    table.from_stats_ts(metadata_id, summary_item)
+                    for metadata_id, summary_item in summary.items()
+                )
+                next_start_ts = period_end_ts
+                continue
+            # Skip ahead to the next period with hourly statistics
+            if (
+                next_start_ts := session.query(func.min(Statistics.start_ts))
+                .filter(Statistics.start_ts >= period_end_ts)
+                .scalar()
+            ) is None:
+                break
+
+
+def _recompile_rollup_statistics(
+    session: Session,
+    table: type[StatisticsBase],
+    metadata_id: int,
+    start_time_ts: float,
+    end_time_ts: float,
+) -> None:
+    """Recompile rollups of a statistic for periods overlapping a time range.
+
+    Only periods which have already been compiled are recompiled, later periods
+    will be compiled from the updated hourly statistics.
+    """
+    period_start_end = _rollup_period_start_end(table)
+    if (rollup_end_ts := _get_rollup_end_ts(session, table, period_start_end)) is None:
+        return
+    next_start_ts, _ = period_start_end(start_time_ts)
+    end_time_ts = min(end_time_ts, rollup_end_ts)
+    if next_start_ts >= end_time_ts:
+        return
+    session.query(table).filter(
+        table.metadata_id == metadata_id,
+        table.start_ts >= next_start_ts,
+        table.start_ts < end_time_ts,
+    ).delete(synchronize_session=False)
+    while next_start_ts < end_time_ts:
+        period_start_ts, period_end_ts = period_start_end(next_start_ts)
+        if summary := _rollup_statistics_summary(
+            session, period_start_ts, period_end_ts, metadata_id
+        ):
+            session.add(table.from_stats_ts(metadata_id, summary[metadata_id]))
+        next_start_ts = period_end_ts
+
 
 @retryable_database_job("compile missing statistics")
 def compile_missing_statistics(instance: Recorder) -> bool:
@@ -902,14 +1078,16 @@ def list_statistic_ids(
 
 def _reduce_statistics(
     stats: dict[str, list[StatisticsRow]],
-    same_period: Callable[[float, float], bool],
     period_start_end: Callable[[float], tuple[float, float]],
-    period: timedelta,
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to daily or monthly statistics."""
+    """Reduce hourly statistics to daily or monthly statistics.
+
+    The hourly statistics of each period are located with a binary search
+    on their start times, so the period boundaries are only calculated once
+    per period instead of once per hourly statistic.
+    """
     result: dict[str, list[StatisticsRow]] = defaultdict(list)
-    period_seconds = period.total_seconds()
     _want_mean = "mean" in types
     _want_min = "min" in types
     _want_max = "max" in types
@@ -917,44 +1095,49 @@ def _reduce_statistics(
     _want_state = "state" in types
     _want_sum = "sum" in types
     for statistic_id, stat_list in stats.items():
-        max_values: list[float] = []
-        mean_values: list[float] = []
-        min_values: list[float] = []
-        prev_stat: StatisticsRow = stat_list[0]
-        fake_entry: StatisticsRow = {"start": stat_list[-1]["start"] + period_seconds}
-
-        # Loop over the hourly statistics + a fake entry to end the period
-        for statistic in chain(stat_list, (fake_entry,)):
-            if not same_period(prev_stat["start"], statistic["start"]):
-                start, end = period_start_end(prev_stat["start"])
-                # The previous statistic was the last entry of the period
-                row: StatisticsRow = {
-                    "start": start,
-                    "end": end,
-                }
-                if _want_mean:
-                    row["mean"] = mean(mean_values) if mean_values else None
-                    mean_values.clear()
-                if _want_min:
-                    row["min"] = min(min_values) if min_values else None
-                    min_values.clear()
-                if _want_max:
-                    row["max"] = max(max_values) if max_values else None
-                    max_values.clear()
-                if _want_last_reset:
-                    row["last_reset"] = prev_stat.get("last_reset")
-                if _want_state:
-                    row["state"] = prev_stat.get("state")
-                if _want_sum:
-                    row["sum"] = prev_stat["sum"]
-                result[statistic_id].append(row)
-            if _want_max and (_max := statistic.get("max")) is not None:
-                max_values.append(_max)
-            if _want_mean and (_mean := statistic.get("mean")) is not None:
-                mean_values.append(_mean)
-            if _want_min and (_min := statistic.get("min")) is not None:
-                min_values.append(_min)
-            prev_stat = statistic
+        starts = [statistic["start"] for statistic in stat_list]
+        rows = result[statistic_id]
+        idx = 0
+        num_stats = len(stat_list)
+        while idx < num_stats:
+            start, end = period_start_end(starts[idx])
+            end_idx = bisect_left(starts, end, idx + 1)
+            period_stats = stat_list[idx:end_idx]
+            # The last statistic of the period
+            last_stat = stat_list[end_idx - 1]
+            row: StatisticsRow = {
+                "start": start,
+                "end": end,
+            }
+            if _want_mean:
+                mean_values = [
+                    _mean
+                    for statistic in period_stats
+                    if (_mean := statistic.get("mean")) is not None
+                ]
+                row["mean"] = mean(mean_values) if mean_values else None
+            if _want_min:
+                min_values = [
+                    _min
+                    for statistic in period_stats
+                    if (_min := statistic.get("min")) is not None
+                ]
+                row["min"] = min(min_values) if min_values else None
+            if _want_max:
+                max_values = [
+                    _max
+                    for statistic in period_stats
+                    if (_max := statistic.get("max")) is not None
+                ]
+                row["max"] = max(max_values) if max_values else None
+            if _want_last_reset:
+                row["last_reset"] = last_stat.get("last_reset")
+            if _want_state:
+                row["state"] = last_stat.get("state")
+            if _want_sum:
+                row["sum"] = last_stat["sum"]
+            rows.append(row)
+            idx = end_idx
 
     return result
 
@@ -1002,10 +1185,8 @@ def _reduce_statistics_per_day(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to daily statistics."""
-    _same_day_ts, _day_start_end_ts = reduce_day_ts_factory()
-    return _reduce_statistics(
-        stats, _same_day_ts, _day_start_end_ts, timedelta(days=1), types
-    )
+    _, _day_start_end_ts = reduce_day_ts_factory()
+    return _reduce_statistics(stats, _day_start_end_ts, types)
 
 
 def reduce_week_ts_factory() -> (
@@ -1052,10 +1233,8 @@ def _reduce_statistics_per_week(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to weekly statistics."""
-    _same_week_ts, _week_start_end_ts = reduce_week_ts_factory()
-    return _reduce_statistics(
-        stats, _same_week_ts, _week_start_end_ts, timedelta(days=7), types
-    )
+    _, _week_start_end_ts = reduce_week_ts_factory()
+    return _reduce_statistics(stats, _week_start_end_ts, types)
 
 
 def _find_month_end_time(timestamp: datetime) -> datetime:
@@ -1107,10 +1286,8 @@ def _reduce_statistics_per_month(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to monthly statistics."""
-    _same_month_ts, _month_start_end_ts = reduce_month_ts_factory()
-    return _reduce_statistics(
-        stats, _same_month_ts, _month_start_end_ts, timedelta(days=31), types
-    )
+    _, _month_start_end_ts = reduce_month_ts_factory()
+    return _reduce_statistics(stats, _month_start_end_ts, types)
 
 
 def _generate_statistics_during_period_stmt(
@@ -1768,12 +1945,26 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    # Use the coarsest rollup which gives the same result as reducing the
+    # hourly statistics. The mean of a week can't be calculated from daily
+    # means, since the days don't necessarily have the same number of hours.
+    rollup_table: type[StatisticsBase] | None = None
+    if period == "day" or (period == "week" and "mean" not in types):
+        rollup_table = StatisticsDaily
+    elif period == "month":
+        rollup_table = StatisticsMonthly
+
+    if rollup_table is not None:
+        stats = _get_rollup_and_hourly_statistics(
+            session, start_time, end_time, metadata_ids, rollup_table, types
+        )
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
     if not stats:
         return {}
@@ -1807,6 +1998,57 @@ def _statistics_during_period_with_session(
     return result
 
 
+def _get_rollup_and_hourly_statistics(
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    metadata_ids: list[int] | None,
+    rollup_table: type[StatisticsBase],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> Sequence[Row]:
+    """Fetch rollup statistics where compiled and hourly statistics after that.
+
+    start_time and end_time must be aligned with the rollup periods. The rows
+    are ordered by metadata_id and start_ts, reducing them gives the same
+    result as reducing the hourly statistics.
+    """
+    rollup_end_ts = _get_rollup_end_ts(
+        session, rollup_table, _rollup_period_start_end(rollup_table)
+    )
+    if rollup_end_ts is None or rollup_end_ts <= start_time.timestamp():
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, Statistics, types
+        )
+        return cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
+
+    rollup_end_time = dt_util.utc_from_timestamp(rollup_end_ts)
+    if end_time is not None and end_time <= rollup_end_time:
+        rollup_end_time = end_time
+    stmt = _generate_statistics_during_period_stmt(
+        start_time, rollup_end_time, metadata_ids, rollup_table, types
+    )
+    stats = cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    )
+    if end_time is not None and end_time <= rollup_end_time:
+        return stats
+
+    stmt = _generate_statistics_during_period_stmt(
+        rollup_end_time, end_time, metadata_ids, Statistics, types
+    )
+    hourly_stats = cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    )
+    if not stats:
+        return hourly_stats
+    if not hourly_stats:
+        return stats
+    # The sort is stable, so the rollup rows stay ahead of the hourly rows
+    return sorted([*stats, *hourly_stats], key=itemgetter(0))
+
+
 def statistics_during_period(
     hass: HomeAssistant,
     start_time: datetime,
@@ -2340,13 +2582,22 @@ def _import_statistics_with_session(
     _, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    start_times_ts: list[float] = []
     for stat in statistics:
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat)
+        start_times_ts.append(stat["start"].timestamp())
 
     if table != StatisticsShortTerm:
+        if table == Statistics and start_times_ts:
+            # Keep already compiled rollups consistent with the imported statistics
+            end_time_ts = max(start_times_ts) + Statistics.duration.total_seconds()
+            for rollup_table in ROLLUP_STATISTICS_TABLES:
+                _recompile_rollup_statistics(
+                    session, rollup_table, metadata_id, min(start_times_ts), end_time_ts
+                )
         return True
 
     # We just inserted new short term statistics, so we need to update the
@@ -2476,9 +2727,46 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        _adjust_rollup_sum_statistics(
+            session,
+            metadata[statistic_id][0],
+            start_time.replace(minute=0).timestamp(),
+            sum_adjustment,
+        )
+
     return True
 
 
+def _adjust_rollup_sum_statistics(
+    session: Session,
+    metadata_id: int,
+    start_time_ts: float,
+    adj: float,
+) -> None:
+    """Adjust the sum of compiled rollups after adjusting hourly statistics.
+
+    The rollups of periods after the adjusted one have all their hourly statistics
+    adjusted, so their sum is adjusted too. The rollup of the period containing
+    start_time_ts is recompiled from the hourly statistics.
+    """
+    for table in ROLLUP_STATISTICS_TABLES:
+        period_start_end = _rollup_period_start_end(table)
+        rollup_end_ts = _get_rollup_end_ts(session, table, period_start_end)
+        if rollup_end_ts is None or start_time_ts >= rollup_end_ts:
+            continue
+        period_start_ts, period_end_ts = period_start_end(start_time_ts)
+        _adjust_sum_statistics(
+            session,
+            table,
+            metadata_id,
+            dt_util.utc_from_timestamp(period_end_ts),
+            adj,
+        )
+        _recompile_rollup_statistics(
+            session, table, metadata_id, period_start_ts, period_end_ts
+        )
+
+
 def _change_statistics_unit_for_table(
     session: Session,
     table: type[StatisticsBase],
@@ -2536,6 +2824,7 @@ def change_statistics_unit(
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
+            *ROLLUP_STATISTICS_TABLES,
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
@@ -63,7 +63,36 @@ class BaseLRUTableManager[_DataT](BaseTableManager[_DataT]):
         and evict the least recently used items when the cache is full.
         """
         super().__init__(recorder)
-        self._id_map = LRU(lru_size)
+        self._evictions = 0
+        self._id_map = LRU(lru_size, self._lru_evicted)
+
+    def _lru_evicted(self, key: EventType[Any] | str, value: int) -> None:
+        """Count an item evicted from the LRU cache."""
+        self._evictions += 1
+
+    def get_cache_stats(self) -> dict[str, int]:
+        """Return the hit, miss and eviction counters of the LRU cache.
+
+        The counters are reset when the manager is reset.
+        """
+        lru = self._id_map
+        hits, misses = lru.get_stats()
+        return {
+            "hits": hits,
+            "misses": misses,
+            "evictions": self._evictions,
+            "size": len(lru),
+            "max_size": lru.get_size(),
+        }
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._evictions = 0
 
     def adjust_lru_size(self, new_size: int) -> None:
         """Adjust the LRU cache size.
@@ -11,9 +11,31 @@ class StatesManager:
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
         self._pending: dict[str, States] = {}
+        self._pending_followers: set[str] = set()
         self._last_committed_id: dict[str, int] = {}
         self._last_reported: dict[int, float] = {}
 
+    def get_pending(self, entity_id: str) -> States | None:
+        """Get a pending state without removing it.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return self._pending.get(entity_id)
+
+    def get_pending_follower(self, entity_id: str) -> States | None:
+        """Get a pending state that follows another pending state.
+
+        The state is neither the first state of the entity since the last
+        commit nor referenced by another state yet, so it can be overwritten.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if entity_id in self._pending_followers:
+            return self._pending[entity_id]
+        return None
+
     def pop_pending(self, entity_id: str) -> States | None:
         """Pop a pending state.
 
@@ -22,6 +44,7 @@ class StatesManager:
         This call is not thread-safe and must be called from the
         recorder thread.
         """
+        self._pending_followers.discard(entity_id)
         return self._pending.pop(entity_id, None)
 
     def pop_committed(self, entity_id: str) -> int | None:
@@ -35,15 +58,20 @@ class StatesManager:
         """
         return self._last_committed_id.pop(entity_id, None)
 
-    def add_pending(self, entity_id: str, state: States) -> None:
+    def add_pending(
+        self, entity_id: str, state: States, follows_pending: bool = False
+    ) -> None:
         """Add a pending state.
 
         Pending states are states that are in the session but not yet committed.
+        If follows_pending is True the old state of the state is also pending.
 
         This call is not thread-safe and must be called from the
         recorder thread.
         """
         self._pending[entity_id] = state
+        if follows_pending:
+            self._pending_followers.add(entity_id)
 
     def update_pending_last_reported(
         self, state_id: int, last_reported_timestamp: float
@@ -64,6 +92,7 @@ class StatesManager:
         for entity_id, db_states in self._pending.items():
             self._last_committed_id[entity_id] = db_states.state_id
         self._pending.clear()
+        self._pending_followers.clear()
         self._last_reported.clear()
 
     def reset(self) -> None:
@@ -74,6 +103,7 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._pending_followers.clear()
 
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
@@ -19,6 +19,7 @@ from homeassistant.components.recorder import (
     history,
     statistics,
 )
+from homeassistant.components.recorder.db_schema import StatisticsShortTerm
 from homeassistant.components.recorder.models import (
     StatisticData,
     StatisticMetaData,
@@ -26,12 +27,20 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_CHANGED,
     REVOLUTIONS_PER_MINUTE,
     UnitOfIrradiance,
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, callback, split_entity_id
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.entity import entity_sources
@@ -78,6 +87,13 @@ WARN_UNSUPPORTED_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unsupported_u
 WARN_UNSTABLE_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unstable_unit")
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# Running mean, min and max of sensor states per short term statistics period
+STATISTICS_ACCUMULATORS: HassKey[SensorStatisticsAccumulators] = HassKey(
+    f"{DOMAIN}_statistics_accumulators"
+)
+SHORT_TERM_PERIOD_SECONDS = StatisticsShortTerm.duration.total_seconds()
+# Number of finished periods kept per sensor in case compiling falls behind
+MAX_ACCUMULATED_PERIODS = 12
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -90,13 +106,20 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     return [
         state
         for state in hass.states.all(DOMAIN)
-        if (state_class := state.attributes.get(ATTR_STATE_CLASS))
+        if _has_state_class(state)
+        and (not entity_filter or entity_filter(state.entity_id))
+    ]
+
+
+def _has_state_class(state: State) -> bool:
+    """Return if the sensor has a valid state class."""
+    return bool(
+        (state_class := state.attributes.get(ATTR_STATE_CLASS))
         and (
             type(state_class) is SensorStateClass
             or try_parse_enum(SensorStateClass, state_class)
         )
-        and (not entity_filter or entity_filter(state.entity_id))
-    ]
+    )
 
 
 def _time_weighted_average(
@@ -283,6 +306,257 @@ def _normalize_states(
     return statistics_unit, valid_fstates
 
 
+class _StatisticsAccumulator:
+    """Accumulate the time weighted mean, min and max of a sensor.
+
+    The result is the same as _time_weighted_average, min and max over the
+    history of the period, including the state at the start of the period.
+    """
+
+    __slots__ = (
+        "carry",
+        "finished",
+        "max",
+        "min",
+        "mixed_units",
+        "period_start",
+        "start",
+        "unit",
+        "valid_from",
+        "value",
+        "value_ts",
+        "weighted",
+    )
+
+    start: float
+    value: float | None
+    value_ts: float
+    weighted: float
+    min: float
+    max: float
+    unit: str | None
+    mixed_units: bool
+
+    def __init__(self, period_start: float, valid_from: float) -> None:
+        """Initialize the accumulator."""
+        self.period_start = period_start
+        self.valid_from = valid_from
+        # The last state if it was numeric, it starts the next period
+        self.carry: tuple[float, str | None] | None = None
+        # Finished periods by start timestamp, None if there were no numeric states
+        self.finished: dict[float, tuple[float, float, float, str | None] | None] = {}
+        self._reset()
+
+    def _reset(self) -> None:
+        """Start a new period."""
+        self.start = self.period_start
+        self.value = None
+        self.value_ts = self.period_start
+        self.weighted = 0.0
+        self.min = self.max = 0.0
+        self.unit = None
+        self.mixed_units = False
+
+    def _add(self, value: float, unit: str | None, timestamp: float) -> None:
+        """Add a numeric state."""
+        if self.value is None:
+            # Adjust start time, if there was no last known state
+            self.start = timestamp
+            self.min = self.max = value
+            self.unit = unit
+        else:
+            self.weighted += self.value * (timestamp - self.value_ts)
+            if value < self.min:
+                self.min = value
+            elif value > self.max:
+                self.max = value
+            if unit != self.unit:
+                self.mixed_units = True
+        self.value = value
+        self.value_ts = timestamp
+
+    def _finish(self) -> tuple[float, float, float, str | None] | None:
+        """Return the mean, min, max and unit of the current period."""
+        if self.value is None:
+            return None
+        end = self.period_start + SHORT_TERM_PERIOD_SECONDS
+        if not (period_seconds := end - self.start):
+            # Same as _time_weighted_average, the only state
+            # was at the exact end of the period
+            return (0.0, self.min, self.max, self.unit)
+        weighted = self.weighted + self.value * (end - self.value_ts)
+        return (weighted / period_seconds, self.min, self.max, self.unit)
+
+    def roll(self, timestamp: float) -> None:
+        """Finish all periods which end at or before timestamp."""
+        if timestamp < self.period_start + SHORT_TERM_PERIOD_SECONDS:
+            return
+        finished = self.finished
+        if self.mixed_units:
+            finished.pop(self.period_start, None)
+        else:
+            finished[self.period_start] = self._finish()
+        next_start = timestamp - timestamp % SHORT_TERM_PERIOD_SECONDS
+        period_start = max(
+            self.period_start + SHORT_TERM_PERIOD_SECONDS,
+            next_start - MAX_ACCUMULATED_PERIODS * SHORT_TERM_PERIOD_SECONDS,
+        )
+        # Periods without state changes have the same value throughout
+        while period_start < next_start:
+            finished[period_start] = (
+                (self.carry[0], self.carry[0], self.carry[0], self.carry[1])
+                if self.carry
+                else None
+            )
+            period_start += SHORT_TERM_PERIOD_SECONDS
+        while len(finished) > MAX_ACCUMULATED_PERIODS:
+            del finished[next(iter(finished))]
+        self.period_start = next_start
+        self._reset()
+        if self.carry:
+            self._add(*self.carry, next_start)
+
+    def add_state(self, state: State) -> None:
+        """Add a state of the sensor."""
+        timestamp = state.last_updated_timestamp
+        if timestamp < self.value_ts:
+            # States arrived out of order, the periods seen so
+            # far can no longer be trusted
+            self.valid_from = self.period_start + SHORT_TERM_PERIOD_SECONDS
+            self.finished.clear()
+            timestamp = self.value_ts
+        self.roll(timestamp)
+        try:
+            value = float(state.state)
+        except ValueError:
+            value = math.nan
+        if not math.isfinite(value):
+            # Non numeric states are not used for statistics, the
+            # previous value is weighted until the next numeric state
+            self.carry = None
+            return
+        unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        self.carry = (value, unit)
+        self._add(value, unit, timestamp)
+
+    def pop_period(
+        self, start: float, now: float
+    ) -> tuple[float, float, float, str | None] | None | UndefinedType:
+        """Return the result of a finished period or UNDEFINED if not tracked."""
+        if start < self.valid_from:
+            return UNDEFINED
+        self.roll(now)
+        if start not in self.finished:
+            return UNDEFINED
+        return self.finished.pop(start)
+
+
+class SensorStatisticsAccumulators:
+    """Track running statistics of all sensors from state changes.
+
+    This allows compiling short term statistics for measurement
+    sensors without querying the history of the period.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the accumulators and seed them from the state machine."""
+        self.hass = hass
+        now = dt_util.utcnow().timestamp()
+        period_start = now - now % SHORT_TERM_PERIOD_SECONDS
+        # The period in progress was not fully observed
+        self._valid_from = period_start + SHORT_TERM_PERIOD_SECONDS
+        self._accumulators: dict[str, _StatisticsAccumulator] = {}
+        for state in hass.states.async_all(DOMAIN):
+            if _has_state_class(state):
+                self._async_add_state(state)
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=self._async_state_changed_filter,
+        )
+
+    @callback
+    def _async_add_state(self, state: State) -> None:
+        """Add a state to the accumulator of the sensor."""
+        if (accumulator := self._accumulators.get(state.entity_id)) is None:
+            timestamp = state.last_updated_timestamp
+            period_start = timestamp - timestamp % SHORT_TERM_PERIOD_SECONDS
+            accumulator = _StatisticsAccumulator(
+                period_start,
+                max(self._valid_from, period_start + SHORT_TERM_PERIOD_SECONDS),
+            )
+            self._accumulators[state.entity_id] = accumulator
+        accumulator.add_state(state)
+
+    @callback
+    def _async_state_changed_filter(self, event_data: EventStateChangedData) -> bool:
+        """Filter state changes of sensors which compile statistics."""
+        entity_id = event_data["entity_id"]
+        if entity_id in self._accumulators:
+            return True
+        return (
+            entity_id.startswith("sensor.")
+            and (new_state := event_data["new_state"]) is not None
+            and _has_state_class(new_state)
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Handle a state change."""
+        new_state = event.data["new_state"]
+        if new_state is None or not _has_state_class(new_state):
+            self._accumulators.pop(event.data["entity_id"], None)
+            return
+        self._async_add_state(new_state)
+
+    @callback
+    def async_pop_period(
+        self, entity_ids: Iterable[str], start: datetime.datetime
+    ) -> dict[str, tuple[float, float, float, str | None] | None]:
+        """Return the finished statistics of a period for the tracked sensors.
+
+        Sensors missing from the result must be compiled from history.
+        """
+        start_ts = start.timestamp()
+        now = dt_util.utcnow().timestamp()
+        result: dict[str, tuple[float, float, float, str | None] | None] = {}
+        for entity_id in entity_ids:
+            if (accumulator := self._accumulators.get(entity_id)) is not None and (
+                period := accumulator.pop_period(start_ts, now)
+            ) is not UNDEFINED:
+                result[entity_id] = period
+        return result
+
+
+@callback
+def _async_pop_accumulated_statistics(
+    hass: HomeAssistant, entity_ids: list[str], start: datetime.datetime
+) -> dict[str, tuple[float, float, float, str | None] | None]:
+    """Return accumulated statistics, start accumulating on first use."""
+    if (accumulators := hass.data.get(STATISTICS_ACCUMULATORS)) is None:
+        hass.data[STATISTICS_ACCUMULATORS] = SensorStatisticsAccumulators(hass)
+        return {}
+    return accumulators.async_pop_period(entity_ids, start)
+
+
+def _get_accumulated_statistics(
+    hass: HomeAssistant,
+    entity_ids: list[str],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> dict[str, tuple[float, float, float, str | None] | None]:
+    """Get accumulated statistics of a short term period from the event loop."""
+    if not entity_ids or (end - start).total_seconds() != SHORT_TERM_PERIOD_SECONDS:
+        return {}
+    try:
+        return run_callback_threadsafe(
+            hass.loop, _async_pop_accumulated_statistics, hass, entity_ids, start
+        ).result()
+    except RuntimeError:
+        # Called from the event loop or Home Assistant is shutting down
+        return {}
+
+
 def _suggest_report_issue(hass: HomeAssistant, entity_id: str) -> str:
     """Suggest to report an issue."""
     entity_info = entity_sources(hass).get(entity_id)
@@ -432,6 +706,22 @@ def compile_statistics(  # noqa: C901
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
     ]
+    # Measurement sensors only need the mean, min and max which are
+    # accumulated from the state changes when possible
+    accumulated = _get_accumulated_statistics(
+        hass, entities_significant_history, start, end
+    )
+    for _state in sensor_states:
+        unit = _state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        if (period := accumulated.get(_state.entity_id)) and period[3] != unit:
+            # The unit changed, normalize the states from history instead
+            del accumulated[_state.entity_id]
+    if accumulated:
+        entities_significant_history = [
+            entity_id
+            for entity_id in entities_significant_history
+            if entity_id not in accumulated
+        ]
     if entities_significant_history:
         _history_list = history.get_full_significant_states_with_session(
             hass,
@@ -445,6 +735,16 @@ def compile_statistics(  # noqa: C901
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if entity_id in accumulated:
+            if period := accumulated[entity_id]:
+                # Normalized together so the mean, min and max are
+                # converted to the statistics unit like the states are
+                entities_with_float_states[entity_id] = [
+                    (period[0], _state),
+                    (period[1], _state),
+                    (period[2], _state),
+                ]
+            continue
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
         if not (entity_history := history_list.get(entity_id, [_state])):
@@ -525,6 +825,14 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
+        if accumulated.get(entity_id):
+            (mean, _), (min_, _), (max_, _) = valid_float_states
+            stat["mean"] = mean
+            stat["min"] = min_
+            stat["max"] = max_
+            result.append({"meta": meta, "stat": stat})
+            continue
+
         if "max" in wanted_statistics[entity_id]:
             stat["max"] = max(
                 *itertools.islice(zip(*valid_float_states, strict=False), 1)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from contextlib import suppress
 from functools import lru_cache, partial
 import json
 import logging
@@ -55,6 +56,7 @@ from homeassistant.helpers.json import (
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import (
     IntegrationNotFound,
+    async_get_import_timings,
     async_get_integration,
     async_get_integration_descriptions,
     async_get_integrations,
@@ -64,7 +66,12 @@ from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
 from .connection import ActiveConnection
+from .entity_subscriptions import EntitySubscription, async_get_entity_subscriptions
 from .messages import construct_result_message
+from .states_snapshot import (
+    async_get_compressed_states_snapshot,
+    async_get_states_snapshot,
+)
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
 
@@ -86,6 +93,7 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_import_info)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -309,12 +317,17 @@ async def handle_call_service(
         connection.send_error(msg["id"], const.ERR_UNKNOWN_ERROR, str(err))
 
 
+@callback
+def _async_can_read_all_entities(user: User) -> bool:
+    """Return if the user can read all entities."""
+    return user.is_admin or user.permissions.access_all_entities(POLICY_READ)
+
+
 @callback
 def _async_get_allowed_states(
     hass: HomeAssistant, connection: ActiveConnection
 ) -> list[State]:
-    user = connection.user
-    if user.is_admin or user.permissions.access_all_entities(POLICY_READ):
+    if _async_can_read_all_entities(connection.user):
         return hass.states.async_all()
     entity_perm = connection.user.permissions.check_entity
     return [
@@ -330,6 +343,16 @@ def handle_get_states(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
+    if _async_can_read_all_entities(connection.user):
+        # Share the serialized states between all connections
+        try:
+            snapshot = async_get_states_snapshot(hass).async_get()
+        except (ValueError, TypeError):
+            pass
+        else:
+            _send_handle_get_states_response(connection, msg["id"], [snapshot])
+            return
+
     states = _async_get_allowed_states(hass, connection)
 
     try:
@@ -367,38 +390,14 @@ def _send_handle_get_states_response(
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
-
-
 @callback
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("coalesce_ms"): vol.All(
+            vol.Coerce(int), vol.Range(min=10, max=1000)
+        ),
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
@@ -409,25 +408,40 @@ def handle_subscribe_entities(
     entity_ids = set(msg.get("entity_ids", [])) or None
     _filter = convert_include_exclude_filter(msg)
     entity_filter = None if _filter.empty_filter else _filter.get_filter()
+    coalesce_interval = (
+        coalesce_ms / 1000 if (coalesce_ms := msg.get("coalesce_ms")) else None
+    )
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
+    snapshot: bytes | None = None
+    if (
+        not entity_ids
+        and not entity_filter
+        and _async_can_read_all_entities(connection.user)
+    ):
+        # Share the serialized states between all connections
+        with suppress(ValueError, TypeError):
+            snapshot = async_get_compressed_states_snapshot(hass).async_get()
+    states = _async_get_allowed_states(hass, connection) if snapshot is None else []
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
+    connection.subscriptions[msg_id] = async_get_entity_subscriptions(hass).async_add(
+        EntitySubscription(
             connection.send_message,
-            entity_ids,
             entity_filter,
             connection.user,
             message_id_as_bytes,
+            coalesce_interval,
         ),
+        entity_ids,
     )
     connection.send_result(msg_id)
 
+    if snapshot is not None:
+        _send_handle_entities_init_response(connection, message_id_as_bytes, [snapshot])
+        return
+
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
@@ -570,6 +584,21 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/import_info"})
+def handle_integration_import_info(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle import timings command."""
+    connection.send_result(
+        msg["id"],
+        [
+            {"module": module, "seconds": seconds}
+            for module, seconds in async_get_import_timings(hass).items()
+        ],
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
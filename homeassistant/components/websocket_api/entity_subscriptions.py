@@ -0,0 +1,274 @@
+"""Shared fan-out of state changes to subscribe_entities subscriptions."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions import AbstractPermissions
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.device_registry import (
+    EVENT_DEVICE_REGISTRY_UPDATED,
+    EventDeviceRegistryUpdatedData,
+)
+from homeassistant.helpers.entity_registry import (
+    EVENT_ENTITY_REGISTRY_UPDATED,
+    EventEntityRegistryUpdatedData,
+)
+from homeassistant.util.hass_dict import HassKey
+
+from . import messages
+
+DATA_ENTITY_SUBSCRIPTIONS: HassKey[EntitySubscriptions] = HassKey(
+    "websocket_api_entity_subscriptions"
+)
+
+
+@dataclass(slots=True)
+class EntitySubscription:
+    """A subscribe_entities subscription of a connection."""
+
+    send_message: Callable[[bytes | str | dict[str, Any]], None]
+    entity_filter: Callable[[str], bool] | None
+    user: User
+    message_id_as_bytes: bytes
+    coalesce_interval: float | None = None
+    filter_results: dict[str, bool] = field(default_factory=dict)
+    pending_changes: dict[str, tuple[State | None, State | None]] = field(
+        default_factory=dict
+    )
+    flush_handle: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_matches(self, entity_id: str) -> bool:
+        """Return if the entity filter of the subscription matches the entity.
+
+        Filters never change for the lifetime of a subscription so the
+        result is cached per entity_id.
+        """
+        if (entity_filter := self.entity_filter) is None:
+            return True
+        if (matches := self.filter_results.get(entity_id)) is None:
+            matches = self.filter_results[entity_id] = entity_filter(entity_id)
+        return matches
+
+    @callback
+    def async_coalesce(
+        self, hass: HomeAssistant, event: Event[EventStateChangedData]
+    ) -> None:
+        """Coalesce a state change until the end of the coalesce interval.
+
+        Only the state before the first and after the last state change
+        of each entity are kept so a single diff is sent per entity.
+        """
+        data = event.data
+        entity_id = data["entity_id"]
+        if (pending := self.pending_changes.get(entity_id)) is None:
+            self.pending_changes[entity_id] = (data["old_state"], data["new_state"])
+        else:
+            self.pending_changes[entity_id] = (pending[0], data["new_state"])
+        if self.flush_handle is None:
+            assert self.coalesce_interval is not None
+            self.flush_handle = hass.loop.call_later(
+                self.coalesce_interval, self.async_flush
+            )
+
+    @callback
+    def async_flush(self) -> None:
+        """Send the coalesced state changes."""
+        self.flush_handle = None
+        pending_changes = self.pending_changes
+        self.pending_changes = {}
+        if message := messages.coalesced_state_diff_message(
+            self.message_id_as_bytes, pending_changes
+        ):
+            self.send_message(message)
+
+    @callback
+    def async_cancel_flush(self) -> None:
+        """Cancel sending the coalesced state changes."""
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        self.pending_changes.clear()
+
+
+@dataclass(slots=True)
+class _UserReadPermissions:
+    """Cached read permission decisions of a user."""
+
+    permissions: AbstractPermissions
+    read_all: bool
+    entities: dict[str, bool] = field(default_factory=dict)
+
+
+class EntitySubscriptions:
+    """Forward state changes to all subscribe_entities subscriptions.
+
+    A single state changed listener is shared by all subscriptions.
+    Subscriptions with entity_ids are indexed by entity_id so a state
+    change only visits the subscriptions that can match it, and the
+    state diff is serialized once per event for all of them.
+    Subscriptions with a coalesce interval get one merged diff per
+    interval instead.
+    """
+
+    __slots__ = (
+        "hass",
+        "_by_entity_id",
+        "_all_entities",
+        "_permissions",
+        "_listeners",
+    )
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the entity subscriptions."""
+        self.hass = hass
+        self._by_entity_id: defaultdict[str, list[EntitySubscription]] = defaultdict(
+            list
+        )
+        self._all_entities: list[EntitySubscription] = []
+        self._permissions: dict[str, _UserReadPermissions] = {}
+        self._listeners: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_add(
+        self, subscription: EntitySubscription, entity_ids: set[str] | None
+    ) -> CALLBACK_TYPE:
+        """Add a subscription and return a callback to remove it."""
+        if not self._listeners:
+            self._async_start()
+        if entity_ids:
+            for entity_id in entity_ids:
+                self._by_entity_id[entity_id].append(subscription)
+        else:
+            self._all_entities.append(subscription)
+
+        @callback
+        def _async_remove() -> None:
+            """Remove the subscription."""
+            if entity_ids:
+                for entity_id in entity_ids:
+                    subscriptions = self._by_entity_id[entity_id]
+                    subscriptions.remove(subscription)
+                    if not subscriptions:
+                        del self._by_entity_id[entity_id]
+            else:
+                self._all_entities.remove(subscription)
+            subscription.async_cancel_flush()
+            if not self._by_entity_id and not self._all_entities:
+                self._async_stop()
+
+        return _async_remove
+
+    @callback
+    def _async_start(self) -> None:
+        """Start listening for state changes."""
+        bus = self.hass.bus
+        self._listeners = [
+            bus.async_listen(EVENT_STATE_CHANGED, self._async_forward),
+            bus.async_listen(
+                EVENT_ENTITY_REGISTRY_UPDATED, self._async_clear_entity_permissions
+            ),
+            bus.async_listen(
+                EVENT_DEVICE_REGISTRY_UPDATED, self._async_clear_entity_permissions
+            ),
+        ]
+
+    @callback
+    def _async_stop(self) -> None:
+        """Stop listening for state changes once there are no subscriptions."""
+        for unsub in self._listeners:
+            unsub()
+        self._listeners = []
+        self._permissions.clear()
+
+    @callback
+    def _async_clear_entity_permissions(
+        self,
+        event: Event[EventEntityRegistryUpdatedData]
+        | Event[EventDeviceRegistryUpdatedData],
+    ) -> None:
+        """Clear the cached entity permissions.
+
+        Entity permissions can be granted by device or area so they
+        depend on the entity and device registries.
+        """
+        for user_permissions in self._permissions.values():
+            user_permissions.entities.clear()
+
+    @callback
+    def _async_can_read(self, user: User, entity_id: str) -> bool:
+        """Return if the user can read the entity.
+
+        The decision is cached per user until the permissions of the
+        user change, which replaces the user's permissions object.
+        """
+        permissions = user.permissions
+        user_permissions = self._permissions.get(user.id)
+        if user_permissions is None or user_permissions.permissions is not permissions:
+            user_permissions = self._permissions[user.id] = _UserReadPermissions(
+                permissions,
+                user.is_admin or permissions.access_all_entities(POLICY_READ),
+            )
+        if user_permissions.read_all:
+            return True
+        entities = user_permissions.entities
+        if (can_read := entities.get(entity_id)) is None:
+            can_read = entities[entity_id] = permissions.check_entity(
+                entity_id, POLICY_READ
+            )
+        return can_read
+
+    @callback
+    def _async_forward(self, event: Event[EventStateChangedData]) -> None:
+        """Forward a state change to the matching subscriptions."""
+        entity_id = event.data["entity_id"]
+        partial_message: bytes | None = None
+        for subscriptions in (
+            self._by_entity_id.get(entity_id, ()),
+            self._all_entities,
+        ):
+            for subscription in subscriptions:
+                if not subscription.async_matches(
+                    entity_id
+                ) or not self._async_can_read(subscription.user, entity_id):
+                    continue
+                if subscription.coalesce_interval is not None:
+                    subscription.async_coalesce(self.hass, event)
+                    continue
+                if partial_message is None:
+                    partial_message = messages.partial_state_diff_message(event)
+                subscription.send_message(
+                    b"".join(
+                        (
+                            partial_message,
+                            b',"id":',
+                            subscription.message_id_as_bytes,
+                            b"}",
+                        )
+                    )
+                )
+
+
+@callback
+def async_get_entity_subscriptions(hass: HomeAssistant) -> EntitySubscriptions:
+    """Return the shared entity subscriptions."""
+    if (entity_subscriptions := hass.data.get(DATA_ENTITY_SUBSCRIPTIONS)) is None:
+        entity_subscriptions = hass.data[DATA_ENTITY_SUBSCRIPTIONS] = (
+            EntitySubscriptions(hass)
+        )
+    return entity_subscriptions
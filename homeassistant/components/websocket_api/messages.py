@@ -15,7 +15,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
-from homeassistant.core import CompressedState, Event, EventStateChangedData
+from homeassistant.core import CompressedState, Event, EventStateChangedData, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.json import (
     JSON_DUMP,
@@ -154,7 +154,7 @@ def cached_state_diff_message(
     """
     return b"".join(
         (
-            _partial_cached_state_diff_message(event)[:-1],
+            partial_state_diff_message(event),
             b',"id":',
             message_id_as_bytes,
             b"}",
@@ -162,6 +162,15 @@ def cached_state_diff_message(
     )
 
 
+def partial_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
+    """Return the serialized state diff message without the id.
+
+    The closing brace is left off so the id can be appended by
+    the caller.
+    """
+    return _partial_cached_state_diff_message(event)[:-1]
+
+
 @lru_cache(maxsize=128)
 def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
     """Cache and serialize the event to json.
@@ -199,6 +208,13 @@ def _state_diff_event(
         return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
     if (old_state := event.data["old_state"]) is None:
         return {ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}}
+    return {
+        ENTITY_EVENT_CHANGE: {new_state.entity_id: _state_diff(old_state, new_state)}
+    }
+
+
+def _state_diff(old_state: State, new_state: State) -> dict[str, dict[str, Any]]:
+    """Return the diff between two states of an entity."""
     additions: dict[str, Any] = {}
     diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
     new_state_context = new_state.context
@@ -235,7 +251,56 @@ def _state_diff_event(
             # here if there are any values to avoid jumping into the json_encoder_default
             # for every state diff with a removed attribute
             diff[STATE_DIFF_REMOVALS] = {COMPRESSED_STATE_ATTRIBUTES: list(removed)}
-    return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
+    return diff
+
+
+def coalesced_state_diff_message(
+    message_id_as_bytes: bytes,
+    changes: dict[str, tuple[State | None, State | None]],
+) -> bytes | None:
+    """Return one state diff message for the changes of several entities.
+
+    The changes map each entity_id to its state before the first and
+    after the last state change that was coalesced. Returns None if the
+    changes cancel out.
+    """
+    additions: dict[str, CompressedState] = {}
+    changed: dict[str, dict[str, dict[str, Any]]] = {}
+    removals: list[str] = []
+    for entity_id, (old_state, new_state) in changes.items():
+        if new_state is None:
+            if old_state is not None:
+                removals.append(entity_id)
+        elif old_state is None:
+            additions[entity_id] = new_state.as_compressed_state
+        else:
+            diff = _state_diff(old_state, new_state)
+            diff_additions = diff[STATE_DIFF_ADDITIONS]
+            if (
+                COMPRESSED_STATE_LAST_CHANGED in diff_additions
+                and new_state.last_updated != new_state.last_changed
+            ):
+                # The state changed and was then updated again in the window,
+                # a diff with only last_changed implies last_updated is equal
+                diff_additions[COMPRESSED_STATE_LAST_UPDATED] = (
+                    new_state.last_updated_timestamp
+                )
+            if diff_additions or STATE_DIFF_REMOVALS in diff:
+                changed[entity_id] = diff
+    event: dict[str, Any] = {}
+    if additions:
+        event[ENTITY_EVENT_ADD] = additions
+    if changed:
+        event[ENTITY_EVENT_CHANGE] = changed
+    if removals:
+        event[ENTITY_EVENT_REMOVE] = removals
+    if not event:
+        return None
+    partial_message = (
+        _message_to_json_bytes_or_none({"type": "event", "event": event})
+        or INVALID_JSON_PARTIAL_MESSAGE
+    )
+    return b"".join((partial_message[:-1], b',"id":', message_id_as_bytes, b"}"))
 
 
 def _message_to_json_bytes_or_none(message: dict[str, Any]) -> bytes | None:
@@ -0,0 +1,91 @@
+"""Incrementally maintained snapshot of the serialized states."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from operator import attrgetter
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.util.hass_dict import HassKey
+
+DATA_STATES_SNAPSHOT: HassKey[StatesSnapshot] = HassKey("websocket_api_states_snapshot")
+DATA_COMPRESSED_STATES_SNAPSHOT: HassKey[StatesSnapshot] = HassKey(
+    "websocket_api_compressed_states_snapshot"
+)
+
+
+class StatesSnapshot:
+    """Keep the serialized states of all entities ready to send.
+
+    State changes only mark the entity as changed. The changed entities
+    are serialized the next time the snapshot is requested and the
+    joined snapshot is reused until the next state change, so many
+    clients connecting at once share a single serialization.
+    """
+
+    __slots__ = ("_serialize", "_serialized", "_changed", "_joined")
+
+    def __init__(
+        self, hass: HomeAssistant, serialize: Callable[[State], bytes]
+    ) -> None:
+        """Initialize the snapshot."""
+        self._serialize = serialize
+        self._serialized: dict[str, bytes] = {}
+        self._changed: dict[str, State | None] = {
+            state.entity_id: state for state in hass.states.async_all()
+        }
+        self._joined: bytes | None = None
+        hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Mark the entity of a state change as changed."""
+        self._changed[event.data["entity_id"]] = event.data["new_state"]
+        self._joined = None
+
+    @callback
+    def async_get(self) -> bytes:
+        """Return the serialized states of all entities joined by commas.
+
+        Raises ValueError or TypeError if a state cannot be serialized.
+        """
+        if (joined := self._joined) is not None:
+            return joined
+        serialize = self._serialize
+        serialized = self._serialized
+        changed = self._changed
+        for entity_id in list(changed):
+            if (state := changed[entity_id]) is None:
+                serialized.pop(entity_id, None)
+            else:
+                serialized[entity_id] = serialize(state)
+            del changed[entity_id]
+        joined = self._joined = b",".join(serialized.values())
+        return joined
+
+
+@callback
+def async_get_states_snapshot(hass: HomeAssistant) -> StatesSnapshot:
+    """Return the snapshot of the states serialized as dicts."""
+    if (snapshot := hass.data.get(DATA_STATES_SNAPSHOT)) is None:
+        snapshot = hass.data[DATA_STATES_SNAPSHOT] = StatesSnapshot(
+            hass, attrgetter("as_dict_json")
+        )
+    return snapshot
+
+
+@callback
+def async_get_compressed_states_snapshot(hass: HomeAssistant) -> StatesSnapshot:
+    """Return the snapshot of the states serialized as compressed states."""
+    if (snapshot := hass.data.get(DATA_COMPRESSED_STATES_SNAPSHOT)) is None:
+        snapshot = hass.data[DATA_COMPRESSED_STATES_SNAPSHOT] = StatesSnapshot(
+            hass, attrgetter("as_compressed_state_json")
+        )
+    return snapshot
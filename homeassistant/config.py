@@ -74,6 +74,7 @@ from .util.hass_dict import HassKey
 from .util.package import is_docker_env
 from .util.unit_system import get_unit_system, validate_unit_system
 from .util.yaml import SECRET_YAML, Secrets, YamlTypeError, load_yaml_dict
+from .util.yaml.loader import save_parse_cache
 from .util.yaml.objects import NodeStrClass
 
 _LOGGER = logging.getLogger(__name__)
@@ -517,6 +518,8 @@ def load_yaml_config_file(
         _LOGGER.error(msg)
         raise HomeAssistantError(msg) from exc
 
+    save_parse_cache()
+
     # Convert values to dictionaries if they are None
     for key, value in conf_dict.items():
         conf_dict[key] = value or {}
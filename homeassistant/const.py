@@ -19,7 +19,11 @@ from .util.hass_dict import HassKey
 from .util.signal_type import SignalType
 
 if TYPE_CHECKING:
-    from .core import EventStateChangedData, EventStateReportedData
+    from .core import (
+        EventStateChangedBatchData,
+        EventStateChangedData,
+        EventStateReportedData,
+    )
     from .helpers.typing import NoEventData
 
 APPLICATION_NAME: Final = "HomeAssistant"
@@ -326,6 +330,9 @@ EVENT_LOGGING_CHANGED: Final = "logging_changed"
 EVENT_SERVICE_REGISTERED: Final = "service_registered"
 EVENT_SERVICE_REMOVED: Final = "service_removed"
 EVENT_STATE_CHANGED: EventType[EventStateChangedData] = EventType("state_changed")
+EVENT_STATE_CHANGED_BATCH: EventType[EventStateChangedBatchData] = EventType(
+    "state_changed_batch"
+)
 EVENT_STATE_REPORTED: EventType[EventStateReportedData] = EventType("state_reported")
 EVENT_THEMES_UPDATED: Final = "themes_updated"
 EVENT_PANELS_UPDATED: Final = "panels_updated"
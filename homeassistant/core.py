@@ -36,6 +36,7 @@ from typing import (
     Any,
     Final,
     Generic,
+    NamedTuple,
     NotRequired,
     Self,
     TypedDict,
@@ -72,6 +73,7 @@ from .const import (
     EVENT_SERVICE_REGISTERED,
     EVENT_SERVICE_REMOVED,
     EVENT_STATE_CHANGED,
+    EVENT_STATE_CHANGED_BATCH,
     EVENT_STATE_REPORTED,
     MATCH_ALL,
     MAX_EXPECTED_ENTITY_IDS,
@@ -184,6 +186,27 @@ class EventStateReportedData(EventStateEventData):
     old_last_reported: datetime.datetime
 
 
+class EventStateChangedBatchData(TypedDict):
+    """EVENT_STATE_CHANGED_BATCH data.
+
+    A state changed batch event is fired after the state_changed events
+    of states written together with StateMachine.async_set_many.
+    """
+
+    changes: list[EventStateChangedData]
+
+
+class StateUpdate(NamedTuple):
+    """A state to write with StateMachine.async_set_many."""
+
+    entity_id: str
+    state: str
+    attributes: Mapping[str, Any] | None = None
+    force_update: bool = False
+    context: Context | None = None
+    state_info: StateInfo | None = None
+
+
 # SOURCE_* are deprecated as of Home Assistant 2022.2, use ConfigSource instead
 _DEPRECATED_SOURCE_DISCOVERED = DeprecatedConstantEnum(
     ConfigSource.DISCOVERED, "2025.1"
@@ -198,6 +221,7 @@ TIMEOUT_EVENT_START = 15
 
 EVENTS_EXCLUDED_FROM_MATCH_ALL = {
     EVENT_HOMEASSISTANT_CLOSE,
+    EVENT_STATE_CHANGED_BATCH,
     EVENT_STATE_REPORTED,
 }
 
@@ -1450,6 +1474,31 @@ class _OneTimeListener(Generic[_DataT]):
 EMPTY_LIST: list[Any] = []
 
 
+def _async_match_keyed_listeners(
+    keyed_listeners: dict[str, dict[Any, list[_FilterableJobType[Any]]]],
+    event_data: Mapping[str, Any],
+) -> list[_FilterableJobType[Any]]:
+    """Return the keyed listeners matching the event data."""
+    matched: list[_FilterableJobType[Any]] = []
+    for key, listeners_by_value in keyed_listeners.items():
+        if (value := event_data.get(key)) is None:
+            # The domain is derived from the entity_id if the event
+            # data does not have one, for example for state_changed
+            if key != "domain":
+                continue
+            if not isinstance(entity_id := event_data.get("entity_id"), str):
+                continue
+            value = entity_id.partition(".")[0]
+        try:
+            listeners = listeners_by_value.get(value)
+        except TypeError:
+            # Unhashable values like lists never match a keyed filter
+            continue
+        if listeners:
+            matched.extend(listeners)
+    return matched
+
+
 @functools.lru_cache
 def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> None:
     """Verify the length of the event type and raise if too long."""
@@ -1460,7 +1509,14 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_listeners",
+        "_match_all_listeners",
+        "_keyed_listeners",
+        "_keyed_listener_count",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1468,6 +1524,12 @@ class EventBus:
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
+        # Listeners with a keyed filter by event type, data key and value
+        self._keyed_listeners: dict[
+            EventType[Any] | str,
+            dict[str, dict[Any, list[_FilterableJobType[Any]]]],
+        ] = {}
+        self._keyed_listener_count: dict[EventType[Any] | str, int] = {}
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
         self._async_logging_changed()
@@ -1484,7 +1546,10 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for key, count in self._keyed_listener_count.items():
+            listeners[key] = listeners.get(key, 0) + count
+        return listeners
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1554,6 +1619,12 @@ class EventBus:
             match_all_listeners = self._match_all_listeners
         else:
             match_all_listeners = EMPTY_LIST
+        if event_data is not None and (
+            keyed_listeners := self._keyed_listeners.get(event_type)
+        ):
+            match_all_listeners = match_all_listeners + _async_match_keyed_listeners(
+                keyed_listeners, event_data
+            )
 
         event: Event[_DataT] | None = None
         for job, event_filter in listeners + match_all_listeners:
@@ -1606,6 +1677,8 @@ class EventBus:
         listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
         event_filter: Callable[[_DataT], bool] | None = None,
         run_immediately: bool | object = _SENTINEL,
+        *,
+        keyed_filter: tuple[str, Iterable[Any]] | None = None,
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -1616,6 +1689,16 @@ class EventBus:
         @callback that returns a boolean value, determines if the
         listener callable should run.
 
+        An optional keyed_filter of a data key and the values to match,
+        for example ``("entity_id", {"light.kitchen"})``, limits the
+        listener to events where the data key has one of the values.
+        Listeners with a keyed filter are indexed by value so firing an
+        event only visits the matching listeners. The ``domain`` key is
+        derived from the ``entity_id`` when the event data has no domain.
+        Listeners with a keyed filter run after the other listeners of
+        the event type. If an event_filter is passed as well, it must
+        also match.
+
         If run_immediately is passed:
           - callbacks will be run right away instead of using call_soon.
           - coroutine functions will be scheduled eagerly.
@@ -1636,12 +1719,42 @@ class EventBus:
             raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
         filterable_job = (HassJob(listener, f"listen {event_type}"), event_filter)
         if event_type == EVENT_STATE_REPORTED:
-            if not event_filter:
+            if not event_filter and not keyed_filter:
                 raise HomeAssistantError(
                     f"Event filter is required for event {event_type}"
                 )
+        if keyed_filter is not None:
+            if event_type == MATCH_ALL:
+                raise HomeAssistantError(
+                    f"Keyed filters are not supported for event {event_type}"
+                )
+            return self._async_listen_keyed_filterable_job(
+                event_type, filterable_job, *keyed_filter
+            )
         return self._async_listen_filterable_job(event_type, filterable_job)
 
+    @callback
+    def _async_listen_keyed_filterable_job(
+        self,
+        event_type: EventType[_DataT] | str,
+        filterable_job: _FilterableJobType[_DataT],
+        key: str,
+        values: Iterable[Any],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type with a keyed filter."""
+        values = set(values)
+        listeners_by_value = self._keyed_listeners.setdefault(
+            event_type, {}
+        ).setdefault(key, {})
+        for value in values:
+            listeners_by_value.setdefault(value, []).append(filterable_job)
+        self._keyed_listener_count[event_type] = (
+            self._keyed_listener_count.get(event_type, 0) + 1
+        )
+        return functools.partial(
+            self._async_remove_keyed_listener, event_type, filterable_job, key, values
+        )
+
     @callback
     def _async_listen_filterable_job(
         self,
@@ -1742,6 +1855,40 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        filterable_job: _FilterableJobType[_DataT],
+        key: str,
+        values: set[Any],
+    ) -> None:
+        """Remove a listener with a keyed filter of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[event_type]
+            listeners_by_value = keyed_listeners[key]
+            for value in values:
+                listeners = listeners_by_value[value]
+                listeners.remove(filterable_job)
+                if not listeners:
+                    del listeners_by_value[value]
+        except (KeyError, ValueError):
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+            return
+        if not listeners_by_value:
+            del keyed_listeners[key]
+            if not keyed_listeners:
+                del self._keyed_listeners[event_type]
+        if count := self._keyed_listener_count[event_type] - 1:
+            self._keyed_listener_count[event_type] = count
+        else:
+            del self._keyed_listener_count[event_type]
+
 
 class CompressedState(TypedDict):
     """Compressed dict of a state."""
@@ -1753,6 +1900,9 @@ class CompressedState(TypedDict):
     lu: NotRequired[float]  # COMPRESSED_STATE_LAST_UPDATED
 
 
+_STATE_JSON_CACHE_KEYS = ("as_dict_json", "json_fragment", "as_compressed_state_json")
+
+
 class State:
     """Object to represent a state within the state machine.
 
@@ -2011,6 +2161,12 @@ class State:
         self.context = Context(
             self.context.user_id, self.context.parent_id, self.context.id
         )
+        # The serialized versions of a superseded state are rarely needed
+        # again so drop them instead of keeping them alive for as long as
+        # events reference the old state.
+        cache = self._cache
+        for key in _STATE_JSON_CACHE_KEYS:
+            cache.pop(key, None)
 
     def __repr__(self) -> str:
         """Return the representation of the states."""
@@ -2283,6 +2439,49 @@ class StateMachine:
             timestamp or time.time(),
         )
 
+    @callback
+    def async_set_many(
+        self,
+        updates: Iterable[StateUpdate],
+        context: Context | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Set the states of several entities at once.
+
+        The states share one timestamp. Updates without a context of their
+        own use the passed context, or a new context each if none is passed.
+        A state_changed event is fired for every changed state, followed by
+        a single state_changed_batch event with all changes.
+
+        This method must be run in the event loop.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        async_set_internal = self.async_set_internal
+        changes: list[EventStateChangedData] = [
+            change
+            for update in updates
+            if (
+                change := async_set_internal(
+                    update.entity_id.lower(),
+                    str(update.state),
+                    update.attributes or {},
+                    update.force_update,
+                    update.context or context,
+                    update.state_info,
+                    timestamp,
+                )
+            )
+        ]
+        if changes:
+            batch_data: EventStateChangedBatchData = {"changes": changes}
+            self._bus.async_fire_internal(
+                EVENT_STATE_CHANGED_BATCH,
+                batch_data,
+                context=context,
+                time_fired=timestamp,
+            )
+
     @callback
     def async_set_internal(
         self,
@@ -2293,9 +2492,11 @@ class StateMachine:
         context: Context | None,
         state_info: StateInfo | None,
         timestamp: float,
-    ) -> None:
+    ) -> EventStateChangedData | None:
         """Set the state of an entity, add entity if it does not exist.
 
+        Returns the state changed event data if the state was changed.
+
         This method is intended to only be used by core internally
         and should not be considered a stable API. We will make
         breaking changes to this function in the future and it
@@ -2352,7 +2553,7 @@ class StateMachine:
                 context=context,
                 time_fired=timestamp,
             )
-            return
+            return None
 
         if same_attr:
             if TYPE_CHECKING:
@@ -2387,6 +2588,7 @@ class StateMachine:
             context=context,
             time_fired=timestamp,
         )
+        return state_changed_data
 
 
 class SupportsResponse(enum.StrEnum):
@@ -45,9 +45,11 @@ from homeassistant.core import (
     HassJobType,
     HomeAssistant,
     ReleaseChannel,
+    StateUpdate,
     callback,
     get_hassjob_callable_job_type,
     get_release_channel,
+    validate_state,
 )
 from homeassistant.exceptions import (
     HomeAssistantError,
@@ -196,6 +198,64 @@ def get_unit_of_measurement(hass: HomeAssistant, entity_id: str) -> str | None:
     return entry.unit_of_measurement
 
 
+@callback
+def async_write_ha_states(hass: HomeAssistant, entities: Iterable[Entity]) -> None:
+    """Write the states of several entities to the state machine at once.
+
+    The states are written with StateMachine.async_set_many so they share
+    a timestamp and a single state_changed_batch event is fired. Entities
+    which override async_write_ha_state or _async_write_ha_state are
+    written one by one so the override runs.
+    """
+    if hass.loop_thread_id != threading.get_ident():
+        report_non_thread_safe_operation("async_write_ha_states")
+    updates: list[StateUpdate] = []
+    for entity in entities:
+        if not entity.hass or not entity._verified_state_writable:  # noqa: SLF001
+            entity._async_verify_state_writable()  # noqa: SLF001
+        entity_type = type(entity)
+        if (
+            entity_type.async_write_ha_state is not Entity.async_write_ha_state
+            or entity_type._async_write_ha_state  # noqa: SLF001
+            is not Entity._async_write_ha_state  # noqa: SLF001
+        ):
+            entity.async_write_ha_state()
+            continue
+        if (state_update := entity._async_calculate_state_update()) is None:  # noqa: SLF001
+            continue
+        state, attr, _ = state_update
+        try:
+            validate_state(state)
+        except InvalidStateError:
+            _LOGGER.exception(
+                "Failed to set state for %s, fall back to %s",
+                entity.entity_id,
+                STATE_UNKNOWN,
+            )
+            updates.append(
+                StateUpdate(
+                    entity.entity_id,
+                    STATE_UNKNOWN,
+                    None,
+                    entity.force_update,
+                    entity._context,  # noqa: SLF001
+                )
+            )
+            continue
+        updates.append(
+            StateUpdate(
+                entity.entity_id,
+                state,
+                attr,
+                entity.force_update,
+                entity._context,  # noqa: SLF001
+                entity._state_info,  # noqa: SLF001
+            )
+        )
+    if updates:
+        hass.states.async_set_many(updates)
+
+
 ENTITY_CATEGORIES_SCHEMA: Final = vol.Coerce(EntityCategory)
 
 
@@ -1107,9 +1167,40 @@ class Entity(
     @callback
     def _async_write_ha_state(self) -> None:
         """Write the state to the state machine."""
+        if (state_update := self._async_calculate_state_update()) is None:
+            return
+
+        hass = self.hass
+        entity_id = self.entity_id
+        state, attr, time_now = state_update
+        try:
+            hass.states.async_set_internal(
+                entity_id,
+                state,
+                attr,
+                self.force_update,
+                self._context,
+                self._state_info,
+                time_now,
+            )
+        except InvalidStateError:
+            _LOGGER.exception(
+                "Failed to set state for %s, fall back to %s", entity_id, STATE_UNKNOWN
+            )
+            hass.states.async_set(
+                entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
+            )
+
+    @callback
+    def _async_calculate_state_update(self) -> tuple[str, dict[str, Any], float] | None:
+        """Calculate the state to write to the state machine.
+
+        Returns a tuple of the state, the attributes and the time the
+        state was calculated, or None if the state should not be written.
+        """
         if self._platform_state is EntityPlatformState.REMOVED:
             # Polling returned after the entity has already been removed
-            return
+            return None
 
         hass = self.hass
         entity_id = self.entity_id
@@ -1125,7 +1216,7 @@ class Entity(
                     entity_id,
                     self.platform.platform_name,
                 )
-            return
+            return None
 
         state_calculate_start = timer()
         state, attr, capabilities, original_device_class, supported_features = (
@@ -1207,23 +1298,7 @@ class Entity(
             self._context = None
             self._context_set = None
 
-        try:
-            hass.states.async_set_internal(
-                entity_id,
-                state,
-                attr,
-                self.force_update,
-                self._context,
-                self._state_info,
-                time_now,
-            )
-        except InvalidStateError:
-            _LOGGER.exception(
-                "Failed to set state for %s, fall back to %s", entity_id, STATE_UNKNOWN
-            )
-            hass.states.async_set(
-                entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
-            )
+        return (state, attr, time_now)
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
@@ -10,12 +10,14 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import partial, wraps
 import logging
+from operator import attrgetter
 from random import randint
 import time
 from typing import TYPE_CHECKING, Any, Concatenate, Generic, TypeVar
 
 from homeassistant.const import (
     EVENT_CORE_CONFIG_UPDATE,
+    EVENT_HOMEASSISTANT_STOP,
     EVENT_STATE_CHANGED,
     EVENT_STATE_REPORTED,
     MATCH_ALL,
@@ -1001,11 +1003,18 @@ class TrackTemplateResultInfo:
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
+        self._renders_executed = 0
+        self._renders_skipped = 0
 
     def __repr__(self) -> str:
         """Return the representation."""
         return f"<TrackTemplateResultInfo {self._info}>"
 
+    @property
+    def render_counts(self) -> dict[str, int]:
+        """Renders executed and skipped because the values read did not change."""
+        return {"executed": self._renders_executed, "skipped": self._renders_skipped}
+
     def async_setup(
         self,
         strict: bool = False,
@@ -1022,6 +1031,7 @@ class TrackTemplateResultInfo:
             self._info[template] = info = template.async_render_to_info(
                 variables, strict=strict, log_fn=log_fn
             )
+            self._renders_executed += 1
 
             # If the super template did not render to True, don't update other templates
             try:
@@ -1043,6 +1053,7 @@ class TrackTemplateResultInfo:
             self._info[template] = info = template.async_render_to_info(
                 variables, strict=strict, log_fn=log_fn
             )
+            self._renders_executed += 1
 
             if info.exception:
                 if not log_fn:
@@ -1126,9 +1137,14 @@ class TrackTemplateResultInfo:
         track_template_: TrackTemplate,
         now: float,
         event: Event[EventStateChangedData] | None,
+        reads_changed: dict[Template, bool],
     ) -> bool | TrackTemplateResult:
         """Re-render the template if conditions match.
 
+        reads_changed holds whether the values read by the templates changed
+        with the event. It is decided once per refresh since equal templates
+        share their render info.
+
         Returns False if the template was not re-rendered.
 
         Returns True if the template re-rendered and did not
@@ -1145,6 +1161,17 @@ class TrackTemplateResultInfo:
             if not _event_triggers_rerender(event, info):
                 return False
 
+            if (changed := reads_changed.get(template)) is None:
+                # Compare with the current state rather than the new state of
+                # the event since a replayed event may be older than the render
+                entity_id = event.data["entity_id"]
+                changed = reads_changed[template] = info.state_reads_changed(
+                    entity_id, self.hass.states.get(entity_id)
+                )
+            if not changed:
+                self._renders_skipped += 1
+                return False
+
             had_timer = self._rate_limit.async_has_timer(template)
 
             if self._rate_limit.async_schedule_action(
@@ -1168,6 +1195,7 @@ class TrackTemplateResultInfo:
         self._info[template] = info = template.async_render_to_info(
             track_template_.variables
         )
+        self._renders_executed += 1
 
         try:
             result: str | TemplateError = info.result()
@@ -1231,6 +1259,7 @@ class TrackTemplateResultInfo:
         rate limit was hit.
         """
         updates: list[TrackTemplateResult] = []
+        reads_changed: dict[Template, bool] = {}
         info_changed = False
         now = event.time_fired_timestamp if not replayed and event else time.time()
 
@@ -1241,7 +1270,9 @@ class TrackTemplateResultInfo:
 
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            update = self._render_template_if_ready(
+                super_template, now, event, reads_changed
+            )
             info_changed |= self._apply_update(updates, update, super_template.template)
 
             if isinstance(update, TrackTemplateResult):
@@ -1272,7 +1303,9 @@ class TrackTemplateResultInfo:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                update = self._render_template_if_ready(
+                    track_template_, now, event, reads_changed
+                )
                 info_changed |= self._apply_update(
                     updates, update, track_template_.template
                 )
@@ -1446,6 +1479,236 @@ def async_track_same_state(
 track_same_state = threaded_listener_factory(async_track_same_state)
 
 
+DATA_TIMER_WHEEL: HassKey[TimerWheel] = HassKey("timer_wheel")
+DATA_MONOTONIC_TIMER_WHEEL: HassKey[MonotonicTimerWheel] = HassKey(
+    "monotonic_timer_wheel"
+)
+
+# Resolution in seconds of the levels of the timer wheel. Timers are kept
+# in the coarsest level which is not longer than the time until they are due.
+_TIMER_WHEEL_LEVELS = (1, 60, 3600)
+
+
+@dataclass(slots=True, eq=False)
+class TimerWheelTimer:
+    """A timer scheduled on the timer wheel."""
+
+    wheel: TimerWheel
+    timestamp: float
+    action: Callable[[], None]
+    cancel_on_shutdown: bool
+    slot: _TimerWheelSlot | None = None
+
+    @callback
+    def cancel(self) -> None:
+        """Cancel the timer."""
+        self.wheel.async_cancel(self)
+
+
+@dataclass(slots=True)
+class _TimerWheelSlot:
+    """Timers of a slot of the timer wheel sharing one loop callback."""
+
+    key: tuple[int, int]
+    timers: dict[TimerWheelTimer, None]
+    when: float
+    handle: asyncio.TimerHandle
+
+
+class TimerWheel:
+    """Hierarchical timer wheel scheduling timers with few loop callbacks.
+
+    Timers due in the same second share one loop callback which is called
+    when the first of them is due, the others are moved to a new slot.
+    Timers further away are kept in minute and hour slots and moved to
+    finer slots when their slot starts, so the loop only holds a callback
+    per slot instead of a callback per timer.
+
+    Timestamps are UTC timestamps of the wall clock.
+    """
+
+    __slots__ = (
+        "_hass",
+        "_slots",
+        "_fired",
+        "_lateness_total",
+        "_lateness_max",
+    )
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the timer wheel."""
+        self._hass = hass
+        self._slots: dict[tuple[int, int], _TimerWheelSlot] = {}
+        self._fired = 0
+        self._lateness_total = 0.0
+        self._lateness_max = 0.0
+        hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_cancel_on_shutdown
+        )
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Return the queue depth and lateness of the timer wheel."""
+        pending = dict.fromkeys(_TIMER_WHEEL_LEVELS, 0)
+        for (level, _), slot in self._slots.items():
+            pending[level] += len(slot.timers)
+        fired = self._fired
+        return {
+            "pending": sum(pending.values()),
+            "pending_by_resolution": pending,
+            "loop_callbacks": len(self._slots),
+            "fired": fired,
+            "lateness_max": self._lateness_max,
+            "lateness_mean": self._lateness_total / fired if fired else 0.0,
+        }
+
+    @callback
+    def async_schedule(
+        self,
+        timestamp: float,
+        action: Callable[[], None],
+        cancel_on_shutdown: bool | None = None,
+    ) -> TimerWheelTimer:
+        """Schedule a callback to be called at or after a timestamp."""
+        timer = TimerWheelTimer(self, timestamp, action, bool(cancel_on_shutdown))
+        self._async_add(timer, self._now())
+        return timer
+
+    @callback
+    def async_cancel(self, timer: TimerWheelTimer) -> None:
+        """Cancel a timer."""
+        if (slot := timer.slot) is None:
+            return
+        timer.slot = None
+        del slot.timers[timer]
+        # The slot is no longer registered while its timers are called
+        if not slot.timers and self._slots.get(slot.key) is slot:
+            slot.handle.cancel()
+            del self._slots[slot.key]
+
+    @callback
+    def _async_add(self, timer: TimerWheelTimer, now: float) -> None:
+        """Add a timer to the slot of the level matching the time until it is due."""
+        timestamp = timer.timestamp
+        delay = timestamp - now
+        if delay >= 3600:
+            level = 3600
+        elif delay >= 60:
+            level = 60
+        else:
+            level = 1
+        key = (level, int(timestamp // level))
+        # Slots of the second level are called once their first timer is due,
+        # coarser slots when they start to move their timers to finer slots.
+        when = timestamp if level == 1 else float(key[1] * level)
+        if (slot := self._slots.get(key)) is None:
+            slot = self._slots[key] = _TimerWheelSlot(
+                key, {timer: None}, when, self._async_call_at(key, when, now)
+            )
+            timer.slot = slot
+            return
+        timer.slot = slot
+        slot.timers[timer] = None
+        if when < slot.when:
+            slot.handle.cancel()
+            slot.when = when
+            slot.handle = self._async_call_at(key, when, now)
+
+    def _now(self) -> float:
+        """Return the current time of the clock of the timestamps."""
+        return time.time()
+
+    def _slot_now(self, slot: _TimerWheelSlot) -> float:
+        """Return the current time when the loop calls a slot."""
+        return time_tracker_timestamp()
+
+    @callback
+    def _async_call_at(
+        self, key: tuple[int, int], when: float, now: float
+    ) -> asyncio.TimerHandle:
+        """Call the slot at a timestamp."""
+        loop = self._hass.loop
+        return loop.call_at(loop.time() + when - now, self._async_run_slot, key)
+
+    @callback
+    def _async_run_slot(self, key: tuple[int, int]) -> None:
+        """Call the timers of a slot which are due and move the others."""
+        slot = self._slots.pop(key)
+        timers = slot.timers
+        now = self._slot_now(slot)
+        for timer in sorted(timers, key=attrgetter("timestamp")):
+            # The timer was cancelled by the action of a timer called before
+            if timer not in timers:
+                continue
+            del timers[timer]
+            timer.slot = None
+            # The timer is moved to a finer slot, to the slot of its own
+            # second or it was called a little too early because of the
+            # clock resolution.
+            if (lateness := now - timer.timestamp) < 0:
+                self._async_add(timer, now)
+                continue
+            self._fired += 1
+            self._lateness_total += lateness
+            self._lateness_max = max(self._lateness_max, lateness)
+            try:
+                timer.action()
+            except Exception:
+                _LOGGER.exception("Error calling timer %s", timer.action)
+
+    @callback
+    def _async_cancel_on_shutdown(self, _: Event) -> None:
+        """Cancel the timers which should not run during shutdown."""
+        for slot in list(self._slots.values()):
+            for timer in [timer for timer in slot.timers if timer.cancel_on_shutdown]:
+                self.async_cancel(timer)
+
+
+class MonotonicTimerWheel(TimerWheel):
+    """Timer wheel for timestamps of the monotonic clock of the event loop.
+
+    Used for the delays of call later and time interval trackers, which must
+    not move when the wall clock is changed.
+    """
+
+    __slots__ = ()
+
+    def _now(self) -> float:
+        """Return the current time of the clock of the timestamps."""
+        return self._hass.loop.time()
+
+    def _slot_now(self, slot: _TimerWheelSlot) -> float:
+        """Return the current time when the loop calls a slot.
+
+        The loop calls the slot once its time is reached on the same clock.
+        """
+        return max(self._hass.loop.time(), slot.when)
+
+    @callback
+    def _async_call_at(
+        self, key: tuple[int, int], when: float, now: float
+    ) -> asyncio.TimerHandle:
+        """Call the slot at a timestamp."""
+        return self._hass.loop.call_at(when, self._async_run_slot, key)
+
+
+@callback
+def async_enable_timer_wheel(hass: HomeAssistant) -> TimerWheel:
+    """Schedule the time trackers created from now on with a timer wheel.
+
+    Only affects the point in time, time pattern, call at, call later and
+    time interval trackers created after the timer wheel is enabled. Call at,
+    call later and time interval trackers are scheduled on a separate timer
+    wheel using the monotonic clock of the event loop.
+
+    Returns the timer wheel of the wall clock.
+    """
+    if (timer_wheel := hass.data.get(DATA_TIMER_WHEEL)) is None:
+        timer_wheel = hass.data[DATA_TIMER_WHEEL] = TimerWheel(hass)
+        hass.data[DATA_MONOTONIC_TIMER_WHEEL] = MonotonicTimerWheel(hass)
+    return timer_wheel
+
+
 @callback
 @bind_hass
 def async_track_point_in_time(
@@ -1487,10 +1750,15 @@ class _TrackPointUTCTime:
     job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     utc_point_in_time: datetime
     expected_fire_timestamp: float
-    _cancel_callback: asyncio.TimerHandle | None = None
+    _cancel_callback: asyncio.TimerHandle | TimerWheelTimer | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
+        if (timer_wheel := self.hass.data.get(DATA_TIMER_WHEEL)) is not None:
+            self._cancel_callback = timer_wheel.async_schedule(
+                self.expected_fire_timestamp, self
+            )
+            return
         loop = self.hass.loop
         self._cancel_callback = loop.call_at(
             loop.time() + self.expected_fire_timestamp - time.time(), self
@@ -1578,6 +1846,10 @@ def async_call_at(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_at {loop_time}")
     )
+    if (timer_wheel := hass.data.get(DATA_MONOTONIC_TIMER_WHEEL)) is not None:
+        return timer_wheel.async_schedule(
+            loop_time, partial(_run_async_call_action, hass, job)
+        ).cancel
     return hass.loop.call_at(loop_time, _run_async_call_action, hass, job).cancel
 
 
@@ -1601,6 +1873,10 @@ def async_call_later(
         else HassJob(action, f"call_later {delay}")
     )
     loop = hass.loop
+    if (timer_wheel := hass.data.get(DATA_MONOTONIC_TIMER_WHEEL)) is not None:
+        return timer_wheel.async_schedule(
+            loop.time() + delay, partial(_run_async_call_action, hass, job)
+        ).cancel
     return loop.call_at(loop.time() + delay, _run_async_call_action, hass, job).cancel
 
 
@@ -1618,7 +1894,7 @@ class _TrackTimeInterval:
     cancel_on_shutdown: bool | None
     _track_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
     _run_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
-    _timer_handle: asyncio.TimerHandle | None = None
+    _timer_handle: asyncio.TimerHandle | TimerWheelTimer | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
@@ -1641,6 +1917,13 @@ class _TrackTimeInterval:
             assert self._track_job is not None
         hass = self.hass
         loop = hass.loop
+        if (timer_wheel := hass.data.get(DATA_MONOTONIC_TIMER_WHEEL)) is not None:
+            self._timer_handle = timer_wheel.async_schedule(
+                loop.time() + self.seconds,
+                partial(self._interval_listener, self._track_job),
+                self.cancel_on_shutdown,
+            )
+            return
         self._timer_handle = loop.call_at(
             loop.time() + self.seconds, self._interval_listener, self._track_job
         )
@@ -385,8 +385,10 @@ class RenderInfo:
         "domains",
         "domains_lifecycle",
         "entities",
+        "entity_reads",
         "rate_limit",
         "has_time",
+        "deterministic",
     )
 
     def __init__(self, template: Template) -> None:
@@ -403,8 +405,12 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # The fields of the states read by the template with the values read,
+        # or None if the state was used in a way that can not be tracked.
+        self.entity_reads: dict[str, dict[str | tuple[str, str], Any] | None] = {}
         self.rate_limit: float | None = None
         self.has_time = False
+        self.deterministic = True
 
     def __repr__(self) -> str:
         """Representation of RenderInfo."""
@@ -445,6 +451,52 @@ class RenderInfo:
         """
         return split_entity_id(entity_id)[0] in self.domains_lifecycle
 
+    def _collect_read(
+        self, entity_id: str, field: str | tuple[str, str], value: Any
+    ) -> None:
+        """Collect the value of a field of a state read by the template.
+
+        Single attributes are collected as ("attributes", name) fields.
+        """
+        self.entities.add(entity_id)  # type: ignore[attr-defined]
+        if (fields := self.entity_reads.get(entity_id, _SENTINEL)) is _SENTINEL:
+            self.entity_reads[entity_id] = {field: value}
+        elif fields is not None:
+            fields[field] = value  # type: ignore[index]
+
+    def _collect_state(self, entity_id: str) -> None:
+        """Collect a state used by the template in a way that can not be tracked."""
+        self.entities.add(entity_id)  # type: ignore[attr-defined]
+        self.entity_reads[entity_id] = None
+
+    def state_reads_changed(self, entity_id: str, state: State | None) -> bool:
+        """Return if rendering again with the state may change the result.
+
+        Only the fields of the state read by the template are compared with
+        the values read. States reached through all states or a domain, or
+        used in a way that can not be tracked, are always considered changed.
+        """
+        if (
+            not self.deterministic
+            or self.has_time
+            or self.exception is not None
+            or self.all_states
+            or state is None
+            or split_entity_id(entity_id)[0] in self.domains
+            or (fields := self.entity_reads.get(entity_id)) is None
+        ):
+            return True
+        for field, value in fields.items():
+            if isinstance(field, tuple):
+                new_value = state.attributes.get(field[1])
+            else:
+                new_value = getattr(state, field)
+            if new_value is not value and (
+                type(new_value) is not type(value) or new_value != value
+            ):
+                return True
+        return False
+
     def result(self) -> str:
         """Results of the template computation."""
         if self.exception is not None:
@@ -1043,17 +1095,31 @@ class TemplateStateBase(State):
 
     def _collect_state(self) -> None:
         if self._collect and (render_info := _render_info.get()):
-            render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            render_info._collect_state(self._entity_id)  # noqa: SLF001
+
+    def _collect_field[_T](self, field: str, value: _T) -> _T:
+        if self._collect and (render_info := _render_info.get()):
+            render_info._collect_read(self._entity_id, field, value)  # noqa: SLF001
+        return value
+
+    def _collect_attribute(self, name: str) -> Any:
+        value = self._state.attributes.get(name)
+        if self._collect and (render_info := _render_info.get()):
+            render_info._collect_read(  # noqa: SLF001
+                self._entity_id, ("attributes", name), value
+            )
+        return value
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
     def __getitem__(self, item: str) -> Any:
         """Return a property as an attribute for jinja."""
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
-            # _collect_state inlined here for performance
+            value = getattr(self._state, item)
+            # _collect_field inlined here for performance
             if self._collect and (render_info := _render_info.get()):
-                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
-            return getattr(self._state, item)
+                render_info._collect_read(self._entity_id, item, value)  # noqa: SLF001
+            return value
         if item == "entity_id":
             return self._entity_id
         if item == "state_with_unit":
@@ -1071,56 +1137,47 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
-        return self._state.state
+        return self._collect_field("state", self._state.state)
 
     @property
     def attributes(self) -> ReadOnlyDict[str, Any]:  # type: ignore[override]
         """Wrap State.attributes."""
-        self._collect_state()
-        return self._state.attributes
+        return self._collect_field("attributes", self._state.attributes)
 
     @property
     def last_changed(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_changed."""
-        self._collect_state()
-        return self._state.last_changed
+        return self._collect_field("last_changed", self._state.last_changed)
 
     @property
     def last_reported(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_reported."""
-        self._collect_state()
-        return self._state.last_reported
+        return self._collect_field("last_reported", self._state.last_reported)
 
     @property
     def last_updated(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_updated."""
-        self._collect_state()
-        return self._state.last_updated
+        return self._collect_field("last_updated", self._state.last_updated)
 
     @property
     def context(self) -> Context:  # type: ignore[override]
         """Wrap State.context."""
-        self._collect_state()
-        return self._state.context
+        return self._collect_field("context", self._state.context)
 
     @property
     def domain(self) -> str:  # type: ignore[override]
         """Wrap State.domain."""
-        self._collect_state()
-        return self._state.domain
+        return self._collect_field("domain", self._state.domain)
 
     @property
     def object_id(self) -> str:  # type: ignore[override]
         """Wrap State.object_id."""
-        self._collect_state()
-        return self._state.object_id
+        return self._collect_field("object_id", self._state.object_id)
 
     @property
     def name(self) -> str:  # type: ignore[override]
         """Wrap State.name."""
-        self._collect_state()
-        return self._state.name
+        return self._collect_field("name", self._state.name)
 
     @property
     def state_with_unit(self) -> str:
@@ -1195,7 +1252,7 @@ _create_template_state_no_collect = partial(TemplateState, collect=False)
 
 def _collect_state(hass: HomeAssistant, entity_id: str) -> None:
     if (entity_collect := _render_info.get()) is not None:
-        entity_collect.entities.add(entity_id)  # type: ignore[attr-defined]
+        entity_collect._collect_state(entity_id)  # noqa: SLF001
 
 
 def _state_generator(
@@ -1876,7 +1933,7 @@ def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) ->
 def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     """Get a specific attribute from a state."""
     if (state_obj := _get_state(hass, entity_id)) is not None:
-        return state_obj.attributes.get(name)
+        return state_obj._collect_attribute(name)  # noqa: SLF001
     return None
 
 
@@ -2585,6 +2642,8 @@ def random_every_time(context, values):
     Unlike Jinja's random filter,
     this is context-dependent to avoid caching the chosen value.
     """
+    if (render_info := _render_info.get()) is not None:
+        render_info.deterministic = False
     return random.choice(values)
 
 
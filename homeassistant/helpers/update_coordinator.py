@@ -171,9 +171,23 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
 
     @callback
     def async_update_listeners(self) -> None:
-        """Update all registered listeners."""
+        """Update all registered listeners.
+
+        Coordinator entities which only write their state on updates
+        have their states written together with one async_set_many,
+        see entity.async_write_ha_states.
+        """
+        entities: list[entity.Entity] = []
         for update_callback, _ in list(self._listeners.values()):
-            update_callback()
+            if (
+                getattr(update_callback, "__func__", None)
+                is BaseCoordinatorEntity._handle_coordinator_update  # noqa: SLF001
+            ):
+                entities.append(update_callback.__self__)  # type: ignore[attr-defined]
+            else:
+                update_callback()
+        if entities:
+            entity.async_write_ha_states(self.hass, entities)
 
     async def async_shutdown(self) -> None:
         """Cancel any scheduled call, and ignore new runs."""
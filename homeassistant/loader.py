@@ -15,7 +15,9 @@ import importlib
 import logging
 import os
 import pathlib
+import stat
 import sys
+import threading
 import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, cast
@@ -29,7 +31,7 @@ from propcache import cached_property
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
+from .const import Platform, __version__
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -41,6 +43,7 @@ from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
 from .helpers.json import json_bytes, json_fragment
 from .helpers.typing import UNDEFINED
+from .util.file import WriteError, write_utf8_file
 from .util.hass_dict import HassKey
 from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
@@ -132,6 +135,11 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_MANIFEST_INDEX: HassKey[_ManifestIndex] = HassKey("manifest_index")
+DATA_LAZY_PLATFORMS: HassKey[bool] = HassKey("lazy_platforms")
+DATA_IMPORT_TIMINGS: HassKey[dict[str, float]] = HassKey("import_timings")
+MANIFEST_INDEX_PATH = (".storage", "core.manifest_index")
+MANIFEST_INDEX_VERSION = 2
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -270,6 +278,202 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_IMPORT_TIMINGS] = {}
+
+
+@callback
+def async_enable_manifest_index(hass: HomeAssistant) -> None:
+    """Resolve manifests through the on-disk manifest index."""
+    hass.data[DATA_MANIFEST_INDEX] = _ManifestIndex(
+        hass.config.path(*MANIFEST_INDEX_PATH)
+    )
+
+
+@callback
+def async_save_manifest_index(hass: HomeAssistant) -> None:
+    """Save the manifest index and the platforms imported so far."""
+    if (index := hass.data.get(DATA_MANIFEST_INDEX)) is not None:
+        hass.async_add_executor_job(index.save)
+
+
+@callback
+def async_enable_lazy_platforms(hass: HomeAssistant) -> None:
+    """Only import platforms when they are used.
+
+    Instead of the preload platforms, importing a component imports the
+    platforms it used during the previous run, as recorded in the manifest
+    index. Any other platform is imported when it is first requested.
+    """
+    hass.data[DATA_LAZY_PLATFORMS] = True
+
+
+@callback
+def async_get_import_timings(hass: HomeAssistant) -> dict[str, float]:
+    """Return how long each component and platform module took to import."""
+    return hass.data[DATA_IMPORT_TIMINGS]
+
+
+def _read_manifest(manifest_path: pathlib.Path) -> tuple[Manifest, set[str] | None]:
+    """Read a manifest and list the top level files of its integration."""
+    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+    # Avoid the listdir for virtual integrations
+    # as they cannot have any platforms
+    if manifest.get("integration_type") == "virtual":
+        return manifest, None
+    return manifest, set(os.listdir(manifest_path.parent))
+
+
+class _ManifestIndex:
+    """Index of parsed manifests persisted in a single file.
+
+    An entry is reused as long as the mtime of the manifest and of the
+    integration directory are unchanged. The whole index is discarded when
+    the Home Assistant version or the format of the index changes, or when
+    it can not be parsed.
+
+    Each entry also holds the platforms of the integration that were
+    imported during the last run, which lazy platform mode imports together
+    with the component.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the manifest index."""
+        self.path = path
+        self._entries: dict[str, list[Any]] | None = None
+        self._previous_platforms: dict[str, list[str]] = {}
+        self._platforms: dict[str, set[str]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, list[Any]]:
+        """Load the index from disk."""
+        try:
+            data = json_loads(pathlib.Path(self.path).read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, *JSON_DECODE_EXCEPTIONS) as err:
+            _LOGGER.debug("Unable to load manifest index %s: %s", self.path, err)
+            return {}
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != MANIFEST_INDEX_VERSION
+            or data.get("ha_version") != __version__
+        ):
+            return {}
+        entries = data.get("entries")
+        if not isinstance(entries, dict) or not all(
+            map(_valid_manifest_index_entry, entries.values())
+        ):
+            _LOGGER.debug("Ignoring malformed manifest index %s", self.path)
+            return {}
+        valid: dict[str, list[Any]] = cast(dict[str, list[Any]], entries)
+        self._previous_platforms = {key: entry[4] for key, entry in valid.items()}
+        return valid
+
+    def read_manifest(
+        self, manifest_path: pathlib.Path
+    ) -> tuple[Manifest, set[str] | None] | None:
+        """Return the manifest and top level files, or None if it does not exist.
+
+        Must be called from the executor.
+        """
+        try:
+            manifest_stat = manifest_path.stat()
+            dir_stat = manifest_path.parent.stat()
+        except OSError:
+            return None
+        if not stat.S_ISREG(manifest_stat.st_mode):
+            return None
+
+        key = str(manifest_path)
+        with self._lock:
+            if (entries := self._entries) is None:
+                entries = self._entries = self._load()
+            entry = entries.get(key)
+            self._platforms.setdefault(key, set())
+        if (
+            entry is not None
+            and entry[0] == manifest_stat.st_mtime_ns
+            and entry[1] == dir_stat.st_mtime_ns
+        ):
+            top_level_files = entry[3]
+            return (
+                cast(Manifest, dict(entry[2])),
+                None if top_level_files is None else set(top_level_files),
+            )
+
+        manifest, top_level_files = _read_manifest(manifest_path)
+        with self._lock:
+            entries[key] = [
+                manifest_stat.st_mtime_ns,
+                dir_stat.st_mtime_ns,
+                dict(manifest),
+                None if top_level_files is None else sorted(top_level_files),
+                [],
+            ]
+            self._dirty = True
+        return manifest, top_level_files
+
+    def previous_platforms(self, manifest_path: pathlib.Path) -> list[str]:
+        """Return the platforms imported during the last run."""
+        return self._previous_platforms.get(str(manifest_path), [])
+
+    def record_platform(self, manifest_path: pathlib.Path, platform_name: str) -> None:
+        """Record that a platform was imported during this run."""
+        with self._lock:
+            if (platforms := self._platforms.get(str(manifest_path))) is not None:
+                platforms.add(platform_name)
+
+    def save(self) -> None:
+        """Write the index to disk if it changed.
+
+        Must be called from the executor.
+        """
+        with self._lock:
+            if self._entries is None:
+                return
+            for key, platforms in self._platforms.items():
+                if (entry := self._entries.get(key)) is not None and entry[4] != (
+                    imported := sorted(platforms)
+                ):
+                    entry[4] = imported
+                    self._dirty = True
+            if not self._dirty:
+                return
+            self._dirty = False
+            data = json_bytes(
+                {
+                    "version": MANIFEST_INDEX_VERSION,
+                    "ha_version": __version__,
+                    "entries": self._entries,
+                }
+            )
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            write_utf8_file(self.path, data, mode="wb")
+        except (OSError, WriteError) as err:
+            _LOGGER.debug("Unable to save manifest index %s: %s", self.path, err)
+
+
+def _valid_manifest_index_entry(entry: Any) -> bool:
+    """Return if an entry of the manifest index is well formed."""
+    if not isinstance(entry, list) or len(entry) != 5:
+        return False
+    manifest_mtime, dir_mtime, manifest, top_level_files, platforms = entry
+    return (
+        type(manifest_mtime) is int
+        and type(dir_mtime) is int
+        and isinstance(manifest, dict)
+        and (
+            top_level_files is None
+            or (
+                isinstance(top_level_files, list)
+                and all(type(name) is str for name in top_level_files)
+            )
+        )
+        and isinstance(platforms, list)
+        and all(type(name) is str for name in platforms)
+    )
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -652,30 +856,32 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        index = hass.data.get(DATA_MANIFEST_INDEX)
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
+            if index is None and not manifest_path.is_file():
                 continue
 
             try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                if index is None:
+                    manifest, top_level_files = _read_manifest(manifest_path)
+                elif (result := index.read_manifest(manifest_path)) is None:
+                    continue
+                else:
+                    manifest, top_level_files = result
             except JSON_DECODE_EXCEPTIONS as err:
                 _LOGGER.error(
                     "Error parsing manifest.json file at %s: %s", manifest_path, err
                 )
                 continue
 
-            file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
-                file_path,
+                manifest_path.parent,
                 manifest,
-                None if is_virtual else set(os.listdir(file_path)),
+                top_level_files,
             )
 
             if not integration.import_executor:
@@ -769,6 +975,9 @@ class Integration:
         self._import_futures: dict[str, asyncio.Future[ModuleType]] = {}
         self._cache = hass.data[DATA_COMPONENTS]
         self._missing_platforms_cache = hass.data[DATA_MISSING_PLATFORMS]
+        self._import_timings = hass.data[DATA_IMPORT_TIMINGS]
+        self._manifest_index = hass.data.get(DATA_MANIFEST_INDEX)
+        self._lazy_platforms = hass.data.get(DATA_LAZY_PLATFORMS, False)
         self._top_level_files = top_level_files or set()
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
@@ -1067,9 +1276,7 @@ class Integration:
         cache = self._cache
         domain = self.domain
         try:
-            cache[domain] = cast(
-                ComponentProtocol, importlib.import_module(self.pkg_path)
-            )
+            cache[domain] = cast(ComponentProtocol, self._timed_import(self.pkg_path))
         except ImportError:
             raise
         except RuntimeError as err:
@@ -1082,12 +1289,33 @@ class Integration:
             raise ImportError(f"Exception importing {self.pkg_path}") from err
 
         if preload_platforms:
-            for platform_name in self.platforms_exists(self._platforms_to_preload):
+            for platform_name in self.platforms_exists(self._preload_platform_names()):
                 with suppress(ImportError):
                     self.get_platform(platform_name)
 
         return cache[domain]
 
+    def _preload_platform_names(self) -> Iterable[str]:
+        """Return the platforms to import together with the component."""
+        if not self._lazy_platforms:
+            return self._platforms_to_preload
+        if (index := self._manifest_index) is None:
+            return ()
+        return index.previous_platforms(self.file_path / "manifest.json")
+
+    def _timed_import(self, name: str) -> ModuleType:
+        """Import a module and record how long the import took.
+
+        This method must be thread-safe as it's called from the executor
+        and the event loop.
+        """
+        if name in sys.modules:
+            return importlib.import_module(name)
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        self._import_timings[name] = time.perf_counter() - start
+        return module
+
     def _load_platforms(self, platform_names: Iterable[str]) -> dict[str, ModuleType]:
         """Load platforms for an integration."""
         return {
@@ -1289,6 +1517,8 @@ class Integration:
                 f"Exception importing {self.pkg_path}.{platform_name}"
             ) from err
 
+        if (index := self._manifest_index) is not None:
+            index.record_platform(self.file_path / "manifest.json", platform_name)
         return cast(ModuleType, cache[full_name])
 
     def _import_platform(self, platform_name: str) -> ModuleType:
@@ -1297,7 +1527,7 @@ class Integration:
         This method must be thread-safe as it's called from the executor
         and the event loop.
         """
-        return importlib.import_module(f"{self.pkg_path}.{platform_name}")
+        return self._timed_import(f"{self.pkg_path}.{platform_name}")
 
     def __repr__(self) -> str:
         """Text representation of class."""
@@ -56,6 +56,7 @@ class RuntimeConfig:
     open_ui: bool = False
 
     safe_mode: bool = False
+    lazy_platforms: bool = False
 
 
 def can_use_pidfd() -> bool:
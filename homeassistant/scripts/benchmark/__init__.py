@@ -8,6 +8,7 @@ from collections.abc import Callable
 from contextlib import suppress
 import logging
 from timeit import default_timer as timer
+import zlib
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -116,6 +117,62 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+async def _fire_events_to_entity_listeners(
+    hass: core.HomeAssistant, keyed: bool
+) -> float:
+    """Fire 100k events to 1000 listeners each listening for one entity."""
+    count = 0
+    event_name = "benchmark_event"
+    events_to_fire = 10**5
+    listeners = 1000
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(listeners):
+        entity_id = f"light.kitchen_{idx}"
+        if keyed:
+            hass.bus.async_listen(
+                event_name, listener, keyed_filter=("entity_id", {entity_id})
+            )
+        else:
+
+            @core.callback
+            def event_filter(event_data, entity_id=entity_id):
+                """Filter event."""
+                return event_data["entity_id"] == entity_id
+
+            hass.bus.async_listen(event_name, listener, event_filter=event_filter)
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.bus.async_fire(
+            event_name, {"entity_id": f"light.kitchen_{idx % listeners}"}
+        )
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+@benchmark
+async def fire_events_entity_filter_listeners(hass):
+    """Fire 100k events to 1000 listeners with an entity_id event filter."""
+    return await _fire_events_to_entity_listeners(hass, keyed=False)
+
+
+@benchmark
+async def fire_events_entity_keyed_listeners(hass):
+    """Fire 100k events to 1000 listeners with an entity_id keyed filter."""
+    return await _fire_events_to_entity_listeners(hass, keyed=True)
+
+
 @benchmark
 async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
@@ -308,3 +365,358 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+def _recorder_insert_events(use_bulk_insert: bool) -> float:
+    """Insert 100k events into an in-memory recorder database."""
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine, insert
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.db_schema import Base, Events, EventTypes
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    events = [
+        core.Event("benchmark_event", context=core.Context()) for _ in range(10**5)
+    ]
+    with Session(engine) as session:
+        event_types = EventTypes(event_type="benchmark_event")
+        session.add(event_types)
+        session.commit()
+        event_type_id = event_types.event_type_id
+
+        start = timer()
+        if use_bulk_insert:
+            session.execute(
+                insert(Events),
+                [Events.row_from_event(event, event_type_id, None) for event in events],
+            )
+        else:
+            for event in events:
+                dbevent = Events.from_event(event)
+                dbevent.event_type_id = event_type_id
+                session.add(dbevent)
+        session.commit()
+        return timer() - start
+
+
+@benchmark
+async def recorder_orm_insert_events(hass):
+    """Insert 100k events into the recorder database with the ORM."""
+    return _recorder_insert_events(False)
+
+
+@benchmark
+async def recorder_bulk_insert_events(hass):
+    """Insert 100k events into the recorder database with a bulk insert."""
+    return _recorder_insert_events(True)
+
+
+def _sensor_statistics_states(start):
+    """Return 10 state changes in a statistics period for 5k sensors."""
+    # pylint: disable=import-outside-toplevel
+    from datetime import timedelta
+
+    attributes = {"state_class": "measurement", "unit_of_measurement": "W"}
+    return {
+        f"sensor.power_{idx}": [
+            core.State(
+                f"sensor.power_{idx}",
+                str(idx + change),
+                attributes,
+                last_updated=start + timedelta(seconds=30 * change),
+            )
+            for change in range(10)
+        ]
+        for idx in range(5000)
+    }
+
+
+async def _sensor_statistics_accumulated(
+    hass: core.HomeAssistant,
+) -> tuple[float, float]:
+    """Return the time to accumulate and to flush statistics of 5k sensors."""
+    # pylint: disable=import-outside-toplevel
+    from datetime import timedelta
+
+    from homeassistant.components.sensor.recorder import (
+        SHORT_TERM_PERIOD_SECONDS,
+        SensorStatisticsAccumulators,
+    )
+    from homeassistant.util import dt as dt_util
+
+    now = dt_util.utcnow().timestamp()
+    start = dt_util.utc_from_timestamp(
+        now - now % SHORT_TERM_PERIOD_SECONDS + SHORT_TERM_PERIOD_SECONDS
+    )
+    states = _sensor_statistics_states(start)
+    for entity_id, entity_states in states.items():
+        hass.states.async_set(entity_id, "0", entity_states[0].attributes)
+    accumulators = SensorStatisticsAccumulators(hass)
+    # The first state of the next period finishes the period
+    for entity_id, entity_states in states.items():
+        entity_states.append(
+            core.State(
+                entity_id,
+                "0",
+                entity_states[0].attributes,
+                last_updated=start + timedelta(seconds=SHORT_TERM_PERIOD_SECONDS),
+            )
+        )
+
+    start_time = timer()
+    for entity_states in states.values():
+        for state in entity_states:
+            data: core.EventStateChangedData = {
+                "entity_id": state.entity_id,
+                "old_state": None,
+                "new_state": state,
+            }
+            hass.bus.async_fire(EVENT_STATE_CHANGED, data)
+    accumulate_time = timer() - start_time
+
+    start_time = timer()
+    result = accumulators.async_pop_period(states, start)
+    flush_time = timer() - start_time
+    assert len(result) == len(states)
+    return accumulate_time, flush_time
+
+
+@benchmark
+async def sensor_statistics_accumulate(hass):
+    """Feed 55k state changes of 5k sensors to the statistics accumulators."""
+    return (await _sensor_statistics_accumulated(hass))[0]
+
+
+@benchmark
+async def sensor_statistics_accumulated_flush(hass):
+    """Flush the accumulated short term statistics of 5k sensors."""
+    return (await _sensor_statistics_accumulated(hass))[1]
+
+
+@benchmark
+async def sensor_statistics_from_history(hass):
+    """Compile short term statistics of 5k sensors from their history.
+
+    This does not include the time spent querying the history.
+    """
+    # pylint: disable=import-outside-toplevel
+    from datetime import timedelta
+
+    from homeassistant.components.sensor.recorder import (
+        SHORT_TERM_PERIOD_SECONDS,
+        _entity_history_to_float_and_state,
+        _time_weighted_average,
+    )
+    from homeassistant.util import dt as dt_util
+
+    now = dt_util.utcnow().timestamp()
+    start = dt_util.utc_from_timestamp(now - now % SHORT_TERM_PERIOD_SECONDS)
+    end = start + timedelta(seconds=SHORT_TERM_PERIOD_SECONDS)
+    states = _sensor_statistics_states(start)
+
+    start_time = timer()
+    for entity_states in states.values():
+        fstates = _entity_history_to_float_and_state(entity_states)
+        _time_weighted_average(fstates, start, end)
+        min(fstate for fstate, _ in fstates)
+        max(fstate for fstate, _ in fstates)
+    return timer() - start_time
+
+
+def _websocket_entities_snapshot_states() -> list[core.State]:
+    """Return 5k states with typical attributes for a snapshot."""
+    return [
+        core.State(
+            f"sensor.power_{i}",
+            str(i / 10),
+            {
+                "state_class": "measurement",
+                "unit_of_measurement": "W",
+                "device_class": "power",
+                "friendly_name": f"Power {i}",
+            },
+        )
+        for i in range(5000)
+    ]
+
+
+def _websocket_entities_snapshot(states: list[core.State]) -> bytes:
+    """Serialize the subscribe_entities snapshot of the states."""
+    return b"".join(
+        (
+            b'{"id":1,"type":"event","event":{"a":{',
+            b",".join(state.as_compressed_state_json for state in states),
+            b"}}}",
+        )
+    )
+
+
+@benchmark
+async def websocket_entities_snapshot_json(hass):
+    """Serialize the subscribe_entities snapshot of 5k states 100 times."""
+    states_sets = [_websocket_entities_snapshot_states() for _ in range(100)]
+
+    start = timer()
+    for states in states_sets:
+        message = _websocket_entities_snapshot(states)
+    runtime = timer() - start
+    print(f"Snapshot size: {len(message)} bytes")
+    return runtime
+
+
+@benchmark
+async def websocket_entities_snapshot_deflate(hass):
+    """Serialize and deflate the subscribe_entities snapshot of 5k states 100 times.
+
+    The snapshot is compressed the same way as a permessage-deflate frame.
+    """
+    states_sets = [_websocket_entities_snapshot_states() for _ in range(100)]
+
+    start = timer()
+    for states in states_sets:
+        message = _websocket_entities_snapshot(states)
+        compressobj = zlib.compressobj(level=zlib.Z_BEST_SPEED, wbits=-zlib.MAX_WBITS)
+        compressed = compressobj.compress(message) + compressobj.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+    runtime = timer() - start
+    print(f"Snapshot size: {len(message)} bytes, deflated: {len(compressed)} bytes")
+    return runtime
+
+
+@benchmark
+async def state_memory(hass):
+    """Measure the memory used per entity by 6k entities updated 10 times.
+
+    The new states are serialized like the websocket_api does and the
+    superseded states of the last update are kept like an event queue would.
+    The workload runs once keeping and once dropping the cached JSON of
+    superseded states.
+    """
+    # pylint: disable=import-outside-toplevel
+    import gc
+    import tracemalloc
+
+    entity_count = 6000
+    superseded_states: list[core.State] = []
+
+    @core.callback
+    def keep_old_state(event):
+        if (old_state := event.data["old_state"]) is not None:
+            superseded_states.append(old_state)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, keep_old_state)
+
+    def measure(prefix: str) -> tuple[float, int]:
+        gc.collect()
+        tracemalloc.start()
+        memory_before = tracemalloc.get_traced_memory()[0]
+        start = timer()
+        for update in range(10):
+            superseded_states.clear()
+            for i in range(entity_count):
+                entity_id = f"sensor.{prefix}_{i}"
+                hass.states.async_set(
+                    entity_id,
+                    str(update),
+                    {
+                        "state_class": "measurement",
+                        "unit_of_measurement": "W",
+                        "device_class": "power",
+                        "friendly_name": f"Power {i}",
+                        "status": "ok" if update % 2 else "high",
+                    },
+                )
+                state = hass.states.get(entity_id)
+                state.as_dict_json  # noqa: B018
+                state.as_compressed_state_json  # noqa: B018
+        runtime = timer() - start
+        gc.collect()
+        memory_used = tracemalloc.get_traced_memory()[0] - memory_before
+        tracemalloc.stop()
+        for i in range(entity_count):
+            hass.states.async_remove(f"sensor.{prefix}_{i}")
+        superseded_states.clear()
+        return runtime, memory_used // entity_count
+
+    cache_keys = core._STATE_JSON_CACHE_KEYS  # noqa: SLF001
+    core._STATE_JSON_CACHE_KEYS = ()  # noqa: SLF001
+    try:
+        _, kept_memory = measure("cache_kept")
+    finally:
+        core._STATE_JSON_CACHE_KEYS = cache_keys  # noqa: SLF001
+    runtime, dropped_memory = measure("cache_dropped")
+    print(
+        f"Memory used: {kept_memory} bytes per entity keeping the cached JSON, "
+        f"{dropped_memory} bytes per entity dropping it"
+    )
+    return runtime
+
+
+@benchmark
+async def yaml_config_tree(hass):
+    """Load a generated config of 900 YAML files, cold and from the parse cache."""
+    # pylint: disable=import-outside-toplevel
+    import os
+    import tempfile
+
+    from homeassistant.util.yaml import loader as yaml_loader
+    from homeassistant.util.yaml.cache import ParseCache
+
+    def write_config(config_dir: str) -> str:
+        for kind in ("automations", "scripts", "templates"):
+            os.mkdir(os.path.join(config_dir, kind))
+            for i in range(300):
+                with open(
+                    os.path.join(config_dir, kind, f"{kind}_{i}.yaml"),
+                    "w",
+                    encoding="utf-8",
+                ) as yaml_file:
+                    yaml_file.write(
+                        f"{kind}_{i}:\n"
+                        f"  alias: Generated {i}\n"
+                        "  trigger:\n"
+                        "    - platform: state\n"
+                        f"      entity_id: sensor.temperature_{i}\n"
+                        "      for: {minutes: 5}\n"
+                        "  condition:\n"
+                        "    - condition: template\n"
+                        "      value_template: >-\n"
+                        f"        {{{{ states('sensor.x_{i}') != 'on' }}}}\n"
+                        "  action:\n"
+                        "    - service: light.turn_on\n"
+                        f"      target: {{entity_id: light.room_{i}}}\n"
+                        "      data: {brightness: 200, transition: 2}\n"
+                    )
+        config_file = os.path.join(config_dir, "configuration.yaml")
+        with open(config_file, "w", encoding="utf-8") as yaml_file:
+            yaml_file.write(
+                "automation: !include_dir_merge_named automations\n"
+                "script: !include_dir_merge_named scripts\n"
+                "template: !include_dir_merge_named templates\n"
+            )
+        return config_file
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        config_file = await hass.async_add_executor_job(write_config, config_dir)
+        cache_path = os.path.join(config_dir, ".storage", "core.yaml_cache")
+
+        def load(cache: ParseCache | None) -> float:
+            yaml_loader.set_parse_cache(cache)
+            start = timer()
+            yaml_loader.load_yaml(config_file)
+            if cache is not None:
+                cache.save()
+            return timer() - start
+
+        try:
+            uncached = await hass.async_add_executor_job(load, None)
+            await hass.async_add_executor_job(load, ParseCache(cache_path))
+            cached = await hass.async_add_executor_job(load, ParseCache(cache_path))
+        finally:
+            yaml_loader.set_parse_cache(None)
+
+    print(f"Without cache: {uncached:.3f}s, from cache: {cached:.3f}s")
+    return cached
@@ -0,0 +1,174 @@
+"""Cache of parsed YAML files keyed by their content."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import os
+from pathlib import Path
+import threading
+from typing import Any, Final
+
+import orjson
+
+from homeassistant.util.file import WriteError, write_utf8_file
+from homeassistant.util.json import json_loads_object
+
+from .objects import NodeDictClass, NodeListClass, NodeStrClass
+
+CACHE_VERSION: Final = 1
+
+_LOGGER = logging.getLogger(__name__)
+
+_STR: Final = 0
+_LIST: Final = 1
+_DICT: Final = 2
+_MAX_INT: Final = 2**63
+
+
+class _Uncacheable(Exception):
+    """Raised when a parsed value can not be stored in the cache."""
+
+
+def _encode(obj: Any) -> Any:
+    """Encode a parsed value, keeping the line of every node."""
+    if type(obj) is NodeStrClass:
+        return [_STR, obj.__line__, str(obj)]
+    if type(obj) is NodeDictClass:
+        items: list[Any] = []
+        for key, value in obj.items():
+            items.append(_encode(key))
+            items.append(_encode(value))
+        return [_DICT, obj.__line__, items]
+    if type(obj) is NodeListClass:
+        return [_LIST, obj.__line__, [_encode(value) for value in obj]]
+    if obj is None or type(obj) is bool:
+        return obj
+    if type(obj) is int and -_MAX_INT < obj < _MAX_INT:
+        return obj
+    if type(obj) is float and math.isfinite(obj):
+        return obj
+    raise _Uncacheable
+
+
+def _decode(obj: Any, fname: str) -> Any:
+    """Decode a value stored with _encode.
+
+    Raises ValueError or TypeError if the value is malformed.
+    """
+    if type(obj) is not list:
+        if type(obj) is dict:
+            raise ValueError("Unexpected mapping")
+        return obj
+    kind, line, value = obj
+    if type(line) is not int:
+        raise ValueError(f"Invalid line {line!r}")
+    node: NodeStrClass | NodeListClass | NodeDictClass
+    if kind == _STR and type(value) is str:
+        node = NodeStrClass(value)
+    elif kind == _LIST and type(value) is list:
+        node = NodeListClass([_decode(item, fname) for item in value])
+    elif kind == _DICT and type(value) is list and not len(value) % 2:
+        node = NodeDictClass(
+            (_decode(value[idx], fname), _decode(value[idx + 1], fname))
+            for idx in range(0, len(value), 2)
+        )
+    else:
+        raise ValueError(f"Invalid node {kind!r}")
+    node.__config_file__ = fname
+    node.__line__ = line
+    return node
+
+
+class ParseCache:
+    """Cache of parsed YAML keyed by a hash of the file content.
+
+    Only files whose parsed value depends on nothing but their content are
+    stored, which excludes any file using a tag such as !include or !secret.
+    The cache is persisted to a single file and entries not used since it
+    was loaded are dropped when it is saved. A malformed cache or entry is
+    treated as missing.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Initialize the cache."""
+        self.path = Path(path)
+        self._entries: dict[str, Any] | None = None
+        self._used: set[str] = set()
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(content: str) -> str:
+        """Return the cache key of the content of a file."""
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _load(self) -> dict[str, Any]:
+        """Load the cache from disk."""
+        try:
+            data = json_loads_object(self.path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as err:
+            _LOGGER.debug("Unable to load YAML cache %s: %s", self.path, err)
+            return {}
+        if data.get("version") != CACHE_VERSION:
+            return {}
+        if not isinstance(entries := data.get("entries"), dict):
+            _LOGGER.debug("Ignoring malformed YAML cache %s", self.path)
+            return {}
+        return entries
+
+    def get(self, key: str, fname: str) -> tuple[bool, Any]:
+        """Return if the key is cached and the value parsed from it."""
+        with self._lock:
+            if (entries := self._entries) is None:
+                entries = self._entries = self._load()
+            if key not in entries:
+                return False, None
+            encoded = entries[key]
+        try:
+            value = _decode(encoded, fname)
+        except (TypeError, ValueError) as err:
+            _LOGGER.debug("Ignoring malformed YAML cache entry %s: %s", fname, err)
+            with self._lock:
+                if entries.get(key) is encoded:
+                    del entries[key]
+                    self._dirty = True
+            return False, None
+        with self._lock:
+            self._used.add(key)
+        return True, value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store the value parsed from the content with this key."""
+        try:
+            encoded = _encode(value)
+        except _Uncacheable:
+            return
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._load()
+            self._entries[key] = encoded
+            self._used.add(key)
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the used entries to disk if the cache changed."""
+        with self._lock:
+            if self._entries is None:
+                return
+            if unused := self._entries.keys() - self._used:
+                for key in unused:
+                    del self._entries[key]
+                self._dirty = True
+            if not self._dirty:
+                return
+            self._dirty = False
+            data = orjson.dumps({"version": CACHE_VERSION, "entries": self._entries})
+        try:
+            os.makedirs(self.path.parent, exist_ok=True)
+            write_utf8_file(str(self.path), data, mode="wb")
+        except (OSError, WriteError) as err:
+            _LOGGER.debug("Unable to save YAML cache %s: %s", self.path, err)
@@ -27,6 +27,7 @@ from propcache import cached_property
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.frame import report
 
+from .cache import ParseCache
 from .const import SECRET_YAML
 from .objects import Input, NodeDictClass, NodeListClass, NodeStrClass
 
@@ -36,6 +37,8 @@ JSON_TYPE = list | dict | str
 
 _LOGGER = logging.getLogger(__name__)
 
+_PARSE_CACHE: ParseCache | None = None
+
 
 class YamlTypeError(HomeAssistantError):
     """Raised by load_yaml_dict if top level data is not a dict."""
@@ -113,6 +116,8 @@ class _LoaderMixin:
 
     name: str
     stream: Any
+    # Cleared when the parsed value depends on more than the content
+    cacheable = True
 
     @cached_property
     def get_name(self) -> str:
@@ -228,7 +233,9 @@ def load_yaml(
     """
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            if (cache := _PARSE_CACHE) is None:
+                return parse_yaml(conf_file, secrets)
+            return _parse_yaml_cached(cache, conf_file, secrets)
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
@@ -238,6 +245,44 @@ def load_yaml(
         raise HomeAssistantError(exc) from exc
 
 
+def set_parse_cache(cache: ParseCache | None) -> None:
+    """Set the cache used by load_yaml to skip parsing unchanged files."""
+    global _PARSE_CACHE  # noqa: PLW0603
+    _PARSE_CACHE = cache
+
+
+def save_parse_cache() -> None:
+    """Save the parse cache if one is set.
+
+    This method needs to run in an executor.
+    """
+    if (cache := _PARSE_CACHE) is not None:
+        cache.save()
+
+
+def _parse_yaml_cached(
+    cache: ParseCache, conf_file: TextIO, secrets: Secrets | None
+) -> JSON_TYPE | None:
+    """Parse a YAML file, reusing the parsed value if the content is unchanged."""
+    key = cache.key(conf_file.read())
+    found, value = cache.get(key, conf_file.name)
+    if found:
+        return value
+    conf_file.seek(0, 0)
+    loader = (FastSafeLoader if HAS_C_LOADER else PythonSafeLoader)(conf_file, secrets)
+    try:
+        value = loader.get_single_data()
+    except yaml.YAMLError:
+        # Let parse_yaml report the error
+        conf_file.seek(0, 0)
+        return parse_yaml(conf_file, secrets)
+    finally:
+        loader.dispose()
+    if loader.cacheable:
+        cache.set(key, value)
+    return value
+
+
 def load_yaml_dict(
     fname: str | os.PathLike[str], secrets: Secrets | None = None
 ) -> dict:
@@ -496,6 +541,8 @@ def _handle_mapping_tag(
             ) from exc
 
         if key in seen:
+            # Keep logging the warning on every load
+            loader.cacheable = False
             fname = loader.get_stream_name
             _LOGGER.warning(
                 'YAML file %s contains duplicate key "%s". Check lines %d and %d',
@@ -546,8 +593,20 @@ def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     return loader.secrets.get(loader.get_name, node.value)
 
 
+def _uncacheable_constructor(constructor: Any) -> Any:
+    """Wrap the constructor of a tag so the file using it is not cached."""
+
+    def wrapper(loader: LoaderType, node: yaml.nodes.Node) -> Any:
+        loader.cacheable = False
+        return constructor(loader, node)
+
+    return wrapper
+
+
 def add_constructor(tag: Any, constructor: Any) -> None:
     """Add to constructor to all loaders."""
+    if isinstance(tag, str) and tag.startswith("!"):
+        constructor = _uncacheable_constructor(constructor)
     for yaml_loader in (FastSafeLoader, PythonSafeLoader):
         yaml_loader.add_constructor(tag, constructor)
 
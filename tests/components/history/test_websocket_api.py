@@ -10,7 +10,12 @@ import pytest
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
 from homeassistant.components.recorder import Recorder
-from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, STATE_OFF, STATE_ON
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    STATE_OFF,
+    STATE_ON,
+    STATE_UNAVAILABLE,
+)
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.setup import async_setup_component
@@ -173,6 +178,67 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_max_points(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsamples numeric states to max_points."""
+    start = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    values = [str(value % 10) for value in range(40)]
+    values[13] = "100"
+    values[25] = STATE_UNAVAILABLE
+    for second, value in enumerate(values, start=1):
+        with freeze_time(start + timedelta(seconds=second)):
+            hass.states.async_set("sensor.test", value)
+            hass.states.async_set("sensor.other", str(second % 2))
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["sensor.test", "sensor.other"],
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+            "max_points": 8,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    sensor_history = response["result"]["sensor.test"]
+    states = [state["s"] for state in sensor_history]
+    # Two buckets of at most four numeric states, the unavailable gap
+    # splits the second bucket in two
+    assert len(states) <= 13
+    assert states[0] == values[0]
+    assert states[-1] == values[-1]
+    assert "100" in states
+    assert STATE_UNAVAILABLE in states
+    timestamps = [state["lu"] for state in sensor_history]
+    assert timestamps == sorted(timestamps)
+    assert len(response["result"]["sensor.other"]) <= 8
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+            "max_points": 100,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert [state["s"] for state in response["result"]["sensor.test"]] == values
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -543,6 +609,108 @@ async def test_history_stream_historical_only(
     }
 
 
+async def test_history_stream_historical_only_chunked(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream sends one message per chunk of entities."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    last_updated: dict[str, float] = {}
+    for entity_id in ("sensor.one", "sensor.two", "sensor.three"):
+        hass.states.async_set(entity_id, "on")
+        last_updated[entity_id] = hass.states.get(entity_id).last_updated_timestamp
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one", "sensor.two", "sensor.three"],
+            "start_time": now.isoformat(),
+            "end_time": end_time.isoformat(),
+            "no_attributes": True,
+            "minimal_response": True,
+            "chunk_size": 2,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["type"] == "result"
+
+    response = await client.receive_json()
+    assert response == {
+        "event": {
+            "end_time": pytest.approx(last_updated["sensor.two"]),
+            "start_time": pytest.approx(now.timestamp()),
+            "states": {
+                "sensor.one": [
+                    {"lu": pytest.approx(last_updated["sensor.one"]), "s": "on"}
+                ],
+                "sensor.two": [
+                    {"lu": pytest.approx(last_updated["sensor.two"]), "s": "on"}
+                ],
+            },
+        },
+        "id": 1,
+        "type": "event",
+    }
+    response = await client.receive_json()
+    assert response == {
+        "event": {
+            "end_time": pytest.approx(last_updated["sensor.three"]),
+            "start_time": pytest.approx(now.timestamp()),
+            "states": {
+                "sensor.three": [
+                    {"lu": pytest.approx(last_updated["sensor.three"]), "s": "on"}
+                ],
+            },
+        },
+        "id": 1,
+        "type": "event",
+    }
+
+
+async def test_history_stream_chunked_without_states(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test a chunked history stream sends a single empty message without states."""
+    await async_setup_component(hass, "history", {})
+    await async_wait_recording_done(hass)
+    far_past = dt_util.utcnow() - timedelta(days=1000)
+    far_past_end = far_past + timedelta(seconds=10)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one", "sensor.two", "sensor.three"],
+            "start_time": far_past.isoformat(),
+            "end_time": far_past_end.isoformat(),
+            "chunk_size": 1,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    response = await client.receive_json()
+    assert response == {
+        "event": {
+            "end_time": far_past_end.timestamp(),
+            "start_time": far_past.timestamp(),
+            "states": {},
+        },
+        "id": 1,
+        "type": "event",
+    }
+    await client.send_json({"id": 2, "type": "ping"})
+    assert (await client.receive_json())["type"] == "pong"
+
+
 async def test_history_stream_significant_domain_historical_only(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
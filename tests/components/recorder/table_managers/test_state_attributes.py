@@ -0,0 +1,46 @@
+"""The tests for the Recorder component."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder.db_schema import StateAttributes
+from homeassistant.core import HomeAssistant
+
+from ..common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+async def test_unchanged_attributes_are_not_serialized_again(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test attributes shared with the old state are only serialized once."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    with patch.object(
+        StateAttributes,
+        "shared_attrs_bytes_from_event",
+        wraps=StateAttributes.shared_attrs_bytes_from_event,
+    ) as serialize_mock:
+        for value in range(5):
+            hass.states.async_set("sensor.power", str(value), {"unit": "W"})
+        await async_wait_recording_done(hass)
+        assert serialize_mock.call_count == 1
+
+        hass.states.async_set("sensor.power", "5", {"unit": "kW"})
+        hass.states.async_set("sensor.power", "6", {"unit": "kW"})
+        await async_wait_recording_done(hass)
+        assert serialize_mock.call_count == 2
+
+        hass.states.async_remove("sensor.power")
+        hass.states.async_set("sensor.power", "7", {"unit": "kW"})
+        await async_wait_recording_done(hass)
+        assert serialize_mock.call_count == 4
+
+    cache_stats = instance.state_attributes_manager.get_cache_stats()
+    assert cache_stats["hits"] > 0
+    assert cache_stats["evictions"] == 0
+    assert cache_stats["max_size"] == 2048
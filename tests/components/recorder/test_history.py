@@ -5,6 +5,7 @@ from __future__ import annotations
 from copy import copy
 from datetime import datetime, timedelta
 import json
+import math
 from unittest.mock import sentinel
 
 from freezegun import freeze_time
@@ -1014,3 +1015,55 @@ async def test_get_last_state_changes_with_non_existent_entity_ids_returns_empty
 ) -> None:
     """Test get_last_state_changes returns an empty dict when entities not in the db."""
     assert history.get_last_state_changes(hass, 1, "nonexistent.entity") == {}
+
+
+async def test_get_numeric_states(hass: HomeAssistant) -> None:
+    """Test numeric states are returned as columnar arrays."""
+    hass.states.async_set("sensor.one", "1.5")
+    start = dt_util.utcnow() + timedelta(seconds=1)
+    times = [start + timedelta(seconds=i) for i in range(1, 5)]
+    for point, one, two in zip(
+        times, ("2", "unavailable", "nan", "4.25"), ("a", "5", "5", "6"), strict=True
+    ):
+        with freeze_time(point):
+            hass.states.async_set("sensor.one", one)
+            hass.states.async_set("sensor.two", two)
+    await async_wait_recording_done(hass)
+
+    hist = history.get_numeric_states(
+        hass, start, entity_ids=["sensor.one", "sensor.two", "sensor.missing"]
+    )
+    assert list(hist) == ["sensor.one", "sensor.two"]
+    one = hist["sensor.one"]
+    assert one.timestamps.typecode == one.values.typecode == "d"
+    assert list(one.timestamps) == pytest.approx(
+        [start.timestamp(), *(point.timestamp() for point in times)]
+    )
+    assert list(one.mask) == [1, 1, 0, 0, 1]
+    assert [value for value, ok in zip(one.values, one.mask, strict=True) if ok] == [
+        1.5,
+        2.0,
+        4.25,
+    ]
+    assert math.isnan(one.values[2])
+    assert math.isnan(one.values[3])
+    two = hist["sensor.two"]
+    # Unchanged states are not recorded again
+    assert list(two.timestamps) == pytest.approx(
+        [times[0].timestamp(), times[1].timestamp(), times[3].timestamp()]
+    )
+    assert list(two.mask) == [0, 1, 1]
+    assert list(two.values)[1:] == [5.0, 6.0]
+
+    hist = history.get_numeric_states(
+        hass, start, entity_ids=["sensor.one"], include_start_time_state=False
+    )
+    assert list(hist["sensor.one"].mask) == [1, 0, 0, 1]
+
+
+async def test_get_numeric_states_without_entity_ids_raises(
+    hass: HomeAssistant,
+) -> None:
+    """Test at least one entity id is required for get_numeric_states."""
+    with pytest.raises(ValueError, match="entity_ids must be provided"):
+        history.get_numeric_states(hass, dt_util.utcnow())
@@ -721,3 +721,23 @@ async def test_get_last_state_changes_with_non_existent_entity_ids_returns_empty
 ) -> None:
     """Test get_last_state_changes returns an empty dict when entities not in the db."""
     assert history.get_last_state_changes(hass, 1, "nonexistent.entity") == {}
+
+
+async def test_get_numeric_states(hass: HomeAssistant) -> None:
+    """Test numeric states are returned as arrays from the legacy schema."""
+    instance = recorder.get_instance(hass)
+    with patch.object(instance.states_meta_manager, "active", False):
+        start = dt_util.utcnow()
+        for offset, state in enumerate(("1", "unknown", "2.5")):
+            with freeze_time(start + timedelta(seconds=offset + 1)):
+                hass.states.async_set("sensor.one", state)
+        await async_wait_recording_done(hass)
+
+        hist = history.get_numeric_states(hass, start, entity_ids=["sensor.one"])
+    one = hist["sensor.one"]
+    assert list(one.timestamps) == pytest.approx(
+        [(start + timedelta(seconds=offset)).timestamp() for offset in (1, 2, 3)]
+    )
+    assert list(one.mask) == [1, 0, 1]
+    assert one.values[0] == 1.0
+    assert one.values[2] == 2.5
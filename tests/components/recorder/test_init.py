@@ -5,11 +5,12 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Generator
 from datetime import datetime, timedelta
+from functools import partial
 import sqlite3
 import sys
 import threading
 from typing import Any, cast
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import ANY, MagicMock, Mock, PropertyMock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
@@ -50,6 +51,7 @@ from homeassistant.components.recorder.db_schema import (
     StatesMeta,
     StatisticsRuns,
 )
+from homeassistant.components.recorder.history import get_significant_states
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
@@ -136,6 +138,7 @@ def _default_recorder(hass: HomeAssistant) -> Recorder:
         db_retry_wait=3,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
+        coalesce_filter=None,
     )
 
 
@@ -2149,6 +2152,44 @@ async def test_deduplication_event_data_inside_commit_interval(
         assert all(event.data_id == first_data_id for event in events)
 
 
+async def test_events_with_committed_ids_are_bulk_inserted(
+    hass: HomeAssistant, async_setup_recorder_instance: RecorderInstanceGenerator
+) -> None:
+    """Test events referencing committed rows are bulk inserted in order."""
+    instance = await async_setup_recorder_instance(hass, {"commit_interval": 30})
+    hass.bus.async_fire("bulk_event", {"bulk": "data"})
+    await async_wait_recording_done(hass)
+    await instance.async_block_till_done()
+
+    with patch.object(
+        instance, "_flush_pending_event_rows", wraps=instance._flush_pending_event_rows
+    ) as flush_mock:
+        for _ in range(5):
+            hass.bus.async_fire("bulk_event", {"bulk": "data"})
+        hass.bus.async_fire("bulk_event", {"bulk": "new data"})
+        for _ in range(5):
+            hass.bus.async_fire("bulk_event")
+        await async_wait_recording_done(hass)
+        await instance.async_block_till_done()
+
+    # Once before the event with new data and once on commit
+    assert flush_mock.call_count == 2
+
+    with session_scope(hass=hass, read_only=True) as session:
+        events = list(
+            session.query(Events, EventData)
+            .filter(Events.event_type_id.in_(select_event_type_ids(("bulk_event",))))
+            .outerjoin(EventData, (Events.data_id == EventData.data_id))
+            .order_by(Events.event_id)
+        )
+        assert len(events) == 12
+        assert [
+            event_data.to_native() if event_data else {} for _, event_data in events
+        ] == [{"bulk": "data"}] * 6 + [{"bulk": "new data"}] + [{}] * 5
+        time_fired = [event.time_fired_ts for event, _ in events]
+        assert time_fired == sorted(time_fired)
+
+
 async def test_deduplication_state_attributes_inside_commit_interval(
     small_cache_size: None,
     hass: HomeAssistant,
@@ -2725,6 +2766,206 @@ async def test_commit_before_commits_pending_writes(
     await verify_session_commit_future
 
 
+async def test_commit_window_adjusts_to_load(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test the commit window grows under load and shrinks once caught up."""
+    instance = await async_setup_recorder_instance(hass, {"commit_interval": 5})
+    assert instance.commit_window == 5
+    assert instance.coalesce_state_changes is False
+
+    with patch.object(
+        Recorder, "backlog", new_callable=PropertyMock, return_value=5000
+    ):
+        windows = []
+        for _ in range(4):
+            instance._adjust_commit_window(0.01)
+            windows.append(instance.commit_window)
+    # SQLite commits are capped at 30 seconds
+    assert windows == [10, 20, 30, 30]
+    assert instance.coalesce_state_changes is True
+
+    with patch.object(Recorder, "backlog", new_callable=PropertyMock, return_value=0):
+        windows = []
+        for _ in range(4):
+            instance._adjust_commit_window(0.01)
+            windows.append(instance.commit_window)
+        assert windows == [15, 7.5, 5, 5]
+        assert instance.coalesce_state_changes is False
+
+        # A slow commit lengthens the window even without a backlog
+        instance._adjust_commit_window(2)
+        assert instance.commit_window == 10
+        assert instance.coalesce_state_changes is False
+
+
+async def test_attribute_changes_coalesced_under_backpressure(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test attribute only changes are coalesced without losing state changes."""
+    instance = await async_setup_recorder_instance(hass, {"commit_interval": 30})
+    entity_id = "sensor.chatty"
+    start = dt_util.utcnow()
+    # Record the attributes so the coalesced states can be linked to them
+    for value in (3, 2, 1, 0):
+        hass.states.async_set(entity_id, "off", {"value": value})
+    await async_wait_recording_done(hass)
+    await instance.async_block_till_done()
+
+    with patch.object(instance, "_adjust_commit_window"):
+        instance.coalesce_state_changes = True
+        hass.states.async_set(entity_id, "on", {"value": 0})
+        first_on = hass.states.get(entity_id)
+        for value in range(1, 4):
+            hass.states.async_set(entity_id, "on", {"value": value})
+        last_on = hass.states.get(entity_id)
+        await async_wait_recording_done(hass)
+        await instance.async_block_till_done()
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(
+            session.query(States, StateAttributes)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+            .order_by(States.state_id)
+        )
+        # The state change is kept and the attribute only changes
+        # following it are coalesced into one state
+        assert [
+            (db_state.state, db_state_attributes.to_native())
+            for db_state, db_state_attributes in db_states
+        ] == [
+            ("off", {"value": 3}),
+            ("off", {"value": 2}),
+            ("off", {"value": 1}),
+            ("off", {"value": 0}),
+            ("on", {"value": 0}),
+            ("on", {"value": 3}),
+        ]
+        db_state = db_states[-1][0]
+        assert db_state.old_state_id == db_states[-2][0].state_id
+        assert db_state.last_updated_ts == pytest.approx(last_on.last_updated_timestamp)
+        assert db_state.last_changed_ts == pytest.approx(
+            first_on.last_changed_timestamp
+        )
+
+    history = await instance.async_add_executor_job(
+        partial(
+            get_significant_states,
+            hass,
+            start,
+            entity_ids=[entity_id],
+            significant_changes_only=True,
+        )
+    )
+    assert [(state.state, state.last_changed) for state in history[entity_id]] == [
+        ("off", ANY),
+        ("on", first_on.last_changed),
+    ]
+
+
+@pytest.mark.parametrize(
+    "coalesce",
+    [
+        {"include": {"entities": ["sensor.chatty"]}},
+        {"include": {"domains": ["sensor"]}, "exclude": {"entities": ["sensor.quiet"]}},
+    ],
+)
+async def test_coalesce_keeps_first_and_last_state(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    coalesce: dict[str, Any],
+) -> None:
+    """Test coalesced entities only keep the first and last state per commit."""
+    instance = await async_setup_recorder_instance(
+        hass, {"commit_interval": 30, "coalesce": coalesce}
+    )
+    attributes = {"unit_of_measurement": "W"}
+    for entity_id in ("sensor.chatty", "sensor.quiet"):
+        hass.states.async_set(entity_id, "0", attributes)
+    await async_wait_recording_done(hass)
+    await instance.async_block_till_done()
+
+    for value in range(1, 6):
+        for entity_id in ("sensor.chatty", "sensor.quiet"):
+            hass.states.async_set(entity_id, str(value), attributes)
+    await async_wait_recording_done(hass)
+    await instance.async_block_till_done()
+
+    def _get_states(entity_id: str) -> list[States]:
+        return list(
+            session.query(States)
+            .filter(States.metadata_id == StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == entity_id)
+            .order_by(States.state_id)
+        )
+
+    with session_scope(hass=hass, read_only=True) as session:
+        chatty_states = _get_states("sensor.chatty")
+        assert [db_state.state for db_state in chatty_states] == ["0", "1", "5"]
+        assert chatty_states[1].old_state_id == chatty_states[0].state_id
+        assert chatty_states[2].old_state_id == chatty_states[1].state_id
+        assert chatty_states[2].attributes_id == chatty_states[0].attributes_id
+
+        quiet_states = _get_states("sensor.quiet")
+        assert [db_state.state for db_state in quiet_states] == [
+            "0",
+            "1",
+            "2",
+            "3",
+            "4",
+            "5",
+        ]
+
+
+async def test_coalesce_keeps_state_change_followed_by_attribute_change(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test a coalesced state change is not overwritten by an attribute change."""
+    instance = await async_setup_recorder_instance(
+        hass,
+        {
+            "commit_interval": 30,
+            "coalesce": {"include": {"entities": ["sensor.chatty"]}},
+        },
+    )
+    entity_id = "sensor.chatty"
+    start = dt_util.utcnow()
+    # Record the attributes so the coalesced states can be linked to them
+    hass.states.async_set(entity_id, "0", {"value": 1})
+    hass.states.async_set(entity_id, "0", {"value": 0})
+    await async_wait_recording_done(hass)
+    await instance.async_block_till_done()
+
+    hass.states.async_set(entity_id, "1", {"value": 0})
+    hass.states.async_set(entity_id, "2", {"value": 0})
+    changed = hass.states.get(entity_id)
+    hass.states.async_set(entity_id, "2", {"value": 1})
+    await async_wait_recording_done(hass)
+    await instance.async_block_till_done()
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert [db_state.state for db_state in db_states] == ["0", "0", "1", "2", "2"]
+        assert db_states[-1].old_state_id == db_states[-2].state_id
+
+    history = await instance.async_add_executor_job(
+        partial(
+            get_significant_states,
+            hass,
+            start,
+            entity_ids=[entity_id],
+            significant_changes_only=True,
+        )
+    )
+    assert [state.state for state in history[entity_id]] == ["0", "1", "2"]
+    assert history[entity_id][-1].last_changed == changed.last_changed
+
+
 async def test_all_tables_use_default_table_args(hass: HomeAssistant) -> None:
     """Test that all tables use the default table args."""
     for table in db_schema.Base.metadata.tables.values():
@@ -4,6 +4,7 @@ from collections.abc import Generator
 from datetime import datetime, timedelta
 import json
 import sqlite3
+from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
@@ -13,7 +14,10 @@ from sqlalchemy.orm.session import Session
 from voluptuous.error import MultipleInvalid
 
 from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN, Recorder
-from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.const import (
+    SIGNAL_PURGE_PROGRESS,
+    SupportedDialect,
+)
 from homeassistant.components.recorder.db_schema import (
     Events,
     EventTypes,
@@ -34,7 +38,8 @@ from homeassistant.components.recorder.services import (
 from homeassistant.components.recorder.tasks import PurgeTask
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import EVENT_STATE_CHANGED, EVENT_THEMES_UPDATED, STATE_ON
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.util import dt as dt_util
 
 from .common import (
@@ -206,6 +211,74 @@ async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) ->
         assert state_attributes.count() == 3
 
 
+async def test_purge_progress(hass: HomeAssistant, recorder_mock: Recorder) -> None:
+    """Test the purge progress is tracked and sent to subscribers."""
+    await _add_test_states(hass)
+    progress_updates: list[dict[str, Any]] = []
+
+    @callback
+    def _progress_listener(progress: dict[str, Any]) -> None:
+        progress_updates.append(progress)
+
+    async_dispatcher_connect(hass, SIGNAL_PURGE_PROGRESS, _progress_listener)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    finished = purge_old_data(
+        recorder_mock,
+        purge_before,
+        states_batch_size=1,
+        events_batch_size=1,
+        repack=False,
+    )
+    assert not finished
+    await hass.async_block_till_done()
+    assert len(progress_updates) == 1
+    assert progress_updates[0]["deleted_rows"] == {
+        "states": 4,
+        "state_attributes": 2,
+    }
+    assert progress_updates[0]["purge_before"] == purge_before.isoformat()
+    assert progress_updates[0]["progress"] == 1.0
+    assert progress_updates[0]["finished"] is False
+
+    finished = purge_old_data(recorder_mock, purge_before, repack=False)
+    assert finished
+    await hass.async_block_till_done()
+    assert len(progress_updates) == 2
+    assert progress_updates[1]["deleted_rows"] == progress_updates[0]["deleted_rows"]
+    assert progress_updates[1]["eta"] == 0.0
+    assert progress_updates[1]["finished"] is True
+    assert recorder_mock.purge_progress.finished is True
+
+    # A new purge starts over
+    purge_before = dt_util.utcnow()
+    finished = purge_old_data(recorder_mock, purge_before, repack=False)
+    assert finished
+    await hass.async_block_till_done()
+    assert len(progress_updates) == 3
+    assert progress_updates[2]["deleted_rows"]["states"] == 2
+    assert progress_updates[2]["deleted_rows"]["state_attributes"] == 1
+    assert progress_updates[2]["finished"] is True
+
+
+async def test_purge_yields_to_backlog(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test a purge cycle ends early when events are waiting to be recorded."""
+    await _add_test_states(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 1),
+        patch("homeassistant.components.recorder.purge.PURGE_YIELD_BACKLOG", -1),
+    ):
+        finished = purge_old_data(recorder_mock, purge_before, repack=False)
+    assert not finished
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 5
+
+
 @pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
 @pytest.mark.usefixtures("recorder_mock", "skip_by_db_engine")
 async def test_purge_old_states_encouters_database_corruption(
@@ -9,7 +9,11 @@ from sqlalchemy import select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    StatisticsDaily,
+    StatisticsMonthly,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -2647,3 +2651,208 @@ async def test_recorder_platform_with_partial_statistics_support(
 
     for meth in supported_methods:
         getattr(recorder_platform, meth).assert_called_once()
+
+
+async def test_reduce_statistics_per_day(hass: HomeAssistant) -> None:
+    """Test reducing hourly statistics with gaps and missing values to days."""
+    await hass.config.async_set_time_zone("Europe/Amsterdam")
+    day_start = dt_util.as_local(dt_util.parse_datetime("2023-10-28 00:00:00+02:00"))
+    hours = [
+        # Day before the DST change
+        (day_start, 1.0, 5.0),
+        (day_start + timedelta(hours=3), None, 7.0),
+        (day_start + timedelta(hours=23), 3.0, 2.0),
+        # The DST change day has 25 hours
+        (day_start + timedelta(hours=24), 4.0, 4.0),
+        (day_start + timedelta(hours=49), 6.0, 1.0),
+        # A day without statistics is skipped
+        (day_start + timedelta(hours=96), None, None),
+    ]
+    stats = {
+        "sensor.test": [
+            {
+                "start": start.timestamp(),
+                "end": (start + timedelta(hours=1)).timestamp(),
+                "mean": mean,
+                "min": min_,
+                "max": mean,
+                "sum": idx,
+                "state": idx,
+                "last_reset": None,
+            }
+            for idx, (start, mean, min_) in enumerate(hours)
+        ]
+    }
+    types = {"last_reset", "max", "mean", "min", "state", "sum"}
+
+    reduced = statistics._reduce_statistics_per_day(stats, types)
+
+    day_ts = [
+        dt_util.as_local(dt_util.parse_datetime(day)).timestamp()
+        for day in (
+            "2023-10-28 00:00:00+02:00",
+            "2023-10-29 00:00:00+02:00",
+            "2023-10-30 00:00:00+01:00",
+            "2023-11-01 00:00:00+01:00",
+            "2023-11-02 00:00:00+01:00",
+        )
+    ]
+    assert reduced == {
+        "sensor.test": [
+            {
+                "start": day_ts[0],
+                "end": day_ts[1],
+                "mean": 2.0,
+                "min": 2.0,
+                "max": 3.0,
+                "sum": 2,
+                "state": 2,
+                "last_reset": None,
+            },
+            {
+                "start": day_ts[1],
+                "end": day_ts[2],
+                "mean": 4.0,
+                "min": 4.0,
+                "max": 4.0,
+                "sum": 3,
+                "state": 3,
+                "last_reset": None,
+            },
+            {
+                "start": day_ts[2],
+                "end": day_ts[2] + 24 * 3600,
+                "mean": 6.0,
+                "min": 1.0,
+                "max": 6.0,
+                "sum": 4,
+                "state": 4,
+                "last_reset": None,
+            },
+            {
+                "start": day_ts[3],
+                "end": day_ts[4],
+                "mean": None,
+                "min": None,
+                "max": None,
+                "sum": 5,
+                "state": 5,
+                "last_reset": None,
+            },
+        ]
+    }
+
+
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.freeze_time("2022-11-03 12:00:00+00:00")
+async def test_rollup_statistics(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    timezone: str,
+) -> None:
+    """Test daily and monthly rollups give the same result as hourly statistics."""
+    await hass.config.async_set_time_zone(timezone)
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    statistic_id = "test:total_energy_import"
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-09-28 00:00:00"))
+    end = dt_util.as_utc(dt_util.parse_datetime("2022-11-03 06:00:00"))
+    external_statistics = [
+        {
+            "start": start + timedelta(hours=idx),
+            "last_reset": None,
+            "mean": idx % 7 + idx / 100,
+            "min": idx % 5,
+            "max": idx % 11 + 10,
+            "state": idx % 24,
+            "sum": idx,
+        }
+        for idx in range(int((end - start).total_seconds() // 3600))
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": statistic_id,
+        "unit_of_measurement": "kWh",
+    }
+    queries = (
+        ("day", {"last_reset", "max", "mean", "min", "state", "sum"}),
+        ("day", {"change"}),
+        ("week", {"max", "mean", "min"}),
+        ("week", {"max", "state", "sum"}),
+        ("month", {"last_reset", "max", "mean", "min", "state", "sum"}),
+        ("month", {"change"}),
+    )
+
+    def _query() -> list[list[dict[str, Any]]]:
+        # The database and Python calculate the mean with different rounding
+        return [
+            [
+                {
+                    key: round(value, 9) if isinstance(value, float) else value
+                    for key, value in row.items()
+                }
+                for row in statistics_during_period(
+                    hass,
+                    start,
+                    period=period,
+                    statistic_ids={statistic_id},
+                    types=types,
+                )[statistic_id]
+            ]
+            for period, types in queries
+        ]
+
+    def _query_hourly() -> list[list[dict[str, Any]]]:
+        with patch.object(statistics, "_get_rollup_end_ts", return_value=None):
+            return _query()
+
+    def _count_rollups() -> tuple[int, int]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return (
+                session.query(StatisticsDaily).count(),
+                session.query(StatisticsMonthly).count(),
+            )
+
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+    assert _count_rollups() == (0, 0)
+
+    # Compile an hour, the rollups of completed days and months are caught up
+    do_adhoc_statistics(hass, start=dt_util.utcnow().replace(hour=10, minute=55))
+    await async_wait_recording_done(hass)
+    assert _count_rollups() == (36, 2)
+    expected = _query_hourly()
+    assert len(expected[0]) == 37
+    assert _query() == expected
+
+    # Adjusting the sum updates the rollups
+    instance.async_adjust_statistics(
+        statistic_id,
+        dt_util.as_utc(dt_util.parse_datetime("2022-10-10 12:00:00")),
+        100,
+        "kWh",
+    )
+    await async_wait_recording_done(hass)
+    expected = _query_hourly()
+    assert expected[0][12]["sum"] == 13 * 24 - 1 + 100
+    assert _query() == expected
+
+    # Importing statistics updates the rollups
+    external_statistics[100]["max"] = 1000
+    external_statistics[101]["sum"] = -1
+    async_add_external_statistics(hass, external_metadata, external_statistics[100:102])
+    await async_wait_recording_done(hass)
+    expected = _query_hourly()
+    assert expected[4][1]["max"] == 1000
+    assert _query() == expected
+
+    # The rollups are rebuilt after a time zone change
+    await hass.config.async_set_time_zone("Asia/Kolkata")
+    expected = _query_hourly()
+    do_adhoc_statistics(hass, start=dt_util.utcnow().replace(hour=11, minute=55))
+    await async_wait_recording_done(hass)
+    assert _count_rollups() == (36, 2)
+    assert _query() == expected
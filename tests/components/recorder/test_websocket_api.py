@@ -32,6 +32,7 @@ from homeassistant.util.unit_system import METRIC_SYSTEM, US_CUSTOMARY_SYSTEM
 
 from .common import (
     async_recorder_block_till_done,
+    async_wait_purge_done,
     async_wait_recording_done,
     create_engine_test,
     do_adhoc_statistics,
@@ -2542,6 +2543,75 @@ async def test_recorder_info(
     }
 
 
+async def test_recorder_cache_info(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting the recorder cache counters."""
+    client = await hass_ws_client()
+    hass.states.async_set("sensor.power", "1", {"unit": "W"})
+    hass.states.async_set("sensor.power", "2", {"unit": "kW"})
+    await async_wait_recording_done(hass)
+
+    await client.send_json_auto_id({"type": "recorder/cache_info"})
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert set(result) == {
+        "event_data",
+        "event_types",
+        "state_attributes",
+        "states_meta",
+    }
+    assert result["state_attributes"] == {
+        "hits": ANY,
+        "misses": ANY,
+        "evictions": 0,
+        "size": 2,
+        "max_size": 2048,
+    }
+
+
+async def test_recorder_subscribe_purge_progress(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test subscribing to the purge progress."""
+    client = await hass_ws_client()
+    hass.states.async_set("sensor.power", "1")
+    await async_wait_recording_done(hass)
+
+    await client.send_json_auto_id({"type": "recorder/subscribe_purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+
+    await hass.services.async_call(
+        recorder.DOMAIN, "purge", {"keep_days": 0}, blocking=True
+    )
+    await async_wait_purge_done(hass)
+
+    events = []
+    while not events or not events[-1]["finished"]:
+        response = await client.receive_json()
+        assert response["type"] == "event"
+        events.append(response["event"])
+    assert events[0]["deleted_rows"]["states"] == 1
+    assert events[-1] == {
+        "purge_before": ANY,
+        "deleted_rows": events[0]["deleted_rows"],
+        "elapsed": ANY,
+        "rows_per_second": ANY,
+        "progress": 1.0,
+        "eta": 0.0,
+        "finished": True,
+    }
+
+    # A new subscriber gets the progress of the last purge right away
+    await client.send_json_auto_id({"type": "recorder/subscribe_purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["event"]["finished"] is True
+
+
 async def test_recorder_info_no_recorder(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
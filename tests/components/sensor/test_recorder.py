@@ -36,6 +36,7 @@ from homeassistant.components.recorder.statistics import (
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
 from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
+from homeassistant.components.sensor.recorder import STATISTICS_ACCUMULATORS
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import issue_registry as ir
@@ -313,6 +314,150 @@ async def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+@pytest.mark.parametrize(
+    ("previous_state", "mean", "min", "max"),
+    [
+        ("20", (20 * 5 - 10 * 50 + 15 * 200 + 30 * 45) / 300, -10, 30),
+        (STATE_UNAVAILABLE, (-10 * 50 + 15 * 200 + 30 * 45) / 295, -10, 30),
+        ("40", (40 * 5 - 10 * 50 + 15 * 200 + 30 * 45) / 300, -10, 40),
+    ],
+)
+async def test_compile_statistics_from_accumulated_states(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    previous_state: str,
+    mean: float,
+    min: float,
+    max: float,
+) -> None:
+    """Test measurement statistics are compiled without querying history."""
+    zero = get_start_time(dt_util.utcnow())
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    attributes = {
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "unit_of_measurement": "°C",
+    }
+    freezer.move_to(zero - timedelta(minutes=5))
+    hass.states.async_set("sensor.test1", previous_state, attributes=attributes)
+    # The first compile starts accumulating for the following periods
+    do_adhoc_statistics(hass, start=zero - timedelta(minutes=10))
+    await async_wait_recording_done(hass)
+
+    await async_record_states(hass, freezer, zero, "sensor.test1", attributes)
+    await async_wait_recording_done(hass)
+    freezer.move_to(zero + timedelta(minutes=5, seconds=10))
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_history_mock:
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+    get_history_mock.assert_not_called()
+
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "start": process_timestamp(zero).timestamp(),
+                "end": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+                "mean": pytest.approx(mean),
+                "min": pytest.approx(min),
+                "max": pytest.approx(max),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ]
+    }
+
+    # Periods without state changes keep the last value
+    freezer.move_to(zero + timedelta(minutes=10, seconds=10))
+    do_adhoc_statistics(hass, start=zero + timedelta(minutes=5))
+    await async_wait_recording_done(hass)
+    stats = statistics_during_period(
+        hass, zero + timedelta(minutes=5), period="5minute"
+    )
+    assert stats["sensor.test1"][0]["mean"] == pytest.approx(30)
+    assert stats["sensor.test1"][0]["min"] == pytest.approx(30)
+    assert stats["sensor.test1"][0]["max"] == pytest.approx(30)
+
+
+async def test_compile_statistics_accumulated_unit_change(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test accumulated statistics fall back to history when the unit changes."""
+    zero = get_start_time(dt_util.utcnow())
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    attributes = {
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "unit_of_measurement": "°C",
+    }
+    freezer.move_to(zero - timedelta(minutes=5))
+    hass.states.async_set("sensor.test1", "10", attributes=attributes)
+    do_adhoc_statistics(hass, start=zero - timedelta(minutes=10))
+    await async_wait_recording_done(hass)
+
+    freezer.move_to(zero + timedelta(minutes=1))
+    hass.states.async_set(
+        "sensor.test1", "50", attributes={**attributes, "unit_of_measurement": "°F"}
+    )
+    await async_wait_recording_done(hass)
+    freezer.move_to(zero + timedelta(minutes=5, seconds=10))
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_history_mock:
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+    assert get_history_mock.call_args.kwargs["entity_ids"] == ["sensor.test1"]
+
+    stats = statistics_during_period(
+        hass, zero, period="5minute", units={"temperature": "°C"}
+    )
+    # 10 °C until the state changes to 50 °F which is also 10 °C
+    assert stats["sensor.test1"][0]["mean"] == pytest.approx(10)
+
+
+async def test_accumulated_statistics_only_track_sensors_with_state_class(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test only sensors which compile statistics are accumulated."""
+    zero = get_start_time(dt_util.utcnow())
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    attributes = {"state_class": "measurement", "unit_of_measurement": "°C"}
+    freezer.move_to(zero - timedelta(minutes=5))
+    hass.states.async_set("sensor.test1", "10", attributes=attributes)
+    hass.states.async_set(
+        "sensor.test2", "10", attributes={"unit_of_measurement": "°C"}
+    )
+    do_adhoc_statistics(hass, start=zero - timedelta(minutes=10))
+    await async_wait_recording_done(hass)
+    accumulators = hass.data[STATISTICS_ACCUMULATORS]._accumulators
+    assert set(accumulators) == {"sensor.test1"}
+
+    hass.states.async_set("sensor.test2", "20", attributes=attributes)
+    hass.states.async_set("sensor.test3", "20", attributes={})
+    hass.states.async_set("input_number.test", "20", attributes=attributes)
+    await hass.async_block_till_done()
+    assert set(accumulators) == {"sensor.test1", "sensor.test2"}
+
+    hass.states.async_set("sensor.test1", "20", attributes={})
+    await hass.async_block_till_done()
+    assert set(accumulators) == {"sensor.test2"}
+
+
 @pytest.mark.parametrize(
     (
         "device_class",
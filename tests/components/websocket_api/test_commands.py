@@ -6,6 +6,7 @@ import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 import voluptuous as vol
 
@@ -19,7 +20,7 @@ from homeassistant.components.websocket_api.auth import (
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
@@ -692,6 +693,35 @@ async def test_get_states(
     assert msg["result"] == states
 
 
+async def test_get_states_snapshot_updates(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test get_states picks up state changes after the first snapshot."""
+    hass.states.async_set("greeting.hello", "world")
+    hass.states.async_set("greeting.bye", "universe")
+
+    await websocket_client.send_json({"id": 5, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert msg["result"] == [state.as_dict() for state in hass.states.async_all()]
+
+    hass.states.async_set("greeting.hello", "there")
+    hass.states.async_remove("greeting.bye")
+    hass.states.async_set("greeting.new", "state")
+
+    for id_ in (6, 7):
+        await websocket_client.send_json({"id": id_, "type": "get_states"})
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == id_
+        assert msg["result"] == [state.as_dict() for state in hass.states.async_all()]
+
+    await websocket_client.send_json({"id": 8, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"].keys() == {"greeting.hello", "greeting.new"}
+    assert msg["event"]["a"]["greeting.hello"]["s"] == "there"
+
+
 async def test_get_services(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -1310,6 +1340,171 @@ async def test_subscribe_unsubscribe_entities_with_filter(
     }
 
 
+async def test_subscribe_entities_shared_listener(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test subscribe_entities subscriptions share one listener and permissions."""
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.other", "off")
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+    init_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "entity_ids": ["light.permitted"]}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.permitted"]
+
+    await websocket_client.send_json({"id": 8, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.permitted"]
+
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == init_count + 1
+
+    hass.states.async_set("light.other", "on")
+    hass.states.async_set("light.permitted", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert list(msg["event"]["c"]) == ["light.permitted"]
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert list(msg["event"]["c"]) == ["light.permitted"]
+
+    # Changing the permissions of the user is picked up by the cache
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.other": True}}})
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.other", "off")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert list(msg["event"]["c"]) == ["light.other"]
+
+    await websocket_client.send_json(
+        {"id": 9, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    await websocket_client.send_json(
+        {"id": 10, "type": "unsubscribe_events", "subscription": 8}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == init_count
+
+
+async def test_subscribe_entities_coalesced(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test subscribe_entities coalesces state changes per entity."""
+    hass.states.async_set("light.changed", "off", {"color": "red", "effect": "x"})
+    hass.states.async_set("light.removed", "off")
+    hass.states.async_set("light.unchanged", "off")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "coalesce_ms": 50}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {
+        "light.changed",
+        "light.removed",
+        "light.unchanged",
+    }
+
+    freezer.tick(1)
+    hass.states.async_set("light.changed", "on", {"color": "red", "effect": "x"})
+    freezer.tick(1)
+    hass.states.async_set("light.changed", "on", {"color": "blue", "effect": "x"})
+    hass.states.async_set("light.changed", "on", {"color": "blue"})
+    hass.states.async_set("light.added", "on")
+    hass.states.async_set("light.added", "off")
+    hass.states.async_remove("light.removed")
+    hass.states.async_set("light.temporary", "on")
+    hass.states.async_remove("light.temporary")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.added": {"a": {}, "c": ANY, "lc": ANY, "s": "off"},
+        },
+        "c": {
+            "light.changed": {
+                "+": {
+                    "a": {"color": "blue"},
+                    "c": ANY,
+                    "lc": ANY,
+                    "lu": ANY,
+                    "s": "on",
+                },
+                "-": {"a": ["effect"]},
+            }
+        },
+        "r": ["light.removed"],
+    }
+
+    hass.states.async_set("light.unchanged", "on")
+    freezer.tick(1)
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "c": {"light.unchanged": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+    }
+
+
+async def test_subscribe_entities_coalesced_state_then_attribute_change(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a coalesced state change followed by an attribute change."""
+    hass.states.async_set("light.test", "off", {"color": "red"})
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "coalesce_ms": 50}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.test"}
+
+    freezer.tick(1)
+    hass.states.async_set("light.test", "on", {"color": "red"})
+    changed = hass.states.get("light.test")
+    freezer.tick(1)
+    hass.states.async_set("light.test", "on", {"color": "blue"})
+    updated = hass.states.get("light.test")
+    assert changed.last_changed == updated.last_changed
+    assert updated.last_updated != updated.last_changed
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "c": {
+            "light.test": {
+                "+": {
+                    "a": {"color": "blue"},
+                    "c": ANY,
+                    "lc": updated.last_changed_timestamp,
+                    "lu": updated.last_updated_timestamp,
+                    "s": "on",
+                }
+            }
+        }
+    }
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -2563,6 +2758,31 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_import_info(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test integration/import_info."""
+    with patch(
+        "homeassistant.components.websocket_api.commands.async_get_import_timings",
+        return_value={
+            "homeassistant.components.august": 1.5,
+            "homeassistant.components.august.lock": 0.2,
+        },
+    ):
+        await websocket_client.send_json({"id": 7, "type": "integration/import_info"})
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {"module": "homeassistant.components.august", "seconds": 1.5},
+        {"module": "homeassistant.components.august.lock", "seconds": 0.2},
+    ]
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
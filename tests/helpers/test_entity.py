@@ -21,6 +21,7 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    EVENT_STATE_CHANGED_BATCH,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     EntityCategory,
@@ -44,6 +45,7 @@ from tests.common import (
     MockEntityPlatform,
     MockModule,
     MockPlatform,
+    async_capture_events,
     mock_integration,
     mock_registry,
 )
@@ -2665,3 +2667,37 @@ async def test_async_write_ha_state_thread_safety_always(
     ):
         await hass.async_add_executor_job(ent2.async_write_ha_state)
     assert not hass.states.get(ent2.entity_id)
+
+
+async def test_async_write_ha_states(hass: HomeAssistant) -> None:
+    """Test writing the states of several entities at once."""
+    batch_events = async_capture_events(hass, EVENT_STATE_CHANGED_BATCH)
+
+    ent1 = entity.Entity()
+    ent1.entity_id = "test.one"
+    ent1._attr_state = "on"
+    ent2 = entity.Entity()
+    ent2.entity_id = "test.two"
+    ent2._attr_state = "x" * 256
+    for ent in (ent1, ent2):
+        ent.hass = hass
+        ent.platform = MockEntityPlatform(hass, domain="test")
+
+    entity.async_write_ha_states(hass, [ent1, ent2])
+    await hass.async_block_till_done()
+
+    assert hass.states.get("test.one").state == "on"
+    assert hass.states.get("test.two").state == STATE_UNKNOWN
+    assert len(batch_events) == 1
+    assert [change["entity_id"] for change in batch_events[0].data["changes"]] == [
+        "test.one",
+        "test.two",
+    ]
+
+    with pytest.raises(
+        RuntimeError,
+        match="Detected code that calls async_write_ha_states from a thread.",
+    ):
+        await hass.async_add_executor_job(
+            entity.async_write_ha_states, hass, [ent1, ent2]
+        )
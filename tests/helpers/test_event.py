@@ -4,6 +4,7 @@ import asyncio
 from collections.abc import Callable
 import contextlib
 from datetime import date, datetime, timedelta
+import time
 from unittest.mock import patch
 
 from astral import LocationInfo
@@ -13,7 +14,7 @@ from freezegun.api import FrozenDateTimeFactory
 import jinja2
 import pytest
 
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import (
     Event,
@@ -26,10 +27,12 @@ from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    DATA_MONOTONIC_TIMER_WHEEL,
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_enable_timer_wheel,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -111,6 +114,134 @@ async def test_track_point_in_time(hass: HomeAssistant) -> None:
     assert len(runs) == 2
 
 
+async def test_timer_wheel(hass: HomeAssistant) -> None:
+    """Test time trackers scheduled with the timer wheel."""
+    timer_wheel = async_enable_timer_wheel(hass)
+    assert async_enable_timer_wheel(hass) is timer_wheel
+    now = dt_util.utcnow().replace(microsecond=0)
+    runs = []
+
+    for offset in (0.1, 0.3, 0.2):
+        async_track_point_in_utc_time(
+            hass,
+            callback(lambda x, offset=offset: runs.append(offset)),
+            now + timedelta(seconds=10, milliseconds=offset * 1000),
+        )
+    unsub = async_track_point_in_utc_time(
+        hass, callback(lambda x: runs.append("cancelled")), now + timedelta(seconds=10)
+    )
+    async_track_point_in_utc_time(
+        hass, callback(lambda x: runs.append("later")), now + timedelta(hours=2)
+    )
+    minute_point = now + timedelta(seconds=90, milliseconds=500)
+    async_track_point_in_utc_time(
+        hass, callback(lambda x: runs.append("minute")), minute_point
+    )
+    unsub()
+
+    metrics = timer_wheel.metrics
+    assert metrics["pending"] == 5
+    assert metrics["pending_by_resolution"] == {1: 3, 60: 1, 3600: 1}
+    assert metrics["loop_callbacks"] == 3
+
+    async_fire_time_changed_exact(hass, now + timedelta(seconds=10, milliseconds=50))
+    await hass.async_block_till_done()
+    assert runs == []
+
+    # The slot is called for its first timer, the timers are called in order
+    async_fire_time_changed_exact(hass, now + timedelta(seconds=10, milliseconds=250))
+    await hass.async_block_till_done()
+    assert runs == [0.1, 0.2]
+    assert timer_wheel.metrics["fired"] == 2
+    assert timer_wheel.metrics["lateness_max"] == pytest.approx(0.15)
+
+    async_fire_time_changed_exact(hass, now + timedelta(seconds=10, milliseconds=400))
+    await hass.async_block_till_done()
+    assert runs == [0.1, 0.2, 0.3]
+    assert timer_wheel.metrics["fired"] == 3
+    assert timer_wheel.metrics["lateness_max"] == pytest.approx(0.15)
+
+    async_fire_time_changed_exact(
+        hass, minute_point.replace(second=0, microsecond=1000)
+    )
+    await hass.async_block_till_done()
+    assert runs == [0.1, 0.2, 0.3]
+    # The timer was moved from the minute slot to a second slot
+    assert timer_wheel.metrics["pending_by_resolution"] == {1: 1, 60: 0, 3600: 1}
+
+    async_fire_time_changed_exact(hass, now + timedelta(hours=3))
+    await hass.async_block_till_done()
+    assert runs == [0.1, 0.2, 0.3, "minute", "later"]
+    assert timer_wheel.metrics["pending"] == 0
+    assert timer_wheel.metrics["loop_callbacks"] == 0
+
+
+async def test_timer_wheel_call_later(hass: HomeAssistant) -> None:
+    """Test call later scheduled with the monotonic timer wheel."""
+    async_enable_timer_wheel(hass)
+    timer_wheel = hass.data[DATA_MONOTONIC_TIMER_WHEEL]
+    runs = []
+
+    # The wall clock is stepped back after scheduling
+    with patch(
+        "homeassistant.helpers.event.time.time", return_value=time.time() + 3600
+    ):
+        async_call_later(hass, 0.5, callback(lambda x: runs.append(0.5)))
+        async_call_later(hass, 0.2, callback(lambda x: runs.append(0.2)))
+        async_call_later(hass, 90, callback(lambda x: runs.append(90)))
+
+    metrics = timer_wheel.metrics
+    assert metrics["pending"] == 3
+    assert metrics["pending_by_resolution"] == {1: 2, 60: 1, 3600: 0}
+
+    async_fire_time_changed_exact(hass, dt_util.utcnow() + timedelta(seconds=0.3))
+    await hass.async_block_till_done()
+    assert runs == [0.2]
+
+    async_fire_time_changed_exact(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert runs == [0.2, 0.5]
+
+    # The minute slot moves the timer to a second slot which is called next
+    for _ in range(2):
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=100))
+        await hass.async_block_till_done()
+    assert runs == [0.2, 0.5, 90]
+    assert timer_wheel.metrics["pending"] == 0
+    assert timer_wheel.metrics["loop_callbacks"] == 0
+
+
+async def test_timer_wheel_time_interval(hass: HomeAssistant) -> None:
+    """Test time intervals scheduled with the timer wheel."""
+    async_enable_timer_wheel(hass)
+    timer_wheel = hass.data[DATA_MONOTONIC_TIMER_WHEEL]
+    runs = []
+
+    unsub = async_track_time_interval(
+        hass, callback(lambda x: runs.append(x)), timedelta(seconds=10)
+    )
+    async_track_time_interval(
+        hass,
+        callback(lambda x: runs.append(x)),
+        timedelta(seconds=10),
+        cancel_on_shutdown=True,
+    )
+    assert timer_wheel.metrics["pending"] == 2
+
+    # The slot is called for the first interval and rearmed for the second
+    for _ in range(2):
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+        await hass.async_block_till_done()
+    assert len(runs) == 2
+    assert timer_wheel.metrics["pending"] == 2
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    assert timer_wheel.metrics["pending"] == 1
+    unsub()
+    assert timer_wheel.metrics["loop_callbacks"] == 0
+
+
 async def test_track_point_in_time_drift_rearm(hass: HomeAssistant) -> None:
     """Test tasks with the time rolling backwards."""
     specific_runs = []
@@ -3119,6 +3250,44 @@ async def test_track_template_result_refresh_cancel(hass: HomeAssistant) -> None
     assert refresh_runs == ["duck"]
 
 
+async def test_async_track_template_result_skips_unchanged_reads(
+    hass: HomeAssistant,
+) -> None:
+    """Test templates are not rendered again if the values read did not change."""
+    template_brightness = Template("{{ state_attr('light.bowl', 'brightness') }}", hass)
+    refresh_runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        refresh_runs.append([update.result for update in updates])
+
+    hass.states.async_set("light.bowl", "on", {"brightness": 1})
+    info = async_track_template_result(
+        hass, [TrackTemplate(template_brightness, None)], refresh_listener
+    )
+    assert info.render_counts == {"executed": 1, "skipped": 0}
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 1})
+    hass.states.async_set("light.bowl", "off", {"brightness": 1, "effect": "x"})
+    await hass.async_block_till_done()
+    assert refresh_runs == []
+    assert info.render_counts == {"executed": 1, "skipped": 2}
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 2})
+    await hass.async_block_till_done()
+    assert refresh_runs == [[2]]
+    assert info.render_counts == {"executed": 2, "skipped": 2}
+
+    hass.states.async_remove("light.bowl")
+    await hass.async_block_till_done()
+    assert refresh_runs == [[2], [None]]
+    assert info.render_counts == {"executed": 3, "skipped": 2}
+    info.async_remove()
+
+
 async def test_async_track_template_result_multiple_templates(
     hass: HomeAssistant,
 ) -> None:
@@ -5605,6 +5605,37 @@ async def test_render_to_info_with_exception(hass: HomeAssistant) -> None:
     assert info.entities == {"test_domain.object"}
 
 
+async def test_render_to_info_state_reads(hass: HomeAssistant) -> None:
+    """Test the fields of the states read by the template are collected."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 1, "effect": "none"})
+    hass.states.async_set("light.ceiling", "on")
+    info = render_to_info(
+        hass,
+        "{{ states('light.bowl') }} {{ state_attr('light.bowl', 'brightness') }}"
+        " {{ states.light.ceiling.state_with_unit }}",
+    )
+    assert info.entity_reads == {
+        "light.bowl": {"state": "on", ("attributes", "brightness"): 1},
+        "light.ceiling": None,
+    }
+
+    bowl = hass.states.get("light.bowl")
+    assert not info.state_reads_changed("light.bowl", bowl)
+    hass.states.async_set("light.bowl", "on", {"brightness": 1, "effect": "rainbow"})
+    assert not info.state_reads_changed("light.bowl", hass.states.get("light.bowl"))
+    hass.states.async_set("light.bowl", "on", {"brightness": True, "effect": "none"})
+    assert info.state_reads_changed("light.bowl", hass.states.get("light.bowl"))
+    hass.states.async_set("light.bowl", "off", {"brightness": 1, "effect": "none"})
+    assert info.state_reads_changed("light.bowl", hass.states.get("light.bowl"))
+    assert info.state_reads_changed("light.bowl", None)
+    assert info.state_reads_changed("light.ceiling", hass.states.get("light.ceiling"))
+
+    info = render_to_info(hass, "{{ states('light.bowl') }} {{ now() }}")
+    assert info.state_reads_changed("light.bowl", hass.states.get("light.bowl"))
+    info = render_to_info(hass, "{{ states('light.bowl') }} {{ [1, 2] | random }}")
+    assert info.state_reads_changed("light.bowl", hass.states.get("light.bowl"))
+
+
 async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     """Test that the template internal LRU cache increases with many entities."""
     # We do not actually want to record 4096 entities so we mock the entity count
@@ -11,7 +11,7 @@ import pytest
 import requests
 
 from homeassistant import config_entries
-from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, EVENT_STATE_CHANGED_BATCH
 from homeassistant.core import CoreState, HomeAssistant, callback
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
@@ -21,7 +21,12 @@ from homeassistant.exceptions import (
 from homeassistant.helpers import frame, update_coordinator
 from homeassistant.util.dt import utcnow
 
-from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.common import (
+    MockConfigEntry,
+    MockEntityPlatform,
+    async_capture_events,
+    async_fire_time_changed,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -453,6 +458,70 @@ async def test_coordinator_entity(
     assert len(crd._listeners) == 0
 
 
+async def test_coordinator_entities_written_together(
+    hass: HomeAssistant,
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test coordinator entities have their states written together."""
+    batch_events = async_capture_events(hass, EVENT_STATE_CHANGED_BATCH)
+    updates = []
+    crd.async_add_listener(lambda: updates.append(crd.data))
+
+    for entity_id in ("test.one", "test.two"):
+        entity = update_coordinator.CoordinatorEntity(crd)
+        entity.hass = hass
+        entity.entity_id = entity_id
+        entity.platform = MockEntityPlatform(hass, domain="test")
+        crd.async_add_listener(entity._handle_coordinator_update)
+
+    crd.async_set_updated_data(100)
+    await hass.async_block_till_done()
+
+    assert updates == [100]
+    assert hass.states.get("test.one")
+    assert hass.states.get("test.two")
+    assert len(batch_events) == 1
+    assert len(batch_events[0].data["changes"]) == 2
+    crd._unschedule_refresh()
+
+
+async def test_coordinator_entity_overriding_async_write_ha_state(
+    hass: HomeAssistant,
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test an entity overriding async_write_ha_state is written on its own."""
+    batch_events = async_capture_events(hass, EVENT_STATE_CHANGED_BATCH)
+    writes = []
+
+    class OverridingEntity(update_coordinator.CoordinatorEntity):
+        @callback
+        def async_write_ha_state(self) -> None:
+            writes.append(self.coordinator.data)
+            super().async_write_ha_state()
+
+    for entity_id, entity_cls in (
+        ("test.one", update_coordinator.CoordinatorEntity),
+        ("test.two", OverridingEntity),
+    ):
+        entity = entity_cls(crd)
+        entity.hass = hass
+        entity.entity_id = entity_id
+        entity.platform = MockEntityPlatform(hass, domain="test")
+        crd.async_add_listener(entity._handle_coordinator_update)
+
+    crd.async_set_updated_data(100)
+    await hass.async_block_till_done()
+
+    assert writes == [100]
+    assert hass.states.get("test.one")
+    assert hass.states.get("test.two")
+    assert len(batch_events) == 1
+    assert [change["entity_id"] for change in batch_events[0].data["changes"]] == [
+        "test.one"
+    ]
+    crd._unschedule_refresh()
+
+
 async def test_async_set_updated_data(
     crd: update_coordinator.DataUpdateCoordinator[int],
 ) -> None:
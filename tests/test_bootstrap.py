@@ -62,6 +62,16 @@ def disable_block_async_io(disable_block_async_io):
     """Disable the loop protection from block_async_io after each test."""
 
 
+@pytest.fixture(autouse=True)
+def mock_startup_caches() -> Generator[None]:
+    """Do not write the manifest index or YAML cache to the testing config."""
+    with (
+        patch("homeassistant.loader._ManifestIndex.save"),
+        patch("homeassistant.util.yaml.loader.set_parse_cache"),
+    ):
+        yield
+
+
 @pytest.fixture(scope="module", autouse=True)
 def mock_http_start_stop() -> Generator[None]:
     """Mock HTTP start and stop."""
@@ -1524,3 +1534,71 @@ def test_should_rollover_is_always_false() -> None:
         ).shouldRollover(Mock())
         is False
     )
+
+
+async def test_import_plan_follows_critical_path(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test integrations are pre-imported along the critical path of the profile."""
+    hass_storage[bootstrap.STORAGE_BOOTSTRAP_PROFILE_KEY] = {
+        "version": bootstrap.STORAGE_BOOTSTRAP_PROFILE_VERSION,
+        "data": {
+            "import": {},
+            "setup": {"child": 5.0, "fast_leaf": 2.0, "slow_base": 1.0},
+        },
+    }
+    for module in (
+        MockModule("child", dependencies=["slow_base"]),
+        MockModule("fast_leaf"),
+        MockModule("slow_base"),
+    ):
+        mock_integration(hass, module)
+
+    imported: list[str] = []
+    original_get_component = Integration.async_get_component
+
+    async def _mock_get_component(self: Integration) -> Any:
+        imported.append(self.domain)
+        return await original_get_component(self)
+
+    with patch.object(Integration, "async_get_component", _mock_get_component):
+        plan = bootstrap._ImportPlan(hass)
+        await plan.async_load()
+        plan.async_start(
+            {"child", "fast_leaf", "slow_base"},
+            {
+                domain: hass.data[loader.DATA_INTEGRATIONS][domain]
+                for domain in ("child", "fast_leaf", "slow_base")
+            },
+        )
+        await hass.async_block_till_done(wait_background_tasks=True)
+        plan.async_stop()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    # slow_base gates child so it goes first, fast_leaf has the shortest path
+    assert imported == ["slow_base", "child", "fast_leaf"]
+    profile = hass_storage[bootstrap.STORAGE_BOOTSTRAP_PROFILE_KEY]["data"]
+    assert list(profile["import"]) == ["slow_base", "child", "fast_leaf"]
+    assert profile["setup"]["child"] == 5.0
+
+
+async def test_import_plan_without_profile(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test nothing is pre-imported until a profile was saved."""
+    mock_integration(hass, MockModule("comp"))
+    integration = hass.data[loader.DATA_INTEGRATIONS]["comp"]
+
+    with patch.object(Integration, "async_get_component") as mock_get_component:
+        plan = bootstrap._ImportPlan(hass)
+        await plan.async_load()
+        plan.async_start({"comp"}, {"comp": integration})
+        await hass.async_block_till_done(wait_background_tasks=True)
+        plan.async_stop()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert not mock_get_component.called
+    assert hass_storage[bootstrap.STORAGE_BOOTSTRAP_PROFILE_KEY]["data"] == {
+        "import": {},
+        "setup": {},
+    }
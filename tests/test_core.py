@@ -35,6 +35,7 @@ from homeassistant.const import (
     EVENT_SERVICE_REGISTERED,
     EVENT_SERVICE_REMOVED,
     EVENT_STATE_CHANGED,
+    EVENT_STATE_CHANGED_BATCH,
     EVENT_STATE_REPORTED,
     MATCH_ALL,
     __version__,
@@ -1169,6 +1170,81 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_filter_listener(hass: HomeAssistant) -> None:
+    """Test listeners with a keyed filter."""
+    entity_calls = []
+    domain_calls = []
+    filtered_calls = []
+    old_listeners = hass.bus.async_listeners()
+
+    @ha.callback
+    def entity_listener(event):
+        """Mock listener."""
+        entity_calls.append(event.data)
+
+    @ha.callback
+    def domain_listener(event):
+        """Mock listener."""
+        domain_calls.append(event.data)
+
+    @ha.callback
+    def filtered_listener(event):
+        """Mock listener."""
+        filtered_calls.append(event.data)
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        return not event_data.get("filtered")
+
+    unsub_entity = hass.bus.async_listen(
+        "test", entity_listener, keyed_filter=("entity_id", ["light.a", "light.b"])
+    )
+    unsub_domain = hass.bus.async_listen(
+        "test", domain_listener, keyed_filter=("domain", {"switch"})
+    )
+    unsub_filtered = hass.bus.async_listen(
+        "test",
+        filtered_listener,
+        event_filter=mock_filter,
+        keyed_filter=("entity_id", {"light.a"}),
+    )
+    assert hass.bus.async_listeners()["test"] == 3
+
+    hass.bus.async_fire("test", {"entity_id": "light.a"})
+    hass.bus.async_fire("test", {"entity_id": "light.a", "filtered": True})
+    hass.bus.async_fire("test", {"entity_id": "light.b"})
+    hass.bus.async_fire("test", {"entity_id": "light.c"})
+    hass.bus.async_fire("test", {"entity_id": "switch.a"})
+    hass.bus.async_fire("test", {"entity_id": ["light.a"]})
+    hass.bus.async_fire("test", {"domain": "switch"})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert entity_calls == [
+        {"entity_id": "light.a"},
+        {"entity_id": "light.a", "filtered": True},
+        {"entity_id": "light.b"},
+    ]
+    assert domain_calls == [{"entity_id": "switch.a"}, {"domain": "switch"}]
+    assert filtered_calls == [{"entity_id": "light.a"}]
+
+    unsub_entity()
+    unsub_domain()
+    assert hass.bus.async_listeners()["test"] == 1
+    unsub_filtered()
+    assert hass.bus.async_listeners() == old_listeners
+
+    hass.bus.async_fire("test", {"entity_id": "light.a"})
+    await hass.async_block_till_done()
+    assert len(entity_calls) == 3
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen(
+            MATCH_ALL, entity_listener, keyed_filter=("entity_id", {"light.a"})
+        )
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -3415,6 +3491,74 @@ async def test_statemachine_report_state(hass: HomeAssistant) -> None:
     assert len(state_reported_events) == 1
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting several states at once."""
+    hass.states.async_set("light.unchanged", "on")
+    state_changed_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    batch_events = async_capture_events(hass, EVENT_STATE_CHANGED_BATCH)
+
+    hass.states.async_set_many(
+        [
+            ha.StateUpdate("light.Bowl", "on"),
+            ha.StateUpdate("light.ceiling", "off", {"brightness": 1}),
+            ha.StateUpdate("light.unchanged", "on"),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    assert hass.states.get("light.bowl").state == "on"
+    assert hass.states.get("light.ceiling").attributes == {"brightness": 1}
+    assert len(state_changed_events) == 2
+    bowl_event, ceiling_event = state_changed_events
+    assert bowl_event.context.id != ceiling_event.context.id
+    assert bowl_event.time_fired == ceiling_event.time_fired
+    assert (
+        hass.states.get("light.bowl").last_updated
+        == hass.states.get("light.ceiling").last_updated
+    )
+
+    assert len(batch_events) == 1
+    assert batch_events[0].data["changes"] == [
+        bowl_event.data,
+        ceiling_event.data,
+    ]
+
+    context = ha.Context()
+    hass.states.async_set_many([ha.StateUpdate("light.bowl", "off", context=context)])
+    await hass.async_block_till_done()
+    assert state_changed_events[-1].context is context
+    assert len(batch_events) == 2
+
+    hass.states.async_set_many([ha.StateUpdate("light.bowl", "off")])
+    await hass.async_block_till_done()
+    assert len(state_changed_events) == 3
+    assert len(batch_events) == 2
+
+    context = ha.Context()
+    hass.states.async_set_many(
+        [ha.StateUpdate("light.bowl", "on"), ha.StateUpdate("light.ceiling", "on")],
+        context=context,
+    )
+    await hass.async_block_till_done()
+    assert state_changed_events[-2].context is context
+    assert state_changed_events[-1].context is context
+    assert batch_events[-1].context is context
+
+
+async def test_state_expire_drops_cached_json(hass: HomeAssistant) -> None:
+    """Test superseded states drop their cached JSON."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 1})
+    old_state = hass.states.get("light.bowl")
+    as_dict_json = old_state.as_dict_json
+    assert old_state.as_compressed_state_json
+    assert old_state.json_fragment
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 1})
+    for key in ("as_dict_json", "json_fragment", "as_compressed_state_json"):
+        assert key not in old_state._cache
+    assert old_state.as_dict_json == as_dict_json
+
+
 async def test_report_state_listener_restrictions(hass: HomeAssistant) -> None:
     """Test we enforce requirements for EVENT_STATE_REPORTED listeners."""
 
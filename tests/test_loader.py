@@ -5,6 +5,7 @@ import os
 import pathlib
 import sys
 import threading
+from types import ModuleType
 from typing import Any
 from unittest.mock import MagicMock, Mock, patch
 
@@ -14,6 +15,7 @@ import pytest
 from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import __version__
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import frame
 from homeassistant.helpers.json import json_dumps
@@ -2025,3 +2027,178 @@ async def test_manifest_json_fragment_round_trip(hass: HomeAssistant) -> None:
         json_loads(json_dumps(integration.manifest_json_fragment))
         == integration.manifest
     )
+
+
+async def test_manifest_index(hass: HomeAssistant, tmp_path: pathlib.Path) -> None:
+    """Test manifests are resolved through the on-disk manifest index."""
+    integration_dir = tmp_path / "components" / "indexed"
+    integration_dir.mkdir(parents=True)
+    (integration_dir / "__init__.py").touch()
+    manifest_path = integration_dir / "manifest.json"
+    manifest_path.write_text(json_dumps({"domain": "indexed", "name": "Indexed"}))
+    root_module = ModuleType(loader.PACKAGE_BUILTIN)
+    root_module.__path__ = [str(tmp_path / "components")]
+    index_path = tmp_path / ".storage" / "core.manifest_index"
+
+    def _resolve() -> loader.Integration:
+        integrations = loader._resolve_integrations_from_root(
+            hass, root_module, ["indexed"]
+        )
+        return integrations["indexed"]
+
+    index = hass.data[loader.DATA_MANIFEST_INDEX] = loader._ManifestIndex(
+        str(index_path)
+    )
+    integration = await hass.async_add_executor_job(_resolve)
+    assert integration.name == "Indexed"
+    assert integration._top_level_files == {"__init__.py", "manifest.json"}
+    await hass.async_add_executor_job(index.save)
+    assert index_path.is_file()
+
+    # A fresh index answers from disk without parsing the manifest
+    hass.data[loader.DATA_MANIFEST_INDEX] = loader._ManifestIndex(str(index_path))
+    with patch.object(
+        loader, "_read_manifest", side_effect=AssertionError
+    ) as mock_read_manifest:
+        integration = await hass.async_add_executor_job(_resolve)
+    assert integration.name == "Indexed"
+    assert integration._top_level_files == {"__init__.py", "manifest.json"}
+    assert not mock_read_manifest.called
+
+    # Changing the manifest invalidates its entry
+    manifest_path.write_text(json_dumps({"domain": "indexed", "name": "Renamed"}))
+    mtime_ns = manifest_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(manifest_path, ns=(mtime_ns, mtime_ns))
+    integration = await hass.async_add_executor_job(_resolve)
+    assert integration.name == "Renamed"
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"not json",
+        json_dumps([]),
+        json_dumps({"version": loader.MANIFEST_INDEX_VERSION}),
+        json_dumps(
+            {"version": loader.MANIFEST_INDEX_VERSION, "ha_version": __version__}
+        ),
+        json_dumps(
+            {
+                "version": loader.MANIFEST_INDEX_VERSION,
+                "ha_version": __version__,
+                "entries": [],
+            }
+        ),
+        json_dumps(
+            {
+                "version": loader.MANIFEST_INDEX_VERSION,
+                "ha_version": __version__,
+                "entries": {"manifest.json": [1, 2]},
+            }
+        ),
+        json_dumps(
+            {
+                "version": loader.MANIFEST_INDEX_VERSION,
+                "ha_version": __version__,
+                "entries": {"manifest.json": [1, 2, [], None, []]},
+            }
+        ),
+        # Entries of version 1 have no platforms
+        json_dumps(
+            {
+                "version": 1,
+                "ha_version": __version__,
+                "entries": {"manifest.json": [1, 2, {}, None]},
+            }
+        ),
+        json_dumps(
+            {
+                "version": loader.MANIFEST_INDEX_VERSION,
+                "ha_version": __version__,
+                "entries": {"manifest.json": [1, 2, {}, None]},
+            }
+        ),
+    ],
+)
+async def test_malformed_manifest_index(
+    hass: HomeAssistant, tmp_path: pathlib.Path, content: str | bytes
+) -> None:
+    """Test a malformed manifest index is treated as empty."""
+    integration_dir = tmp_path / "components" / "indexed"
+    integration_dir.mkdir(parents=True)
+    (integration_dir / "__init__.py").touch()
+    (integration_dir / "manifest.json").write_text(
+        json_dumps({"domain": "indexed", "name": "Indexed"})
+    )
+    root_module = ModuleType(loader.PACKAGE_BUILTIN)
+    root_module.__path__ = [str(tmp_path / "components")]
+    index_path = tmp_path / ".storage" / "core.manifest_index"
+    index_path.parent.mkdir()
+    if isinstance(content, str):
+        content = content.encode()
+    index_path.write_bytes(content)
+
+    def _resolve() -> loader.Integration:
+        integrations = loader._resolve_integrations_from_root(
+            hass, root_module, ["indexed"]
+        )
+        return integrations["indexed"]
+
+    index = hass.data[loader.DATA_MANIFEST_INDEX] = loader._ManifestIndex(
+        str(index_path)
+    )
+    for _ in range(2):
+        integration = await hass.async_add_executor_job(_resolve)
+        assert integration.name == "Indexed"
+
+    await hass.async_add_executor_job(index.save)
+    data = json_loads(index_path.read_bytes())
+    assert data["version"] == loader.MANIFEST_INDEX_VERSION
+    assert data["ha_version"] == __version__
+    assert list(data["entries"]) == [str(integration_dir / "manifest.json")]
+
+
+async def test_lazy_platforms_use_previous_run(
+    hass: HomeAssistant, tmp_path: pathlib.Path
+) -> None:
+    """Test lazy platform mode imports the platforms used in the previous run."""
+    integration_dir = tmp_path / "components" / "lazy"
+    integration_dir.mkdir(parents=True)
+    for file_name in ("__init__.py", "light.py", "sensor.py", "diagnostics.py"):
+        (integration_dir / file_name).touch()
+    (integration_dir / "manifest.json").write_text(
+        json_dumps({"domain": "lazy", "name": "Lazy"})
+    )
+    root_module = ModuleType(loader.PACKAGE_BUILTIN)
+    root_module.__path__ = [str(tmp_path / "components")]
+    index_path = tmp_path / ".storage" / "core.manifest_index"
+
+    def _resolve() -> loader.Integration:
+        integrations = loader._resolve_integrations_from_root(
+            hass, root_module, ["lazy"]
+        )
+        return integrations["lazy"]
+
+    loader.async_enable_lazy_platforms(hass)
+    index = hass.data[loader.DATA_MANIFEST_INDEX] = loader._ManifestIndex(
+        str(index_path)
+    )
+    integration = await hass.async_add_executor_job(_resolve)
+    # Nothing is known about the previous run, so nothing is preloaded
+    assert list(integration._preload_platform_names()) == []
+
+    with patch.object(
+        integration, "_import_platform", return_value=ModuleType("sensor")
+    ):
+        integration.get_platform("sensor")
+    await hass.async_add_executor_job(index.save)
+
+    hass.data[loader.DATA_MANIFEST_INDEX] = loader._ManifestIndex(str(index_path))
+    integration = await hass.async_add_executor_job(_resolve)
+    assert integration._preload_platform_names() == ["sensor"]
+
+    with patch(
+        "homeassistant.loader.importlib.import_module", return_value=ModuleType("lazy")
+    ):
+        integration.get_component()
+    assert "homeassistant.components.lazy" in loader.async_get_import_timings(hass)
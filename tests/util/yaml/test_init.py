@@ -3,6 +3,7 @@
 from collections.abc import Generator
 import importlib
 import io
+import json
 import os
 import pathlib
 from typing import Any
@@ -17,6 +18,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util import yaml
 from homeassistant.util.yaml import loader as yaml_loader
+from homeassistant.util.yaml.cache import ParseCache
 
 from tests.common import extract_stack_to_frame
 
@@ -627,3 +629,91 @@ def test_load_yaml_wrap_oserror(
         pytest.raises(load_yaml_exception),
     ):
         yaml_loader.load_yaml("bla")
+
+
+@pytest.fixture
+def parse_cache(tmp_path: pathlib.Path) -> Generator[ParseCache]:
+    """Enable the YAML parse cache."""
+    cache = ParseCache(tmp_path / "cache")
+    yaml_loader.set_parse_cache(cache)
+    yield cache
+    yaml_loader.set_parse_cache(None)
+
+
+@pytest.mark.usefixtures("try_both_loaders")
+def test_parse_cache(tmp_path: pathlib.Path, parse_cache: ParseCache) -> None:
+    """Test unchanged files are loaded from the parse cache."""
+    static_file = tmp_path / "static.yaml"
+    static_file.write_text("key:\n  - one\n  - 2\n  - null\nother: 1.5\n")
+    env_file = tmp_path / "env.yaml"
+    env_file.write_text("key: !env_var PARSE_CACHE_VALUE\n")
+
+    with patch.dict(os.environ, {"PARSE_CACHE_VALUE": "first"}):
+        assert yaml_loader.load_yaml(env_file) == {"key": "first"}
+    loaded = yaml_loader.load_yaml(static_file)
+    parse_cache.save()
+
+    # A new cache serves the static file from disk
+    yaml_loader.set_parse_cache(ParseCache(parse_cache.path))
+    with (
+        patch.object(
+            yaml_loader.FastSafeLoader, "get_single_data", side_effect=AssertionError
+        ),
+        patch.object(
+            yaml_loader.PythonSafeLoader, "get_single_data", side_effect=AssertionError
+        ),
+    ):
+        cached = yaml_loader.load_yaml(static_file)
+    assert cached == loaded == {"key": ["one", 2, None], "other": 1.5}
+    assert cached["key"].__line__ == loaded["key"].__line__ == 2
+    assert cached["key"][0].__config_file__ == loaded["key"][0].__config_file__
+
+    # Files using tags are parsed every time
+    with patch.dict(os.environ, {"PARSE_CACHE_VALUE": "second"}):
+        assert yaml_loader.load_yaml(env_file) == {"key": "second"}
+
+    # Changed files are parsed again
+    static_file.write_text("key: changed\n")
+    assert yaml_loader.load_yaml(static_file) == {"key": "changed"}
+
+
+_STATIC_CONTENT = "key: value\n"
+_STATIC_KEY = ParseCache.key(_STATIC_CONTENT)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"version": 1},
+        {"version": 1, "entries": []},
+        {"version": 1, "entries": {_STATIC_KEY: [0, 1]}},
+        {"version": 1, "entries": {_STATIC_KEY: [3, 1, []]}},
+        {"version": 1, "entries": {_STATIC_KEY: [2, 1, [[0, 1, "key"]]]}},
+        {"version": 1, "entries": {_STATIC_KEY: [2, 1, [[1, 1, []], "value"]]}},
+        {"version": 1, "entries": {_STATIC_KEY: [2, "1", []]}},
+        {"version": 1, "entries": {_STATIC_KEY: {"key": "value"}}},
+    ],
+)
+@pytest.mark.usefixtures("try_both_loaders")
+def test_parse_cache_malformed(
+    tmp_path: pathlib.Path, parse_cache: ParseCache, data: dict[str, Any]
+) -> None:
+    """Test a malformed parse cache is treated as empty."""
+    static_file = tmp_path / "static.yaml"
+    static_file.write_text(_STATIC_CONTENT)
+    parse_cache.path.write_text(json.dumps(data))
+
+    assert yaml_loader.load_yaml(static_file) == {"key": "value"}
+    parse_cache.save()
+
+    # The malformed entry was replaced
+    yaml_loader.set_parse_cache(ParseCache(parse_cache.path))
+    with (
+        patch.object(
+            yaml_loader.FastSafeLoader, "get_single_data", side_effect=AssertionError
+        ),
+        patch.object(
+            yaml_loader.PythonSafeLoader, "get_single_data", side_effect=AssertionError
+        ),
+    ):
+        assert yaml_loader.load_yaml(static_file) == {"key": "value"}